@@ -0,0 +1,101 @@
+"""Cell-width benchmark for wrapping and column-gradient positioning.
+
+Compares measuring every character with ``rich.cells.cell_len`` (Rich's
+``divide_line`` plus a per-character column walk) against the prefix sums
+of ``rich_gradient_cli.cells.CellLine`` on ASCII, CJK and emoji-heavy lines.
+
+    python benchmarks/bench_cells.py --lines 20000 --width 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+from rich._wrap import divide_line
+from rich.cells import cell_len
+from rich.console import Console
+from rich.table import Table
+
+from rich_gradient_cli.blocks import _column_colors, wrap_cells
+from rich_gradient_cli.cells import CellLine
+from rich_gradient_cli.lut import column_lut, stops_from
+
+WORDS: Dict[str, List[str]] = {
+    "ascii": ["gradient", "panel", "rule", "the", "quick", "brown", "fox", "status"],
+    "cjk": ["漢字", "テキスト", "グラデーション", "パネル", "表示", "端末"],
+    "emoji": ["🌈", "✨", "🚀", "❤️", "👩‍👩‍👧", "ok", "done", "rich-gradient"],
+}
+
+
+def _corpus(kind: str, lines: int) -> List[str]:
+    rng = random.Random(0)
+    if kind == "mixed":
+        words = [word for group in WORDS.values() for word in group]
+    else:
+        words = WORDS[kind]
+    return [" ".join(rng.choice(words) for _ in range(20)) for _ in range(lines)]
+
+
+def _per_character(lines: List[str], width: int, lut: tuple) -> None:
+    """Wrap with Rich and color by measuring each character again."""
+    last = len(lut) - 1
+    for line in lines:
+        starts = [0, *divide_line(line, width)]
+        for start, end in zip(starts, [*starts[1:], len(line)]):
+            row = line[start:end]
+            if cell_len(row) > width:
+                row = row.rstrip()
+            column = 0
+            colors = []
+            for character in row:
+                size = cell_len(character)
+                colors.append(lut[min(2 * column + max(size, 1), last)])
+                column += size
+
+
+def _prefix_sums(lines: List[str], width: int, lut: tuple) -> None:
+    """Wrap and color with one prefix-sum array per line."""
+    for line in lines:
+        measured = CellLine(line)
+        for start, row, _cells in wrap_cells(measured, width):
+            offsets = measured.offsets
+            if offsets is not None:
+                first = offsets[start]
+                offsets = [
+                    offset - first for offset in offsets[start : start + len(row) + 1]
+                ]
+            _column_colors(lut, 0, offsets, len(row))
+
+
+def _time(func: Callable[[List[str], int, tuple], None], *args: object) -> float:
+    start = time.perf_counter()
+    func(*args)  # type: ignore[arg-type]
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=20_000)
+    parser.add_argument("--width", type=int, default=60)
+    args = parser.parse_args()
+
+    lut = column_lut(stops_from(["#ff0000", "#00ff00", "#0000ff"], 3, False), 120)
+    table = Table(title=f"{args.lines:,} lines of 20 words, width {args.width}")
+    table.add_column("content")
+    table.add_column("per-character s", justify="right")
+    table.add_column("prefix sums s", justify="right")
+    table.add_column("speedup", justify="right")
+    for kind in ("ascii", "cjk", "emoji", "mixed"):
+        lines = _corpus(kind, args.lines)
+        before = _time(_per_character, lines, args.width, lut)
+        after = _time(_prefix_sums, lines, args.width, lut)
+        table.add_row(kind, f"{before:.3f}", f"{after:.3f}", f"{before / after:.2f}x")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Benchmark for ``gradient exec`` on chatty commands.
+
+The throughput table runs a build-like script printing ``--lines`` lines to
+stdout (and every tenth line to stderr) directly, then through ``gradient
+exec`` with ``NO_COLOR=1`` (pseudo-terminal passthrough) and with
+``FORCE_COLOR=1`` (every line painted), all redirected to a file. CPU time is
+user + system time of the whole process tree, so the overhead columns are
+what the runner adds on top of the command itself. The latency table sends a
+timestamped line every 10 ms and measures how long each takes to come out of
+the runner.
+
+    python benchmarks/bench_exec.py --lines 200000 --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+GRADIENT = [sys.executable, "-m", "rich_gradient_cli", "exec", "--"]
+CHATTY = (
+    "import sys\n"
+    "n = int(sys.argv[1])\n"
+    "for i in range(n):\n"
+    "    print(f'[{i}/{n}] Compiling src/module_{i % 97}.c -> build/module_{i % 97}.o')\n"
+    "    if i % 10 == 0:\n"
+    "        print(f'warning: unused variable tmp_{i} [-Wunused-variable]', file=sys.stderr)\n"
+)
+TICKER = (
+    "import sys, time\n"
+    "for _ in range(int(sys.argv[1])):\n"
+    "    print(repr(time.monotonic()), flush=True)\n"
+    "    time.sleep(0.01)\n"
+)
+_ESCAPE = re.compile(rb"\x1b\[[0-9;]*m")
+
+
+def _run(
+    command: Sequence[str], runs: int, env: Optional[Dict[str, str]] = None
+) -> Tuple[float, float]:
+    """Return median wall and CPU seconds of ``runs`` runs of ``command``."""
+    walls, cpus = [], []
+    with tempfile.TemporaryFile() as sink:
+        for _ in range(runs):
+            before = resource.getrusage(resource.RUSAGE_CHILDREN)
+            start = time.perf_counter()
+            subprocess.run(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=sink,
+                stderr=sink,
+                env={**os.environ, **(env or {})},
+                check=True,
+            )
+            walls.append(time.perf_counter() - start)
+            after = resource.getrusage(resource.RUSAGE_CHILDREN)
+            cpus.append(
+                after.ru_utime - before.ru_utime + after.ru_stime - before.ru_stime
+            )
+    return statistics.median(walls), statistics.median(cpus)
+
+
+def _latencies(ticks: int, env: Dict[str, str]) -> List[float]:
+    process = subprocess.Popen(
+        [*GRADIENT, sys.executable, "-c", TICKER, str(ticks)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        env={**os.environ, **env},
+    )
+    assert process.stdout is not None
+    samples = []
+    for line in process.stdout:
+        arrived = time.monotonic()
+        samples.append(arrived - float(_ESCAPE.sub(b"", line)))
+    process.wait()
+    return samples
+
+
+def main() -> None:
+    """Run the benchmark and print its tables."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+
+    os.environ.setdefault("GRADIENT_CACHE_DIR", tempfile.mkdtemp())
+    child = [sys.executable, "-c", CHATTY, str(args.lines)]
+    direct_wall, direct_cpu = _run(child, args.runs)
+    modes = {
+        "direct": (direct_wall, direct_cpu),
+        "exec, NO_COLOR=1": _run([*GRADIENT, *child], args.runs, {"NO_COLOR": "1"}),
+        "exec, FORCE_COLOR=1": _run(
+            [*GRADIENT, *child], args.runs, {"FORCE_COLOR": "1"}
+        ),
+    }
+    lines = args.lines * 1.1
+    output = Console()
+    table = Table(title=f"{args.lines:,} stdout lines, median of {args.runs} runs")
+    table.add_column("mode")
+    table.add_column("wall s", justify="right")
+    table.add_column("CPU s", justify="right")
+    table.add_column("CPU overhead s", justify="right")
+    table.add_column("overhead µs/line", justify="right")
+    for mode, (wall, cpu) in modes.items():
+        overhead = cpu - direct_cpu
+        table.add_row(
+            mode,
+            f"{wall:.2f}",
+            f"{cpu:.2f}",
+            f"{overhead:.2f}",
+            f"{overhead / lines * 1e6:.2f}",
+        )
+    output.print(table)
+
+    table = Table(title=f"line latency, {args.ticks} lines 10 ms apart")
+    table.add_column("mode")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p99 ms", justify="right")
+    table.add_column("max ms", justify="right")
+    for mode, env in (
+        ("NO_COLOR=1", {"NO_COLOR": "1"}),
+        ("FORCE_COLOR=1", {"FORCE_COLOR": "1"}),
+    ):
+        samples = sorted(_latencies(args.ticks, env))
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        table.add_row(
+            mode,
+            f"{statistics.median(samples) * 1000:.2f}",
+            f"{p99 * 1000:.2f}",
+            f"{samples[-1] * 1000:.2f}",
+        )
+    output.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Scaling benchmark for ``gradient print --jobs``.
+
+Renders a synthetic document through the parallel line-block path at
+increasing worker counts and reports the speedup over a single worker.
+
+    python benchmarks/bench_jobs.py --lines 200000 --width 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import List
+
+from rich.console import Console
+from rich.table import Table
+
+from rich_gradient_cli.blocks import (
+    free_threaded,
+    make_executor,
+    render_text_block,
+    run_blocks,
+    split_blocks,
+)
+from rich_gradient_cli.lut import stops_from
+
+SAMPLE = "The quick brown fox jumps over the lazy dog, again and again and again"
+
+
+def _render(content: str, jobs: int, kind: str, width: int) -> float:
+    """Render ``content`` with ``jobs`` workers and return the wall time."""
+    stops = stops_from(["#ff0000", "#00ff00", "#0000ff"], 3, False)
+    start = time.perf_counter()
+    with make_executor(jobs, kind) as pool:  # type: ignore[arg-type]
+        for _chunk in run_blocks(
+            pool,
+            render_text_block,
+            split_blocks(content),
+            stops,
+            None,
+            width,
+            "left",
+            "fold",
+            False,
+            "",
+            "truecolor",
+        ):
+            pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print a speedup table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument(
+        "--executor", default="auto", choices=["auto", "thread", "process"]
+    )
+    args = parser.parse_args()
+
+    content = "\n".join(f"{index:>8} {SAMPLE}" for index in range(args.lines))
+    cores = os.cpu_count() or 1
+    counts: List[int] = sorted(
+        {1, *(n for n in (2, 4, 8, 16, 32, 64) if n <= cores), cores}
+    )
+
+    build = "free-threaded" if free_threaded() else "GIL"
+    table = Table(
+        title=f"{args.lines:,} lines, width {args.width}, "
+        f"{build} build, executor={args.executor}"
+    )
+    table.add_column("jobs", justify="right")
+    table.add_column("seconds", justify="right")
+    table.add_column("lines/s", justify="right")
+    table.add_column("speedup", justify="right")
+
+    baseline = 0.0
+    for jobs in counts:
+        elapsed = _render(content, jobs, args.executor, args.width)
+        baseline = baseline or elapsed
+        table.add_row(
+            str(jobs),
+            f"{elapsed:.3f}",
+            f"{args.lines / elapsed:,.0f}",
+            f"{baseline / elapsed:.2f}x",
+        )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
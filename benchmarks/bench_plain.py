@@ -0,0 +1,160 @@
+"""Benchmark for redirected (uncolored) output.
+
+The first table renders each command's content to an uncolored console in
+process: the ``rich_gradient`` renderable the commands used to build, the
+``PlainLayout`` they build now, and the bare Rich renderable. The second
+runs each command as a fresh interpreter with stdout redirected to a file,
+next to the same invocation under ``FORCE_COLOR=1`` (which still builds the
+gradient) and a script printing the content with plain Rich.
+
+    python benchmarks/bench_plain.py --renders 200 --runs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from rich.align import Align
+from rich.console import Console, RenderableType
+from rich.markdown import Markdown as RichMarkdown
+from rich.panel import Panel as RichPanel
+from rich.rule import Rule as RichRule
+from rich.table import Table
+from rich.text import Text as RichText
+
+from rich_gradient_cli.plain import RULE_CHARACTERS, PlainLayout
+
+BODY = "The quick brown fox jumps over the lazy dog. " * 12
+MARKDOWN = "# Report\n\n" + "\n".join(f"- item {n}: {BODY[:60]}" for n in range(20))
+
+GRADIENT = [sys.executable, "-m", "rich_gradient_cli"]
+CASES = {
+    "print": (["print", BODY], f"from rich import print; print({BODY!r})"),
+    "panel": (
+        ["panel", "-t", "Title", BODY],
+        (
+            "from rich.console import Console; from rich.panel import Panel; "
+            f"Console().print(Panel({BODY!r}, title='Title'))"
+        ),
+    ),
+    "rule": (
+        ["rule", "-t", "Section"],
+        (
+            "from rich.console import Console; from rich.rule import Rule; "
+            "Console().print(Rule('Section'))"
+        ),
+    ),
+    "markdown": (
+        ["markdown", MARKDOWN],
+        (
+            "from rich.console import Console; from rich.markdown import Markdown; "
+            f"Console().print(Markdown({MARKDOWN!r}))"
+        ),
+    ),
+}
+
+
+def _renderables() -> Dict[str, Sequence[Callable[[], RenderableType]]]:
+    from rich_gradient.markdown import Markdown
+    from rich_gradient.panel import Panel
+    from rich_gradient.rule import Rule
+    from rich_gradient.text import Text
+
+    colors = ["#ff5500", "#00ccff"]
+    return {
+        "print": (
+            lambda: Text(BODY, colors=colors),
+            lambda: RichText.from_markup(BODY),
+            lambda: RichText(BODY),
+        ),
+        "panel": (
+            lambda: Panel(Align(BODY), colors=colors, title="Title"),
+            lambda: PlainLayout(RichPanel(Align(BODY), title=RichText("Title"))),
+            lambda: RichPanel(BODY, title="Title"),
+        ),
+        "rule": (
+            lambda: Rule("Section", colors=colors, thickness=2),
+            lambda: PlainLayout(
+                RichRule("Section", characters=RULE_CHARACTERS[2]), justify=None
+            ),
+            lambda: RichRule("Section"),
+        ),
+        "markdown": (
+            lambda: Markdown(MARKDOWN, colors=colors),
+            lambda: PlainLayout(RichMarkdown(MARKDOWN), vertical="top"),
+            lambda: RichMarkdown(MARKDOWN),
+        ),
+    }
+
+
+def _render_ms(build: Callable[[], RenderableType], renders: int) -> str:
+    console = Console(file=io.StringIO(), width=80, color_system=None)
+    start = time.perf_counter()
+    for _ in range(renders):
+        console.print(build())
+    return f"{(time.perf_counter() - start) / renders * 1000:.2f}"
+
+
+def _time(
+    command: Sequence[str], runs: int, env: Optional[Dict[str, str]] = None
+) -> List[float]:
+    samples = []
+    with tempfile.TemporaryFile() as sink:
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=sink,
+                env={**os.environ, **(env or {})},
+                check=True,
+            )
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _p50(samples: List[float]) -> str:
+    return f"{statistics.median(samples) * 1000:.0f}"
+
+
+def main() -> None:
+    """Run the benchmark and print p50 wall times in milliseconds."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--renders", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    output = Console()
+    table = Table(title=f"uncolored render, ms per render ({args.renders} renders)")
+    table.add_column("command")
+    table.add_column("gradient (before)", justify="right")
+    table.add_column("plain path", justify="right")
+    table.add_column("plain Rich", justify="right")
+    for name, builders in _renderables().items():
+        table.add_row(name, *(_render_ms(build, args.renders) for build in builders))
+    output.print(table)
+
+    os.environ.setdefault("GRADIENT_CACHE_DIR", tempfile.mkdtemp())
+    table = Table(title=f"redirected output, p50 ms over {args.runs} runs")
+    table.add_column("command")
+    table.add_column("plain path", justify="right")
+    table.add_column("FORCE_COLOR=1", justify="right")
+    table.add_column("plain Rich", justify="right")
+    for name, (argv, rich_source) in CASES.items():
+        plain = _time([*GRADIENT, *argv], args.runs)
+        colored = _time([*GRADIENT, *argv], args.runs, {"FORCE_COLOR": "1"})
+        baseline = _time([sys.executable, "-c", rich_source], args.runs)
+        table.add_row(name, _p50(plain), _p50(colored), _p50(baseline))
+    output.print(table)
+
+
+if __name__ == "__main__":
+    main()
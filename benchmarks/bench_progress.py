@@ -0,0 +1,82 @@
+"""Overhead benchmark for ``gradient progress``.
+
+Pipes ``head -c SIZE /dev/zero`` through ``copy_stream`` into ``/dev/null``
+with no progress reporting and with a live ``ProgressBar`` (drawn to
+``/dev/null``), and reports throughput and the bar's overhead.
+
+    python benchmarks/bench_progress.py --size 4G --runs 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import time
+from typing import Callable, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from rich_gradient_cli.lut import stops_from
+from rich_gradient_cli.progress import ProgressBar, copy_stream, format_size, parse_size
+
+
+def _run(size: int, progress: Callable[[int], None]) -> float:
+    """Copy ``size`` zero bytes from a child process and return the wall time."""
+    producer = subprocess.Popen(
+        ["head", "-c", str(size), "/dev/zero"], stdout=subprocess.PIPE
+    )
+    assert producer.stdout is not None
+    sink = os.open(os.devnull, os.O_WRONLY)
+    start = time.perf_counter()
+    try:
+        copy_stream(producer.stdout.fileno(), sink, progress)
+    finally:
+        elapsed = time.perf_counter() - start
+        os.close(sink)
+        producer.wait()
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", default="2G")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    size = parse_size(args.size)
+    stops = stops_from(["#ff0000", "#00ff00", "#0000ff"], 3, False)
+    null = os.open(os.devnull, os.O_WRONLY)
+
+    def fresh_bar() -> Optional[ProgressBar]:
+        return ProgressBar(stops, size, "truecolor", fd=null, rate=60.0)
+
+    def noop(_count: int) -> None:
+        return None
+
+    best = {"plain": float("inf"), "bar": float("inf")}
+    for _ in range(args.runs):
+        best["plain"] = min(best["plain"], _run(size, noop))
+        bar = fresh_bar()
+        assert bar is not None
+        best["bar"] = min(best["bar"], _run(size, bar.update))
+
+    table = Table(title=f"{format_size(size)} through copy_stream, best of {args.runs}")
+    table.add_column("mode")
+    table.add_column("seconds", justify="right")
+    table.add_column("throughput", justify="right")
+    table.add_column("overhead", justify="right")
+    for mode, elapsed in best.items():
+        overhead = elapsed / best["plain"] - 1
+        table.add_row(
+            mode,
+            f"{elapsed:.3f}",
+            f"{format_size(size / elapsed)}/s",
+            f"{overhead:+.1%}",
+        )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Startup benchmark for the ``entrypoint`` fast paths.
+
+Runs each invocation as a fresh interpreter and reports p50/p99 wall time,
+next to the same invocation through the fully built Typer app and a bare
+``python -c pass`` baseline.
+
+    python benchmarks/bench_startup.py --runs 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Optional, Sequence
+
+from rich.console import Console
+from rich.table import Table
+
+FAST = [sys.executable, "-m", "rich_gradient_cli"]
+FULL = [
+    sys.executable,
+    "-c",
+    (
+        "import sys; from rich_gradient_cli.application import app; "
+        "app(prog_name='python -m rich_gradient_cli')"
+    ),
+]
+CASES = [
+    ("--version", ["--version"], None),
+    ("-h (cached)", ["-h"], None),
+    ("piped print", [], b"hello from stdin\n"),
+]
+
+
+def _time(command: Sequence[str], stdin: Optional[bytes], runs: int) -> List[float]:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            command,
+            input=stdin if stdin is not None else b"",
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _percentiles(samples: List[float]) -> str:
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return f"{cuts[49] * 1000:.0f} / {cuts[98] * 1000:.0f}"
+
+
+def main() -> None:
+    """Run the benchmark and print a p50/p99 table in milliseconds."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+
+    os.environ.setdefault("GRADIENT_CACHE_DIR", tempfile.mkdtemp())
+    subprocess.run([*FAST, "-h"], stdout=subprocess.DEVNULL, check=True)  # warm
+
+    table = Table(title=f"startup, {args.runs} runs each (p50 / p99 ms)")
+    table.add_column("invocation")
+    table.add_column("fast path", justify="right")
+    table.add_column("full app", justify="right")
+    baseline = _time([sys.executable, "-c", "pass"], None, args.runs)
+    table.add_row("python -c pass", _percentiles(baseline), "")
+    for label, argv, stdin in CASES:
+        fast = _time([*FAST, *argv], stdin, args.runs)
+        full = _time([*FULL, *argv], stdin, args.runs)
+        table.add_row(label, _percentiles(fast), _percentiles(full))
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
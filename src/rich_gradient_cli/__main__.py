@@ -1,6 +1,6 @@
 """Executable entry point for python -m rich_gradient_cli."""
 
-from . import app
+from . import entrypoint
 
 if __name__ == "__main__":
-    app()
+    entrypoint()
@@ -0,0 +1,144 @@
+"""Typer application wiring every command into the ``gradient`` CLI."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any, Sequence
+
+import click  # ty:ignore[unresolved-import]
+
+import typer  # ty:ignore[unresolved-import]
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from rich_gradient_cli.bench_command import bench_command
+    from rich_gradient_cli.common import VERSION
+    from rich_gradient_cli.exec_command import exec_command
+    from rich_gradient_cli.grid_command import grid_command
+    from rich_gradient_cli.help import RichTyperCommand, RichTyperGroup
+    from rich_gradient_cli.logs_command import logs_command
+    from rich_gradient_cli.markdown_command import markdown_command
+    from rich_gradient_cli.palette_command import palette_command
+    from rich_gradient_cli.panel_command import panel_command
+    from rich_gradient_cli.progress_command import progress_command
+    from rich_gradient_cli.rule_command import rule_command
+    from rich_gradient_cli.tail_command import tail_command
+    from rich_gradient_cli.template_command import template_app
+    from rich_gradient_cli.text_command import print_command
+    from rich_gradient_cli.theme_command import theme_app
+else:
+    from .bench_command import bench_command
+    from .common import VERSION
+    from .exec_command import exec_command
+    from .grid_command import grid_command
+    from .help import RichTyperCommand, RichTyperGroup
+    from .logs_command import logs_command
+    from .markdown_command import markdown_command
+    from .palette_command import palette_command
+    from .panel_command import panel_command
+    from .progress_command import progress_command
+    from .rule_command import rule_command
+    from .tail_command import tail_command
+    from .template_command import template_app
+    from .text_command import print_command
+    from .theme_command import theme_app
+
+
+class DefaultTyperGroup(RichTyperGroup):
+    """Route unknown commands/options to the default command."""
+
+    def __init__(
+        self,
+        name: str | None = None,
+        commands: dict[str, click.Command] | Sequence[click.Command] | None = None,
+        invoke_without_command: bool = False,
+        no_args_is_help: bool | None = None,
+        subcommand_metavar: str | None = None,
+        chain: bool = False,
+        result_callback: Any | None = None,
+        *,
+        default_cmd_name: str = "print",
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the group with a default command name fallback."""
+        super().__init__(
+            name=name,
+            commands=commands,
+            invoke_without_command=invoke_without_command,
+            no_args_is_help=no_args_is_help,
+            subcommand_metavar=subcommand_metavar,
+            chain=chain,
+            result_callback=result_callback,
+            **kwargs,
+        )
+        self.default_cmd_name: str = default_cmd_name
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        """Resolve the command, routing unknown input to the default command."""
+        if args:
+            cmd = self.get_command(ctx, args[0])
+            if cmd is None or args[0].startswith("-"):
+                args.insert(0, self.default_cmd_name)
+        return super().resolve_command(ctx, args)
+
+
+app = typer.Typer(
+    cls=DefaultTyperGroup,
+    invoke_without_command=True,
+    add_completion=False,
+    help="Create gradient-rich text, panels, and markdown.",
+    rich_markup_mode="rich",
+    context_settings={"help_option_names": ["-h", "--help"], "color": True},
+)
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    version: bool = typer.Option(
+        False,
+        "--version",
+        help="Show the version and exit.",
+        is_eager=True,
+    ),
+) -> None:
+    """CLI entry callback for version handling and default routing."""
+    if version:
+        typer.echo(f"gradient version {VERSION}")
+        raise typer.Exit()
+    if ctx.invoked_subcommand is None:
+        if ctx.args or not sys.stdin.isatty():
+            # Parse through Click so every option gets its real default (and
+            # envvar) instead of the ``typer.Option`` placeholder.
+            command = ctx.command.get_command(ctx, "print")  # type: ignore[attr-defined]
+            with command.make_context("print", list(ctx.args), parent=ctx) as sub:
+                command.invoke(sub)
+            raise typer.Exit()
+        typer.echo(ctx.get_help())
+
+
+app.command("print", cls=RichTyperCommand)(print_command)
+app.command("panel", cls=RichTyperCommand)(panel_command)
+app.command("rule", cls=RichTyperCommand)(rule_command)
+app.command("markdown", cls=RichTyperCommand)(markdown_command)
+app.command("logs", cls=RichTyperCommand)(logs_command)
+app.command("grid", cls=RichTyperCommand)(grid_command)
+app.command("progress", cls=RichTyperCommand)(progress_command)
+app.command("palettes", cls=RichTyperCommand)(palette_command)
+app.command(
+    "exec",
+    cls=RichTyperCommand,
+    context_settings={"allow_interspersed_args": False, "ignore_unknown_options": True},
+)(exec_command)
+app.command("tail", cls=RichTyperCommand)(tail_command)
+app.command("bench", cls=RichTyperCommand)(bench_command)
+app.add_typer(template_app, name="template")
+app.add_typer(theme_app, name="theme")
+
+
+cli = app
+
+__all__ = ["DefaultTyperGroup", "app", "cli"]
@@ -0,0 +1,208 @@
+"""Overhead of the gradient renderables over their plain Rich equivalents.
+
+Each case renders the same content twice per round: with the plain Rich
+class (``Text``, ``Panel``, ``Rule``, ``Markdown``) and with the
+``rich_gradient`` class the matching command builds. Both go to an
+in-memory truecolor console of a fixed width, so the difference is render
+cost alone. A cell is one column of one output line.
+
+Timings are medians over the rounds, construction included. CPython has no
+allocation counter, so memory is the peak ``tracemalloc`` traced during one
+render, per cell. Output size is the encoded bytes written per cell.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Sequence, Tuple, Union
+
+from rich.align import Align
+from rich.color import Color
+from rich.color_triplet import ColorTriplet
+from rich.console import Console, RenderableType
+from rich.markdown import Markdown as RichMarkdown
+from rich.panel import Panel as RichPanel
+from rich.rule import Rule as RichRule
+from rich.text import Text as RichText
+
+from .common import VERSION
+
+BODY = "The quick brown fox jumps over the lazy dog. " * 12
+MARKDOWN = "# Report\n\n" + "\n".join(
+    f"- item {number}: **{BODY[:40]}** `{number}`" for number in range(20)
+)
+CASES = ("text", "panel", "rule", "markdown")
+
+Builder = Callable[[], RenderableType]
+GradientColor = Union[str, Color, ColorTriplet]
+
+
+class Measurement(NamedTuple):
+    """One renderable's cost: median time, peak traced memory and output size."""
+
+    seconds: float
+    cells: int
+    peak_bytes: int
+    output_bytes: int
+
+    @property
+    def alloc_per_cell(self) -> float:
+        return self.peak_bytes / self.cells if self.cells else 0.0
+
+    @property
+    def bytes_per_cell(self) -> float:
+        return self.output_bytes / self.cells if self.cells else 0.0
+
+
+class BenchResult(NamedTuple):
+    """The plain and gradient measurements for one case."""
+
+    case: str
+    plain: Measurement
+    gradient: Measurement
+
+    @property
+    def overhead(self) -> float:
+        """Return gradient time over plain Rich time."""
+        return self.gradient.seconds / self.plain.seconds if self.plain.seconds else 0.0
+
+    def as_dict(self) -> Dict[str, object]:
+        def layer(measurement: Measurement) -> Dict[str, object]:
+            return {
+                "ms": round(measurement.seconds * 1000, 4),
+                "cells": measurement.cells,
+                "alloc_bytes_per_cell": round(measurement.alloc_per_cell, 2),
+                "bytes_per_cell": round(measurement.bytes_per_cell, 2),
+            }
+
+        return {
+            "case": self.case,
+            "overhead": round(self.overhead, 3),
+            "plain": layer(self.plain),
+            "gradient": layer(self.gradient),
+        }
+
+
+def builders(colors: Sequence[GradientColor]) -> Dict[str, Tuple[Builder, Builder]]:
+    """Return the ``(plain Rich, gradient)`` builders for every case."""
+    from rich_gradient.markdown import Markdown
+    from rich_gradient.panel import Panel
+    from rich_gradient.rule import Rule
+    from rich_gradient.text import Text
+
+    fg: List[GradientColor] = list(colors)
+    return {
+        "text": (lambda: RichText(BODY), lambda: Text(BODY, colors=fg)),
+        "panel": (
+            lambda: RichPanel(Align(BODY), title="Title"),
+            lambda: Panel(Align(BODY), colors=fg, title="Title"),
+        ),
+        "rule": (
+            lambda: RichRule("Section"),
+            lambda: Rule("Section", colors=fg, thickness=2),
+        ),
+        "markdown": (
+            lambda: RichMarkdown(MARKDOWN),
+            lambda: Markdown(MARKDOWN, colors=fg),
+        ),
+    }
+
+
+def _console(width: int) -> Tuple[Console, io.StringIO]:
+    buffer = io.StringIO()
+    console = Console(
+        file=buffer,
+        width=width,
+        color_system="truecolor",
+        force_terminal=True,
+        legacy_windows=False,
+    )
+    return console, buffer
+
+
+def measure(build: Builder, width: int, rounds: int) -> Measurement:
+    """Render ``build()`` ``rounds`` times and return its median cost."""
+    console, buffer = _console(width)
+    console.print(build())  # warm caches and imports
+    output = buffer.getvalue()
+    cells = width * output.count("\n")
+    samples: List[float] = []
+    for _ in range(rounds):
+        buffer.seek(0)
+        buffer.truncate()
+        start = time.perf_counter()
+        console.print(build())
+        samples.append(time.perf_counter() - start)
+
+    buffer.seek(0)
+    buffer.truncate()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _peak = tracemalloc.get_traced_memory()
+        console.print(build())
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return Measurement(
+        statistics.median(samples),
+        cells,
+        max(peak - before, 0),
+        len(output.encode("utf-8")),
+    )
+
+
+def run_bench(
+    cases: Sequence[str], colors: Sequence[GradientColor], width: int, rounds: int
+) -> List[BenchResult]:
+    """Measure each of ``cases`` with plain Rich and with the gradient."""
+    table = builders(colors)
+    results = []
+    for case in cases:
+        plain, gradient = table[case]
+        results.append(
+            BenchResult(
+                case, measure(plain, width, rounds), measure(gradient, width, rounds)
+            )
+        )
+    return results
+
+
+def to_json(results: Sequence[BenchResult], width: int, rounds: int) -> str:
+    """Return ``results`` as JSON, with the versions needed to compare releases."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    versions = {"rich-gradient-cli": VERSION, "python": platform.python_version()}
+    for package in ("rich", "rich-gradient"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:  # pragma: no cover - editable checkouts
+            versions[package] = "unknown"
+    return json.dumps(
+        {
+            "versions": versions,
+            "width": width,
+            "rounds": rounds,
+            "results": [result.as_dict() for result in results],
+        },
+        indent=2,
+    )
+
+
+__all__ = [
+    "BenchResult",
+    "CASES",
+    "Measurement",
+    "builders",
+    "measure",
+    "run_bench",
+    "to_json",
+]
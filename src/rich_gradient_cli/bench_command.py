@@ -0,0 +1,91 @@
+"""Gradient overhead benchmark command wiring for the CLI."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional
+
+from rich.table import Table
+
+import typer
+
+from .bench import CASES, run_bench, to_json
+from .common import get_console, resolve_colors
+
+DEFAULT_COLORS = "#ff5500,#00ccff"
+
+
+def bench_command(
+    cases: Optional[List[str]] = typer.Argument(
+        None, metavar="[CASE]...", help=f"Cases to run. [dim]({', '.join(CASES)})[/]"
+    ),
+    rounds: int = typer.Option(
+        50,
+        "--rounds",
+        metavar="N",
+        min=1,
+        help="Renders per measurement. [dim](default: 50)[/]",
+    ),
+    width: int = typer.Option(
+        80,
+        "--width",
+        metavar="WIDTH",
+        min=20,
+        help="Console width to render at. [dim](default: 80)[/]",
+    ),
+    colors: str = typer.Option(
+        DEFAULT_COLORS,
+        "-c",
+        "--colors",
+        metavar="COLORS",
+        help=f"Comma-separated gradient colors. [dim](default: {DEFAULT_COLORS})[/]",
+    ),
+    json_path: Optional[str] = typer.Option(
+        None,
+        "--json",
+        metavar="FILE",
+        help="Also write the results as JSON to FILE, or only to stdout with [bold]-[/].",
+    ),
+) -> None:
+    """Compare each gradient renderable with its plain Rich equivalent.
+
+    Reports the time overhead ratio, peak traced allocation per cell and
+    output bytes per cell for text, panel, rule and markdown.
+    """
+    console = get_console()
+    selected = cases or list(CASES)
+    unknown = [case for case in selected if case not in CASES]
+    if unknown:
+        raise typer.BadParameter(
+            f"Unknown case {', '.join(unknown)} (cases: {', '.join(CASES)}).",
+            param_hint="'[CASE]...'",
+        )
+    results = run_bench(selected, resolve_colors(colors) or [], width, rounds)
+    if json_path is not None:
+        report = to_json(results, width, rounds)
+        if json_path == "-":
+            typer.echo(report)
+            return
+        Path(json_path).write_text(report + "\n", encoding="utf-8")
+
+    table = Table(title=f"gradient vs plain Rich, width {width}, {rounds} rounds")
+    table.add_column("case")
+    table.add_column("plain ms", justify="right")
+    table.add_column("gradient ms", justify="right")
+    table.add_column("overhead", justify="right")
+    table.add_column("alloc B/cell", justify="right")
+    table.add_column("out B/cell", justify="right")
+    for result in results:
+        plain, gradient = result.plain, result.gradient
+        table.add_row(
+            result.case,
+            f"{plain.seconds * 1000:.2f}",
+            f"{gradient.seconds * 1000:.2f}",
+            f"{result.overhead:.1f}x",
+            f"{plain.alloc_per_cell:.0f} → {gradient.alloc_per_cell:.0f}",
+            f"{plain.bytes_per_cell:.1f} → {gradient.bytes_per_cell:.1f}",
+        )
+    console.print(table)
+
+
+__all__ = ["bench_command"]
@@ -0,0 +1,414 @@
+"""Parallel line-block coloring for very large inputs.
+
+Used by ``print --jobs`` and ``panel --jobs``. Content is split into blocks
+of lines; each block is wrapped, colored and encoded to SGR in a worker and
+the results are written back in their original order.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from rich.cells import cell_len, set_cell_size
+from rich.style import Style
+
+from .cells import CellLine, cell_offsets
+from .lut import Rgb, Stops, column_lut, text_colors
+from .sgr import paint
+
+ExecutorKind = Literal["auto", "thread", "process"]
+
+BLOCK_LINES = 2048
+
+_WORD = re.compile(r"\s*\S+\s*")
+
+# (lines, char_offset, total_length)
+TextBlock = Tuple[List[str], int, int]
+
+
+def free_threaded() -> bool:
+    """Return True when running on a free-threaded (no GIL) interpreter."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def default_jobs() -> int:
+    """Return the number of workers used for ``--jobs 0``."""
+    return os.cpu_count() or 1
+
+
+def make_executor(jobs: int, kind: ExecutorKind = "auto") -> Executor:
+    """Create a worker pool; ``auto`` picks threads only without a GIL."""
+    if kind == "auto":
+        kind = "thread" if free_threaded() else "process"
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=jobs)
+    return ThreadPoolExecutor(max_workers=jobs)
+
+
+def split_blocks(content: str, block_lines: int = BLOCK_LINES) -> Iterator[TextBlock]:
+    """Split content into blocks of lines, tracking each block's character offset."""
+    lines = content.split("\n")
+    total = len(content)
+    offset = 0
+    for start in range(0, len(lines), block_lines):
+        chunk = lines[start : start + block_lines]
+        yield chunk, offset, total
+        offset += sum(len(line) + 1 for line in chunk)
+
+
+def _truncate(text: str, cells: int, width: int, overflow: str) -> str:
+    """Crop a ``cells`` wide line to ``width`` cells, honoring the ellipsis overflow."""
+    if cells <= width:
+        return text
+    if overflow == "ellipsis" and width > 0:
+        return set_cell_size(text, width - 1) + "…"
+    return set_cell_size(text, width)
+
+
+def wrap_cells(
+    line: CellLine,
+    width: int,
+    overflow: str = "fold",
+    no_wrap: bool = False,
+    justify: str = "default",
+) -> List[Tuple[int, str, int]]:
+    """Wrap a measured line the way ``rich.text.Text.wrap`` does.
+
+    Returns ``(offset, text, cells)`` triples: the index of each row's first
+    character within the line, the row, and its width in cells, all taken
+    from the line's prefix sums. Like Rich, a wrapped row loses only as much
+    trailing whitespace as it has characters beyond ``width``, and center or
+    right justification strips it all before the row is truncated.
+    """
+    text = line.text
+    if no_wrap:
+        spans: Iterable[Tuple[int, int]] = [(0, len(text))]
+    else:
+        starts = [0, *line.divide(width, fold=overflow == "fold")]
+        spans = zip(starts, [*starts[1:], len(text)])
+    strip = justify in ("center", "right")
+    rows: List[Tuple[int, str, int]] = []
+    for start, end in spans:
+        row = text[start:end]
+        if strip:
+            end = start + len(row.rstrip())
+        elif not no_wrap and end - start > width:
+            # Text.rstrip_end counts characters, not cells.
+            excess = end - start - width
+            end -= min(len(row) - len(row.rstrip()), excess)
+        cells = line.cells(start, end)
+        row = _truncate(text[start:end], cells, width, overflow)
+        rows.append((start, row, min(cells, width)))
+    return rows
+
+
+def wrap_line(
+    line: str, width: int, overflow: str = "fold", no_wrap: bool = False
+) -> List[Tuple[int, str]]:
+    """Wrap a single line the way ``rich.text.Text.wrap`` does.
+
+    Returns ``(offset, text)`` pairs where ``offset`` is the index of the
+    first character of each wrapped row within ``line``.
+    """
+    return [
+        (start, row)
+        for start, row, _cells in wrap_cells(CellLine(line), width, overflow, no_wrap)
+    ]
+
+
+def wrapped_row_count(line: str, width: int) -> int:
+    """Return how many rows ``wrap_line`` folds ``line`` into.
+
+    Printable ASCII lines (one cell per character) are counted with the same
+    word-fitting rules as ``rich._wrap.divide_line`` without building any
+    rows; anything else is divided using its cell prefix sums.
+    """
+    if len(line) <= width and line.isascii() and line.isprintable():
+        return 1
+    if not (line.isascii() and line.isprintable()) or width < 1:
+        return len(CellLine(line).divide(width)) + 1
+    rows = 1
+    offset = 0
+    for match in _WORD.finditer(line):
+        start, end = match.span()
+        size = end - start
+        length = len(match.group().rstrip())
+        if width - offset >= length:
+            offset += size
+        elif length > width:
+            chunks = -(-size // width)
+            rows += chunks if start else chunks - 1
+            offset = size - (chunks - 1) * width
+        elif offset and start:
+            rows += 1
+            offset = size
+    return rows
+
+
+def expand_tabs(line: str, tab_size: int = 8) -> Tuple[str, Optional[List[int]]]:
+    """Expand tabs the way ``rich.text.Text.expand_tabs`` does.
+
+    Each tab becomes a space padded to the next multiple of ``tab_size``
+    cells. Also returns, for every character of the expanded line, the index
+    of the character it came from, so padding keeps the tab's gradient
+    color; None when ``line`` has no tabs.
+    """
+    if "\t" not in line:
+        return line, None
+    parts: List[str] = []
+    sources: List[int] = []
+    column = 0
+    index = 0
+    for part in line.split("\t")[:-1]:
+        column += cell_len(part) + 1
+        padding = -column % tab_size if tab_size else 0
+        parts.append(part + " " * (padding + 1))
+        sources.extend(range(index, index + len(part)))
+        sources.extend([index + len(part)] * (padding + 1))
+        column += padding
+        index += len(part) + 1
+    last = line[index:]
+    parts.append(last)
+    sources.extend(range(index, index + len(last)))
+    return "".join(parts), sources
+
+
+def _justify(cells: int, width: int, justify: str) -> Tuple[str, str]:
+    """Return the padding either side of a ``cells`` wide row, as Rich justifies it."""
+    excess = max(width - cells, 0)
+    if justify == "center":
+        return " " * (excess // 2), " " * (excess - excess // 2)
+    if justify == "right":
+        return " " * excess, ""
+    return "", ""
+
+
+def render_text_block(
+    block: TextBlock,
+    stops: Stops,
+    bg_stops: Optional[Stops],
+    width: int,
+    justify: str,
+    overflow: str,
+    no_wrap: bool,
+    style: str,
+    color_system: Optional[str],
+    tab_size: int = 8,
+) -> str:
+    """Wrap and color one block of lines using the text (per-character) gradient.
+
+    The gradient runs over the characters of the block as given, as
+    ``rich_gradient.text.Text`` colors them before Rich expands tabs.
+    """
+    lines, offset, total = block
+    base = Style.parse(style) if style else Style.null()
+    out: List[str] = []
+    for line in lines:
+        expanded, sources = expand_tabs(line, tab_size)
+        if sources is not None:
+            line_colors = text_colors(stops, total, offset, offset + len(line))
+            line_bgcolors = (
+                text_colors(bg_stops, total, offset, offset + len(line))
+                if bg_stops
+                else None
+            )
+        for start, row, cells in wrap_cells(
+            CellLine(expanded), width, overflow, no_wrap, justify
+        ):
+            bgcolors: Optional[Sequence[Rgb]] = None
+            if sources is None:
+                colors = text_colors(
+                    stops, total, offset + start, offset + start + len(row)
+                )
+                if bg_stops:
+                    bgcolors = text_colors(
+                        bg_stops, total, offset + start, offset + start + len(row)
+                    )
+            else:
+                picked = sources[start : start + len(row)]
+                colors = [line_colors[index] for index in picked]
+                if line_bgcolors is not None:
+                    bgcolors = [line_bgcolors[index] for index in picked]
+            left, right = _justify(cells, width, justify)
+            out.append(
+                left
+                + paint(row, colors, color_system, base=base, bgcolors=bgcolors)
+                + right
+            )
+        offset += len(line) + 1
+    return "\n".join(out)
+
+
+def _column_colors(
+    lut: Sequence[Rgb],
+    column_offset: int,
+    offsets: Optional[Sequence[int]],
+    length: int,
+) -> Sequence[Rgb]:
+    """Look up the column gradient color of every character of a row.
+
+    ``offsets`` are the row's cell prefix sums, or None when every character
+    is one cell wide, in which case the colors are a strided slice of ``lut``.
+    """
+    last = len(lut) - 1
+    if offsets is None:
+        first = 2 * column_offset + 1
+        stop = first + 2 * length
+        if stop - 2 <= last:
+            return lut[first:stop:2]
+        return [lut[min(first + 2 * index, last)] for index in range(length)]
+    base = 2 * column_offset
+    if base + 2 * offsets[-1] + 2 <= last:
+        return [
+            lut[base + 2 * column + (following - column or 1)]
+            for column, following in zip(offsets, offsets[1:])
+        ]
+    return [
+        lut[min(base + 2 * column + (following - column or 1), last)]
+        for column, following in zip(offsets, offsets[1:])
+    ]
+
+
+def render_column_block(
+    rows: List[str],
+    stops: Stops,
+    bg_stops: Optional[Stops],
+    span: int,
+    style: str,
+    color_system: Optional[str],
+    column_offset: int = 0,
+    row_offsets: Optional[Sequence[Optional[Sequence[int]]]] = None,
+) -> str:
+    """Color already laid-out rows using the column (panel/rule) gradient.
+
+    ``column_offset`` is the cell column at which every row starts, so rows
+    cut out of a wider layout keep their position in the gradient.
+    ``row_offsets`` may carry each row's cell prefix sums (None for
+    single-cell rows) when the caller has already measured them.
+    """
+    base = Style.parse(style) if style else Style.null()
+    lut = column_lut(stops, span)
+    bg_lut = column_lut(bg_stops, span) if bg_stops else None
+    out: List[str] = []
+    for number, row in enumerate(rows):
+        offsets = row_offsets[number] if row_offsets is not None else cell_offsets(row)
+        colors = _column_colors(lut, column_offset, offsets, len(row))
+        bgcolors = (
+            _column_colors(bg_lut, column_offset, offsets, len(row))
+            if bg_lut is not None
+            else None
+        )
+        out.append(paint(row, colors, color_system, base=base, bgcolors=bgcolors))
+    return "\n".join(out)
+
+
+def render_panel_body_block(
+    lines: List[str],
+    inner_width: int,
+    text_width: int,
+    indent: int,
+    stops: Stops,
+    bg_stops: Optional[Stops],
+    span: int,
+    style: str,
+    color_system: Optional[str],
+    frame: Tuple[str, str, int],
+) -> str:
+    """Wrap one block of panel body lines and color them between the borders.
+
+    Lines wrap at ``text_width`` and are shifted right by ``indent`` cells,
+    which reproduces ``rich.align.Align`` placing the text block inside the
+    panel. ``frame`` holds the pre-rendered left and right border strings
+    and the cell column at which the body starts. Each line is measured once
+    and its rows reuse slices of that measurement.
+    """
+    left, right, column_offset = frame
+    rows: List[str] = []
+    row_offsets: List[Optional[Sequence[int]]] = []
+    for line in lines:
+        measured = CellLine(expand_tabs(line)[0])
+        for start, row, cells in wrap_cells(measured, text_width):
+            fill = max(inner_width - indent - cells, 0)
+            rows.append(" " * indent + row + " " * fill)
+            if measured.offsets is None:
+                row_offsets.append(None)
+                continue
+            if not measured.text.startswith(row, start):
+                row_offsets.append(cell_offsets(rows[-1]))
+                continue
+            first = measured.offsets[start]
+            row_offsets.append(
+                [
+                    *range(indent),
+                    *(
+                        indent + offset - first
+                        for offset in measured.offsets[start : start + len(row) + 1]
+                    ),
+                    *range(indent + cells + 1, indent + cells + fill + 1),
+                ]
+            )
+    body = render_column_block(
+        rows, stops, bg_stops, span, style, color_system, column_offset, row_offsets
+    )
+    return "\n".join(left + row + right for row in body.split("\n"))
+
+
+def run_blocks(
+    executor: Executor,
+    func: Callable[..., str],
+    blocks: Iterable[Any],
+    *args: Any,
+    window: int = 64,
+) -> Iterator[str]:
+    """Submit blocks to ``executor`` and yield the results in order.
+
+    At most ``window`` blocks are in flight so memory stays bounded for
+    arbitrarily large inputs.
+    """
+    pending: Deque[Future[str]] = deque()
+    for block in blocks:
+        pending.append(executor.submit(func, block, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+__all__ = [
+    "BLOCK_LINES",
+    "ExecutorKind",
+    "default_jobs",
+    "expand_tabs",
+    "free_threaded",
+    "make_executor",
+    "render_column_block",
+    "render_panel_body_block",
+    "render_text_block",
+    "run_blocks",
+    "split_blocks",
+    "wrap_cells",
+    "wrap_line",
+    "wrapped_row_count",
+]
@@ -0,0 +1,147 @@
+"""Cell-width prefix sums for wrapping and positioning gradients.
+
+A ``CellLine`` measures its text once: ``offsets[i]`` is the cell column at
+which character ``i`` starts, so the width of any slice, the end of the
+longest slice that fits a width and the gradient column of every character
+are array lookups. Printable ASCII skips the array entirely and uses
+character indices.
+
+Widths follow ``rich.cells.cell_len``: a grapheme's width is charged to its
+first character and joiners, variation selectors and combining marks count
+as zero, so prefix sums agree with ``cell_len`` on every slice that starts
+and ends on a grapheme boundary. Only Rich's public ``cell_len`` and
+``get_character_cell_size`` are used.
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Optional
+
+from rich.cells import cell_len, get_character_cell_size
+
+_WORD = re.compile(r"\s*(\S+)\s*")
+
+
+class _CharWidths(dict):
+    """Character to cell width, filled from Rich on first sight of a character."""
+
+    def __missing__(self, character: str) -> int:
+        width = self[character] = get_character_cell_size(character)
+        return width
+
+
+_WIDTHS = _CharWidths()
+_ZWJ = "\u200d"
+_VS16 = "\ufe0f"
+
+
+def cell_offsets(text: str) -> "Optional[array[int]]":
+    """Return the prefix sums of the cell widths of ``text``.
+
+    Returns None for printable ASCII, where every character is one cell wide
+    and the character index is the cell column.
+    """
+    if text.isascii() and text.isprintable():
+        return None
+    if _ZWJ not in text and _VS16 not in text:
+        return array("l", accumulate(map(_WIDTHS.__getitem__, text), initial=0))
+    # Same walk as ``rich.cells.cell_len``: a joiner hides the next character
+    # and VS16 widens the last measured narrow emoji, which ``cell_len``
+    # reports for the pair.
+    widths = [0] * len(text)
+    last = -1
+    index = 0
+    while index < len(text):
+        character = text[index]
+        if character == _ZWJ:
+            index += 1
+        elif character == _VS16:
+            if last >= 0:
+                widths[last] = cell_len(text[last] + _VS16)
+                last = -1
+        else:
+            widths[index] = _WIDTHS[character]
+            if widths[index]:
+                last = index
+        index += 1
+    return array("l", accumulate(widths, initial=0))
+
+
+class CellLine:
+    """A line of text with its cell offsets measured once."""
+
+    __slots__ = ("text", "offsets")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.offsets = cell_offsets(text)
+
+    @property
+    def width(self) -> int:
+        """Return the width of the whole line in cells."""
+        if self.offsets is None:
+            return len(self.text)
+        return self.offsets[-1]
+
+    def cells(self, start: int, end: int) -> int:
+        """Return the width in cells of ``text[start:end]``."""
+        if self.offsets is None:
+            return end - start
+        return self.offsets[end] - self.offsets[start]
+
+    def column(self, index: int) -> int:
+        """Return the cell column at which character ``index`` starts."""
+        return index if self.offsets is None else self.offsets[index]
+
+    def fit(self, start: int, width: int) -> int:
+        """Return the end of the longest slice from ``start`` within ``width`` cells."""
+        if self.offsets is None:
+            return min(start + width, len(self.text))
+        offsets = self.offsets
+        return bisect_right(offsets, offsets[start] + width, start) - 1
+
+    def divide(self, width: int, fold: bool = True) -> List[int]:
+        """Return break positions like Rich's word wrapping.
+
+        Words are measured and folded with prefix-sum lookups instead of
+        per-character ``cell_len`` calls. A character wider than ``width``
+        is folded onto a row of its own.
+        """
+        breaks: List[int] = []
+        append = breaks.append
+        text = self.text
+        columns = self.offsets if self.offsets is not None else range(len(text) + 1)
+        offset = 0
+        for match in _WORD.finditer(text):
+            start, end = match.span()
+            length = columns[match.end(1)] - columns[start]
+            if width - offset >= length:
+                offset += columns[end] - columns[start]
+            elif length > width:
+                if not fold:
+                    if start:
+                        append(start)
+                    offset = columns[end] - columns[start]
+                    continue
+                while True:
+                    if start:
+                        append(start)
+                    stop = max(
+                        bisect_right(columns, columns[start] + width, start) - 1,
+                        start + 1,
+                    )
+                    if stop >= end:
+                        offset = columns[end] - columns[start]
+                        break
+                    start = stop
+            elif offset and start:
+                append(start)
+                offset = columns[end] - columns[start]
+        return breaks
+
+
+__all__ = ["CellLine", "cell_offsets"]
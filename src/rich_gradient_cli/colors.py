@@ -0,0 +1,149 @@
+"""Color token resolution for ``--colors`` and ``--bgcolors``.
+
+Named colors (CSS names from rich-color-ext and Rich's own ANSI names) are
+looked up in a compiled binary table that is keyed by the installed
+versions and loaded with a single read. Hex, ``rgb()`` and other forms are
+resolved once per process through an LRU cache.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+from rich.color import ANSI_COLOR_NAMES, Color, ColorParseError
+from rich.color_triplet import ColorTriplet
+
+_MAGIC = b"RGCT"
+_HEADER = struct.Struct("<4sHII")
+_HEX6 = re.compile(r"#?([0-9a-f]{6})")
+_HEX3 = re.compile(r"#([0-9a-f]{3})")
+
+TABLE_NAME = "colors.bin"
+
+
+class ColorResolutionError(ValueError):
+    """Raised when a color token cannot be resolved to RGB."""
+
+
+def table_key() -> str:
+    """Return the version key a compiled color table must match."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    parts = []
+    for package in ("rich", "rich-color-ext"):
+        try:
+            parts.append(f"{package}={version(package)}")
+        except PackageNotFoundError:  # pragma: no cover - editable checkouts
+            parts.append(f"{package}=unknown")
+    return ";".join(parts)
+
+
+def known_colors() -> Dict[str, ColorTriplet]:
+    """Return every named color known to Rich and rich-color-ext."""
+    from rich_color_ext import get_css_map
+
+    table: Dict[str, ColorTriplet] = {}
+    for name in ANSI_COLOR_NAMES:
+        table[name] = Color.parse(name).get_truecolor()
+    # rich-color-ext patches Color.parse so CSS names win over ANSI names.
+    for name, value in get_css_map().items():
+        table[name.lower()] = Color.parse(value).get_truecolor()
+    return table
+
+
+def compile_color_table(
+    path: Path, table: Optional[Dict[str, ColorTriplet]] = None
+) -> None:
+    """Write ``table`` (default: all known colors) as a binary color table."""
+    table = known_colors() if table is None else table
+    key = table_key().encode("utf-8")
+    names = "\n".join(table).encode("utf-8")
+    rgb = bytes(channel for triplet in table.values() for channel in triplet)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{os.getpid()}")
+    try:
+        temporary.write_bytes(
+            _HEADER.pack(_MAGIC, len(key), len(table), len(names)) + key + names + rgb
+        )
+        os.replace(temporary, path)
+    except OSError:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def load_color_table(path: Path) -> Optional[Dict[str, ColorTriplet]]:
+    """Load a binary color table, returning None if missing, stale or corrupt."""
+    try:
+        data = path.read_bytes()
+        magic, key_len, count, names_len = _HEADER.unpack_from(data)
+    except (OSError, struct.error):
+        return None
+    offset = _HEADER.size
+    key = data[offset : offset + key_len].decode("utf-8", "replace")
+    if magic != _MAGIC or key != table_key():
+        return None
+    offset += key_len
+    try:
+        names = data[offset : offset + names_len].decode("utf-8").split("\n")
+    except ValueError:
+        return None
+    rgb = data[offset + names_len :]
+    if len(names) != count or len(rgb) != 3 * count:
+        return None
+    return {
+        name: ColorTriplet(rgb[3 * i], rgb[3 * i + 1], rgb[3 * i + 2])
+        for i, name in enumerate(names)
+    }
+
+
+@lru_cache(maxsize=1)
+def color_table() -> Dict[str, ColorTriplet]:
+    """Return the named color table, compiling it into the cache on first use."""
+    from .common import cache_dir
+
+    path = cache_dir() / TABLE_NAME
+    table = load_color_table(path)
+    if table is None:
+        table = known_colors()
+        try:
+            compile_color_table(path, table)
+        except OSError:
+            pass
+    return table
+
+
+@lru_cache(maxsize=1024)
+def resolve_color(token: str) -> ColorTriplet:
+    """Resolve a single color token (name, hex, ``rgb()``...) to an RGB triplet."""
+    normalized = token.strip().lower()
+    match = _HEX6.fullmatch(normalized) if normalized.startswith("#") else None
+    if match:
+        value = int(match.group(1), 16)
+        return ColorTriplet(value >> 16, (value >> 8) & 0xFF, value & 0xFF)
+    match = _HEX3.fullmatch(normalized)
+    if match:
+        r, g, b = (int(ch * 2, 16) for ch in match.group(1))
+        return ColorTriplet(r, g, b)
+    named = color_table().get(normalized)
+    if named is not None:
+        return named
+    try:
+        return Color.parse(normalized).get_truecolor()
+    except ColorParseError as error:
+        raise ColorResolutionError(f"'{token}' is not a valid color.") from error
+
+
+__all__ = [
+    "ColorResolutionError",
+    "color_table",
+    "compile_color_table",
+    "known_colors",
+    "load_color_table",
+    "resolve_color",
+    "table_key",
+]
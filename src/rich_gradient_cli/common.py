@@ -2,17 +2,88 @@
 
 from __future__ import annotations
 
+import io
+import os
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Literal, Optional, Union
 
+from rich.color import ColorSystem
+from rich.color_triplet import ColorTriplet
 from rich.console import Console, RenderableType
+from rich.errors import StyleSyntaxError
 from rich.padding import Padding
 from rich.style import Style
-from rich_gradient.theme import GRADIENT_TERMINAL_THEME
 
-console = Console()
+import typer
+
+from .colors import ColorResolutionError, resolve_color
+
 VERSION = "0.3.10"
 
+
+def cache_dir() -> Path:
+    """Return the directory used for compiled tables and other caches.
+
+    ``GRADIENT_CACHE_DIR`` overrides the default of
+    ``$XDG_CACHE_HOME/rich-gradient-cli``.
+    """
+    override = os.environ.get("GRADIENT_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "rich-gradient-cli"
+
+
+class LazyConsole(Console):
+    """The shared ``Console``, built on first use rather than at import.
+
+    Building a ``Console`` probes the environment and the terminal, which
+    ``--version``, usage errors and commands that never print do not need.
+    When stdout is a terminal the probe's answer comes from ``termprobe``,
+    and a fresh answer is stored there for the next run.
+    """
+
+    def __init__(self) -> None:  # Console.__init__ runs in __getattr__
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes Console.__init__ has not set yet.
+        if name.startswith("__") or self.__dict__.get("_probed"):
+            raise AttributeError(name)
+        self.__dict__["_probed"] = True
+        from . import termprobe
+
+        try:
+            fd: Optional[int] = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+        options = termprobe.console_options(fd) if fd is not None else {}
+        Console.__init__(self, **options)
+        if fd is not None and not options:
+            termprobe.remember(self.color_system, fd)
+        return getattr(self, name)
+
+
+console = LazyConsole()
+
+_active_console: ContextVar[Optional[Console]] = ContextVar(
+    "_active_console", default=None
+)
+
+
+def get_console() -> Console:
+    """Return the console commands write to.
+
+    That is the shared ``console`` unless ``capture_console`` has swapped in
+    a buffer for the current context.
+    """
+    active = _active_console.get()
+    return console if active is None else active
+
+
 HEADER_TEXT = (
     "[#ff5500]r[/][#ff6f00]i[/][#ff8300]c[/]"
     "[#ff9500]h[/][#ffa600]-[/][#ffb600]g[/][#ffc500]r[/]"
@@ -48,35 +119,123 @@ def parse_colors(colors: Optional[str]) -> Optional[List[str]]:
     return [c.strip() for c in colors.split(",") if c.strip()]
 
 
+def resolve_colors(
+    colors: Optional[str], option: str = "--colors"
+) -> Optional[List[Union[ColorTriplet, str]]]:
+    """Parse comma-separated color tokens and resolve them to RGB triplets.
+
+    Invalid tokens raise ``typer.BadParameter`` naming ``option`` so bad input
+    fails before any rendering work. ``default`` is kept as-is because it
+    names the terminal's own color rather than an RGB value.
+    """
+    tokens = parse_colors(colors)
+    if tokens is None:
+        return None
+    resolved: List[Union[ColorTriplet, str]] = []
+    for token in tokens:
+        if token.lower() == "default":
+            resolved.append("default")
+            continue
+        try:
+            resolved.append(resolve_color(token))
+        except ColorResolutionError as error:
+            raise typer.BadParameter(str(error), param_hint=f"'{option}'") from error
+    return resolved
+
+
+def color_enabled() -> bool:
+    """Return True when the active console will emit colors.
+
+    Redirected output, ``TERM=dumb`` and ``NO_COLOR`` all mean a gradient
+    would be computed only to be stripped again.
+    """
+    active = get_console()
+    return active.color_system is not None and not active.no_color
+
+
 def parse_style(style: Optional[str]) -> Style:
-    """Parse a Rich style string or return a null style."""
+    """Parse a Rich style string or return a null style.
+
+    CSS color names come from rich-color-ext, which ``rich_gradient``
+    installs on import, so it is only imported when Rich alone fails.
+    """
     if style is None:
         return Style.null()
-    return Style.parse(style)
+    try:
+        return Style.parse(style)
+    except StyleSyntaxError:
+        return Style.parse(style)
+
+
+_COLOR_SYSTEM_NAMES: Dict[
+    ColorSystem, Literal["standard", "256", "truecolor", "windows"]
+] = {
+    ColorSystem.STANDARD: "standard",
+    ColorSystem.EIGHT_BIT: "256",
+    ColorSystem.TRUECOLOR: "truecolor",
+    ColorSystem.WINDOWS: "windows",
+}
+
+
+@contextmanager
+def capture_console(
+    width: int, color_system: Optional[ColorSystem] = ColorSystem.TRUECOLOR
+) -> Iterator[io.StringIO]:
+    """Send output from ``get_console()`` into a buffer ``width`` cells wide.
+
+    For the duration, commands write to a separate ``Console`` built on the
+    buffer; the shared console is left untouched. ``color_system`` defaults
+    to truecolor; None captures plain text.
+    """
+    buffer = io.StringIO()
+    name = _COLOR_SYSTEM_NAMES[color_system] if color_system is not None else None
+    token = _active_console.set(
+        Console(file=buffer, width=width, color_system=name, force_terminal=True)
+    )
+    try:
+        yield buffer
+    finally:
+        _active_console.reset(token)
 
 
 def export_svg(
-    renderable: RenderableType, svg_path: str, *, end: str = "\n", no_wrap: bool = False
+    renderable: RenderableType,
+    svg_path: str,
+    *,
+    end: str = "\n",
+    no_wrap: bool = False,
+    minify: bool = False,
+    compress: bool = False,
 ) -> None:
-    """Render a Rich renderable to an SVG file."""
+    """Render a Rich renderable to an SVG file, optionally minified or gzipped."""
+    from rich_gradient.theme import GRADIENT_TERMINAL_THEME
+
+    from .svg_export import write_svg
+
     svg_console = Console(record=True, force_terminal=True, color_system="truecolor")
     padded = Padding(renderable, (1, 4))
     svg_console.print(padded, end=end, no_wrap=no_wrap)
 
-    Path(svg_path).write_text(
+    write_svg(
         svg_console.export_svg(
             title="rich-gradient",
             theme=GRADIENT_TERMINAL_THEME,
         ),
-        encoding="utf-8",
+        svg_path,
+        minify=minify,
+        compress=compress,
     )
 
 
 __all__ = [
     "VERSION",
     "console",
+    "get_console",
+    "cache_dir",
+    "capture_console",
     "parse_colors",
     "parse_style",
+    "resolve_colors",
     "HEADER_TEXT",
     "FOOTER_TEXT",
     "USAGE_PREFIX",
@@ -0,0 +1,134 @@
+"""Cyclic gradients for unbounded line streams.
+
+A normal gradient needs the whole text to know its span. ``GradientRing``
+instead precomputes one escape prefix per step of a looping gradient, and
+``stream_cycle`` paints each incoming line with the prefix at its position
+in the ring. The position comes from a line counter or the clock, so each
+line costs one modulo and one lookup, and memory stays at the ring's size
+however long the stream runs.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from typing import Callable, Iterable, NamedTuple, Optional, Tuple
+
+from rich.style import Style
+
+from .lut import Stops, fraction_color
+from .metrics import RENDERS
+from .sgr import RESET, color_prefix
+
+RING_SIZE = 256
+
+_LINES = RENDERS.labels("print")
+_PERIOD = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(ms|s)?\s*$", re.IGNORECASE)
+
+
+class CyclePeriod(NamedTuple):
+    """How often a cyclic gradient repeats: every ``lines`` or every ``seconds``."""
+
+    lines: int
+    seconds: float
+
+
+def parse_period(text: str) -> CyclePeriod:
+    """Parse ``40`` (lines), ``2.5s`` or ``500ms`` into a ``CyclePeriod``."""
+    match = _PERIOD.match(text)
+    if not match:
+        raise ValueError(f"Invalid period: {text!r}")
+    number, unit = match.groups()
+    if unit is None:
+        if "." in number or int(number) < 2:
+            raise ValueError(
+                f"A line period must be a whole number of at least 2: {text!r}"
+            )
+        return CyclePeriod(int(number), 0.0)
+    seconds = float(number) / (1000 if unit.lower() == "ms" else 1)
+    if seconds <= 0:
+        raise ValueError(f"A time period must be positive: {text!r}")
+    return CyclePeriod(0, seconds)
+
+
+def loop_stops(stops: Stops) -> Stops:
+    """Return ``stops`` followed by their reverse so the gradient ends where it began."""
+    if len(stops) < 2:
+        return stops * 2 if stops else stops
+    return stops + stops[-2::-1]
+
+
+class GradientRing:
+    """A fixed-size ring of escape prefixes sampled from a looping gradient."""
+
+    __slots__ = ("prefixes", "size")
+
+    def __init__(
+        self,
+        stops: Stops,
+        size: int,
+        color_system: Optional[str],
+        *,
+        base: Style = Style.null(),
+        bg_stops: Optional[Stops] = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("A gradient ring needs at least one step.")
+        looped = loop_stops(stops)
+        bg_looped = loop_stops(bg_stops) if bg_stops else None
+        self.size = size
+        self.prefixes: Tuple[str, ...] = tuple(
+            color_prefix(
+                fraction_color(step / size, looped),
+                fraction_color(step / size, bg_looped) if bg_looped else None,
+                base,
+                color_system,
+            )
+            for step in range(size)
+        )
+
+    def __getitem__(self, position: int) -> str:
+        return self.prefixes[position % self.size]
+
+
+def stream_cycle(
+    lines: Iterable[str],
+    write: Callable[[str], object],
+    ring: GradientRing,
+    period: CyclePeriod,
+    *,
+    flush: Optional[Callable[[], object]] = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> int:
+    """Paint each of ``lines`` with the ring color at its position; return the count.
+
+    With a line period the ring advances one step per line (the ring should
+    have ``period.lines`` steps); with a time period the position follows
+    the clock so the gradient repeats every ``period.seconds``.
+    """
+    rate = ring.size / period.seconds if period.seconds else 0.0
+    started = clock()
+    count = 0
+    for count, line in enumerate(lines, 1):
+        position = int((clock() - started) * rate) if rate else count - 1
+        prefix = ring[position]
+        if not prefix or line == "\n":
+            write(line)
+        elif line.endswith("\n"):
+            write(f"{prefix}{line[:-1]}{RESET}\n")
+        else:
+            write(f"{prefix}{line}{RESET}")
+        if flush is not None:
+            flush()
+        _LINES.inc()
+    return count
+
+
+__all__ = [
+    "CyclePeriod",
+    "GradientRing",
+    "RING_SIZE",
+    "loop_stops",
+    "parse_period",
+    "stream_cycle",
+]
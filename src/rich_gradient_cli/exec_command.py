@@ -0,0 +1,107 @@
+"""Command runner wiring for the CLI."""
+
+from __future__ import annotations
+
+import os
+from typing import List, Optional
+
+import click
+from rich.console import Console
+
+import typer
+
+from .common import color_enabled, get_console, resolve_colors
+from .lut import Stops
+from .metrics import exporting
+from .spawn import LATENCY, LinePainter, run_command
+
+DEFAULT_STDOUT_COLORS = "#00ccff,#aa00ff"
+DEFAULT_STDERR_COLORS = "#ff5500,#ff0088"
+
+
+def _stops(colors: Optional[str], default: str, option: str) -> Stops:
+    resolved = resolve_colors(colors, option) or resolve_colors(default, option)
+    stops = tuple(
+        tuple(color) for color in resolved or () if not isinstance(color, str)
+    )
+    if not stops:
+        raise typer.BadParameter(
+            "Give at least one RGB color.", param_hint=f"'{option}'"
+        )
+    return stops  # type: ignore[return-value]
+
+
+def exec_command(
+    command: List[str] = typer.Argument(
+        ...,
+        metavar="COMMAND...",
+        help="The command to run, followed by its arguments.",
+    ),
+    colors: Optional[str] = typer.Option(
+        None,
+        "-c",
+        "--colors",
+        metavar="COLORS",
+        help=(
+            "Comma-separated gradient for the command's stdout. "
+            f"[dim](default: {DEFAULT_STDOUT_COLORS})[/]"
+        ),
+    ),
+    stderr_colors: Optional[str] = typer.Option(
+        None,
+        "-e",
+        "--stderr-colors",
+        metavar="COLORS",
+        help=(
+            "Comma-separated gradient for the command's stderr. "
+            f"[dim](default: {DEFAULT_STDERR_COLORS})[/]"
+        ),
+    ),
+    latency: float = typer.Option(
+        LATENCY * 1000,
+        "--latency",
+        metavar="MS",
+        min=1.0,
+        help=(
+            "Longest a partial line waits before it is written, in milliseconds. "
+            "[dim](default: 50)[/]"
+        ),
+    ),
+) -> None:
+    """Run a command under a pseudo-terminal, painting each line it prints.
+
+    Stdout and stderr get separate gradients, lines the command colors
+    itself are left alone, and the command's exit status becomes gradient's.
+    Put [bold]--[/] before the command when its arguments look like options.
+    """
+    console = get_console()
+    if os.name != "posix":
+        raise click.UsageError(
+            "exec needs pseudo-terminals, which need a POSIX system."
+        )
+    stdout_stops = _stops(colors, DEFAULT_STDOUT_COLORS, "--colors")
+    stderr_stops = _stops(stderr_colors, DEFAULT_STDERR_COLORS, "--stderr-colors")
+    error_console = Console(stderr=True)
+    try:
+        with exporting():
+            returncode = run_command(
+                command,
+                LinePainter(
+                    stdout_stops, console.color_system if color_enabled() else None
+                ),
+                LinePainter(
+                    stderr_stops,
+                    None if error_console.no_color else error_console.color_system,
+                ),
+                latency=latency / 1000,
+            )
+    except FileNotFoundError:
+        error_console.print(f"gradient: command not found: {command[0]}", markup=False)
+        raise typer.Exit(127)
+    except PermissionError:
+        error_console.print(f"gradient: permission denied: {command[0]}", markup=False)
+        raise typer.Exit(126)
+    raise typer.Exit(returncode)
+
+
+__all__ = ["exec_command"]
@@ -0,0 +1,357 @@
+"""Follow many files at once and interleave their lines.
+
+One asyncio loop serves every source. On Linux a single inotify descriptor
+reports which files grew; elsewhere (or with ``--poll``) one task stats them
+all on an interval, so hundreds of files cost neither threads nor a timer
+each. Every source has a gradient of its own, sampled once into a small
+``GradientRing`` of line colors next to its painted prefix, and all complete
+lines go through one ``BatchWriter`` so they interleave whole and can be
+flushed on a fixed interval instead of after every read.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import colorsys
+import ctypes
+import os
+import struct
+from functools import lru_cache
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple
+
+from .cycle import GradientRing
+from .lut import Rgb, Stops
+from .metrics import BYTES_WRITTEN, QUEUE_DEPTH, RENDERS
+from .sgr import RESET, paint_bytes
+
+TAIL_LINES = 10
+POLL_INTERVAL = 0.25
+RESCAN_INTERVAL = 1.0
+READ_SIZE = 1 << 16
+ROUND_SIZE = 1 << 20
+RING_STEPS = 32
+SEPARATOR = " │ "
+
+_GOLDEN = 0.618033988749895
+_RESET = RESET.encode("ascii")
+# inotify(7): IN_MODIFY | IN_DELETE_SELF | IN_MOVE_SELF
+_WATCH_MASK = 0x002 | 0x400 | 0x800
+_EVENT = struct.Struct("iIII")
+_LINES = RENDERS.labels("tail")
+_WRITTEN = BYTES_WRITTEN.labels("tail")
+_QUEUED = QUEUE_DEPTH.labels("tail_writer")
+
+
+@lru_cache(maxsize=None)
+def source_stops(index: int, colors: Stops = ()) -> Stops:
+    """Return the gradient of source number ``index``.
+
+    With ``colors`` each source runs from one color to the next, cycling;
+    otherwise sources get golden-angle hues so neighbors never look alike.
+    """
+    if colors:
+        return (colors[index % len(colors)], colors[(index + 1) % len(colors)])
+    hue = index * _GOLDEN % 1.0
+    stops: List[Rgb] = []
+    for h in (hue, hue + 0.08):
+        red, green, blue = colorsys.hls_to_rgb(h % 1.0, 0.6, 0.9)
+        stops.append((round(red * 255), round(green * 255), round(blue * 255)))
+    return tuple(stops)
+
+
+def tail_offset(fd: int, size: int, lines: int) -> int:
+    """Return the offset of the last ``lines`` lines of the file ``fd``."""
+    if lines <= 0:
+        return size
+    position = size
+    # A final line without its newline still counts as a line.
+    wanted = lines + 1 if size and os.pread(fd, 1, size - 1) == b"\n" else lines
+    while position > 0:
+        start = max(0, position - READ_SIZE)
+        block = os.pread(fd, position - start, start)
+        index = len(block)
+        while True:
+            index = block.rfind(b"\n", 0, index)
+            if index < 0:
+                break
+            wanted -= 1
+            if not wanted:
+                return start + index + 1
+        position = start
+    return 0
+
+
+class Source:
+    """One followed file with its painted prefix and ring of line colors."""
+
+    __slots__ = (
+        "path",
+        "prefix",
+        "colors",
+        "fd",
+        "inode",
+        "offset",
+        "pending",
+        "count",
+    )
+
+    def __init__(self, path: str, prefix: bytes, colors: Sequence[bytes]) -> None:
+        self.path = path
+        self.prefix = prefix
+        self.colors = tuple(colors)
+        self.fd = -1
+        self.inode: Optional[Tuple[int, int]] = None
+        self.offset = 0
+        self.pending = b""
+        self.count = 0
+
+    def open(self, last: Optional[int] = None) -> bytes:
+        """Open the file at its last ``last`` lines (or its start); return them formatted."""
+        fd = os.open(self.path, os.O_RDONLY)
+        stat = os.fstat(fd)
+        self.close()
+        self.fd = fd
+        self.inode = (stat.st_dev, stat.st_ino)
+        self.offset = 0 if last is None else tail_offset(fd, stat.st_size, last)
+        return self.read()
+
+    def read(self) -> bytes:
+        """Return the complete lines appended since the last read, formatted."""
+        chunks: List[bytes] = []
+        total = 0
+        while total < ROUND_SIZE:
+            data = os.pread(self.fd, READ_SIZE, self.offset)
+            if not data:
+                break
+            self.offset += len(data)
+            total += len(data)
+            chunks.append(data)
+        return self.format(b"".join(chunks)) if chunks else b""
+
+    def check(self) -> bytes:
+        """Notice rotation and truncation, then read; return formatted lines."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return b""
+        if (stat.st_dev, stat.st_ino) != self.inode:
+            rest = self.read() + self.finish()
+            try:
+                return rest + self.open()
+            except OSError:
+                return rest
+        if stat.st_size < self.offset:
+            self.offset = 0
+        return self.read()
+
+    def format(self, data: bytes) -> bytes:
+        """Prefix and color the complete lines of ``data``; keep the remainder."""
+        data = self.pending + data
+        cut = data.rfind(b"\n") + 1
+        self.pending = data[cut:]
+        if not cut:
+            return b""
+        lines = data[: cut - 1].split(b"\n")
+        prefix, colors, start = self.prefix, self.colors, self.count
+        self.count += len(lines)
+        _LINES.inc(len(lines))
+        if not colors:
+            return b"".join(prefix + line + b"\n" for line in lines)
+        steps = len(colors)
+        return b"".join(
+            prefix + colors[(start + number) % steps] + line + _RESET + b"\n"
+            if line
+            else prefix + b"\n"
+            for number, line in enumerate(lines)
+        )
+
+    def finish(self) -> bytes:
+        """Return the pending partial line as a full line."""
+        return self.format(b"\n") if self.pending else b""
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def make_sources(
+    paths: Sequence[str], color_system: Optional[str], colors: Stops = ()
+) -> List[Source]:
+    """Build a ``Source`` per path with its prefix and cached gradient."""
+    width = max((len(path) for path in paths), default=0)
+    sources = []
+    for index, path in enumerate(paths):
+        padding = " " * (width - len(path)) + SEPARATOR
+        label = path.encode("utf-8", "surrogateescape")
+        if color_system is None:
+            sources.append(Source(path, label + padding.encode("utf-8"), ()))
+            continue
+        stops = source_stops(index, colors)
+        ring = GradientRing(stops, RING_STEPS, color_system)
+        sources.append(
+            Source(
+                path,
+                paint_bytes(label, stops, color_system) + padding.encode("utf-8"),
+                [prefix.encode("ascii") for prefix in ring.prefixes],
+            )
+        )
+    return sources
+
+
+class BatchWriter:
+    """Collect every source's lines and write them in as few calls as possible."""
+
+    __slots__ = ("sink", "chunks", "flushes")
+
+    def __init__(self, sink: BinaryIO) -> None:
+        self.sink = sink
+        self.chunks: List[bytes] = []
+        self.flushes = 0
+
+    def write(self, data: bytes) -> None:
+        if data:
+            self.chunks.append(data)
+            _QUEUED.set(len(self.chunks))
+
+    def flush(self) -> None:
+        if not self.chunks:
+            return
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        _QUEUED.set(0)
+        self.sink.write(data)
+        self.sink.flush()
+        self.flushes += 1
+        _WRITTEN.inc(len(data))
+
+
+class Inotify:
+    """A minimal ctypes binding to one Linux inotify descriptor."""
+
+    def __init__(self) -> None:
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.fd = fd
+
+    @classmethod
+    def create(cls) -> Optional["Inotify"]:
+        """Return an ``Inotify``, or None where inotify is unavailable."""
+        try:
+            return cls()
+        except (AttributeError, OSError):
+            return None
+
+    def watch(self, path: str) -> int:
+        """Watch ``path`` for writes and rotation; return the watch descriptor."""
+        wd = self._libc.inotify_add_watch(
+            self.fd, os.fsencode(path), ctypes.c_uint32(_WATCH_MASK)
+        )
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), path)
+        return wd
+
+    def read_events(self) -> List[int]:
+        """Return the watch descriptors with pending events, in order."""
+        try:
+            data = os.read(self.fd, 1 << 16)
+        except BlockingIOError:
+            return []
+        descriptors: List[int] = []
+        offset = 0
+        while offset < len(data):
+            wd, _mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size + length
+            if not descriptors or descriptors[-1] != wd:
+                descriptors.append(wd)
+        return descriptors
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+async def follow(
+    sources: Sequence[Source],
+    writer: BatchWriter,
+    *,
+    flush_interval: float = 0.0,
+    poll: Optional[float] = None,
+) -> None:
+    """Interleave new lines from ``sources`` into ``writer`` until cancelled.
+
+    With ``poll`` every source is checked on that interval; otherwise inotify
+    wakes the loop as files grow (falling back to ``POLL_INTERVAL`` polling
+    where it is unavailable) and a slower rescan catches rotation. A
+    ``flush_interval`` batches output into one write per interval.
+    """
+    loop = asyncio.get_running_loop()
+    notify = Inotify.create() if poll is None else None
+    watched: Dict[int, Source] = {}
+
+    def settle() -> None:
+        if not flush_interval:
+            writer.flush()
+
+    def watch(source: Source) -> None:
+        if notify is not None:
+            try:
+                watched[notify.watch(source.path)] = source
+            except OSError:
+                pass
+
+    def update(source: Source) -> None:
+        inode = source.inode
+        writer.write(source.check())
+        if source.inode != inode:
+            watch(source)
+
+    def on_events() -> None:
+        assert notify is not None
+        for wd in notify.read_events():
+            source = watched.get(wd)
+            if source is not None:
+                update(source)
+        settle()
+
+    async def flush_every() -> None:
+        while True:
+            await asyncio.sleep(flush_interval)
+            writer.flush()
+
+    if notify is not None:
+        for source in sources:
+            watch(source)
+        loop.add_reader(notify.fd, on_events)
+        interval = RESCAN_INTERVAL
+    else:
+        interval = poll or POLL_INTERVAL
+    flusher = loop.create_task(flush_every()) if flush_interval else None
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            for source in sources:
+                update(source)
+            settle()
+    finally:
+        if flusher is not None:
+            flusher.cancel()
+        if notify is not None:
+            loop.remove_reader(notify.fd)
+            notify.close()
+        writer.flush()
+
+
+__all__ = [
+    "BatchWriter",
+    "Inotify",
+    "POLL_INTERVAL",
+    "Source",
+    "TAIL_LINES",
+    "follow",
+    "make_sources",
+    "source_stops",
+    "tail_offset",
+]
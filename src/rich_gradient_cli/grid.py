@@ -0,0 +1,243 @@
+"""Dashboards of gradient panels laid out in a grid.
+
+A grid spec lists panels and a column count. Each distinct panel is rendered
+to a list of ANSI rows (a cell buffer) in a worker pool, the buffers are
+stitched into one frame, and the frame is written with a single flush.
+``GridRenderer`` keeps the buffers of the last frame, so a refresh only
+re-renders panels whose spec or cell width changed.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import math
+from concurrent.futures import Executor
+from itertools import repeat
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from rich.console import Console
+
+from .colors import ColorResolutionError, resolve_color
+from .lut import hex_color
+from .metrics import CACHE_HITS, CACHE_MISSES
+from .sgr import segments_to_ansi
+
+MIN_CELL_WIDTH = 8
+BOXES = ("ROUNDED", "SQUARE", "HEAVY", "DOUBLE", "ASCII")
+JUSTIFY = ("left", "center", "right")
+
+_CELL_HITS = CACHE_HITS.labels("grid_cells")
+_CELL_MISSES = CACHE_MISSES.labels("grid_cells")
+
+
+class GridError(ValueError):
+    """Raised when a grid spec is malformed."""
+
+
+class CellSpec(NamedTuple):
+    """One panel of a grid. Colors are stored as resolved hex strings."""
+
+    text: str
+    title: Optional[str] = None
+    subtitle: Optional[str] = None
+    colors: Tuple[str, ...] = ()
+    bg_colors: Tuple[str, ...] = ()
+    rainbow: bool = False
+    box: str = "ROUNDED"
+    justify: str = "left"
+    style: Optional[str] = None
+    border_style: Optional[str] = None
+    title_style: Optional[str] = None
+
+
+class GridSpec(NamedTuple):
+    """Panels flowed left to right into ``columns`` columns."""
+
+    cells: Tuple[CellSpec, ...]
+    columns: int
+    gap: int = 1
+
+
+def _colors(value: Any, where: str) -> Tuple[str, ...]:
+    if value is None:
+        return ()
+    tokens = value.split(",") if isinstance(value, str) else value
+    try:
+        return tuple(
+            hex_color(tuple(resolve_color(str(token).strip())))  # type: ignore[arg-type]
+            for token in tokens
+            if str(token).strip()
+        )
+    except ColorResolutionError as error:
+        raise GridError(f"{where}: {error}") from error
+
+
+def _cell(entry: Any, index: int) -> CellSpec:
+    where = f"panel {index + 1}"
+    if isinstance(entry, str):
+        entry = {"text": entry}
+    if not isinstance(entry, Mapping) or not isinstance(entry.get("text"), str):
+        raise GridError(f'{where}: expected a string or an object with "text".')
+    unknown = set(entry) - set(CellSpec._fields) - {"bgcolors"}
+    if unknown:
+        raise GridError(f"{where}: unknown keys {', '.join(sorted(unknown))}.")
+    box = str(entry.get("box", "ROUNDED")).upper()
+    justify = str(entry.get("justify", "left")).lower()
+    if box not in BOXES:
+        raise GridError(f"{where}: box must be one of {', '.join(BOXES)}.")
+    if justify not in JUSTIFY:
+        raise GridError(f"{where}: justify must be one of {', '.join(JUSTIFY)}.")
+    return CellSpec(
+        text=entry["text"],
+        title=entry.get("title"),
+        subtitle=entry.get("subtitle"),
+        colors=_colors(entry.get("colors"), where),
+        bg_colors=_colors(entry.get("bg_colors", entry.get("bgcolors")), where),
+        rainbow=bool(entry.get("rainbow", False)),
+        box=box,
+        justify=justify,
+        style=entry.get("style"),
+        border_style=entry.get("border_style"),
+        title_style=entry.get("title_style"),
+    )
+
+
+def load_grid(data: Any, columns: Optional[int] = None) -> GridSpec:
+    """Build a grid from parsed JSON.
+
+    ``data`` is either a list of panels or an object with ``panels`` and
+    optional ``columns`` and ``gap``. A panel is a string or an object with
+    ``text`` plus any ``CellSpec`` field. ``columns`` overrides the spec and
+    defaults to a near-square layout.
+    """
+    if isinstance(data, list):
+        data = {"panels": data}
+    if not isinstance(data, Mapping) or not isinstance(data.get("panels"), list):
+        raise GridError('Expected a list of panels or an object with "panels".')
+    cells = tuple(_cell(entry, index) for index, entry in enumerate(data["panels"]))
+    if not cells:
+        raise GridError("A grid needs at least one panel.")
+    if columns is None:
+        columns = data.get("columns") or math.ceil(math.sqrt(len(cells)))
+    gap = data.get("gap", 1)
+    if not isinstance(columns, int) or columns < 1:
+        raise GridError("columns must be a positive integer.")
+    if not isinstance(gap, int) or gap < 0:
+        raise GridError("gap must be a non-negative integer.")
+    return GridSpec(cells, min(columns, len(cells)), gap)
+
+
+def parse_grid(text: str, columns: Optional[int] = None) -> GridSpec:
+    """Parse a JSON grid spec."""
+    try:
+        data = json.loads(text)
+    except ValueError as error:
+        raise GridError(f"Invalid JSON: {error}") from error
+    return load_grid(data, columns)
+
+
+def render_cell(cell: CellSpec, width: int, color_system: Optional[str]) -> List[str]:
+    """Render one panel at ``width`` cells into a list of ANSI rows."""
+    from rich import box as rich_box
+    from rich_gradient.panel import Panel
+
+    from .common import parse_style
+
+    panel = Panel(
+        cell.text,
+        colors=list(cell.colors) or None,
+        rainbow=cell.rainbow,
+        bg_colors=list(cell.bg_colors) or None,
+        title=cell.title,
+        title_style=parse_style(cell.title_style),
+        subtitle=cell.subtitle,
+        style=parse_style(cell.style),
+        border_style=parse_style(cell.border_style),
+        text_justify=cell.justify,  # type: ignore[arg-type]
+        expand=True,
+        width=width,
+        box=getattr(rich_box, cell.box),
+    )
+    render_console = Console(
+        file=io.StringIO(),
+        width=width,
+        color_system=color_system,  # type: ignore[arg-type]
+        force_terminal=color_system is not None,
+        legacy_windows=False,
+    )
+    lines = render_console.render_lines(
+        panel, render_console.options, pad=True, new_lines=False
+    )
+    return [segments_to_ansi(line, color_system) for line in lines]
+
+
+class GridRenderer:
+    """Compose grid frames, re-rendering only panels that changed.
+
+    With an ``executor``, panels that need rendering are rendered in
+    parallel; cell buffers are kept for the panels of the last frame.
+    """
+
+    def __init__(
+        self, color_system: Optional[str], executor: Optional[Executor] = None
+    ) -> None:
+        self.color_system = color_system
+        self.executor = executor
+        self.renders = 0
+        self._cells: Dict[Tuple[CellSpec, int], List[str]] = {}
+
+    @staticmethod
+    def cell_width(grid: GridSpec, width: int) -> int:
+        """Return the width of each column for a frame ``width`` cells wide."""
+        usable = width - grid.gap * (grid.columns - 1)
+        return max(usable // grid.columns, MIN_CELL_WIDTH)
+
+    def _render(self, keys: List[Tuple[CellSpec, int]]) -> List[List[str]]:
+        cells = [cell for cell, _width in keys]
+        widths = [width for _cell, width in keys]
+        if self.executor is not None and len(keys) > 1:
+            return list(
+                self.executor.map(render_cell, cells, widths, repeat(self.color_system))
+            )
+        return [
+            render_cell(cell, width, self.color_system)
+            for cell, width in zip(cells, widths)
+        ]
+
+    def frame(self, grid: GridSpec, width: int) -> str:
+        """Return the whole grid as one ANSI string (no trailing newline)."""
+        cell_width = self.cell_width(grid, width)
+        keys = [(cell, cell_width) for cell in grid.cells]
+        missing = [key for key in dict.fromkeys(keys) if key not in self._cells]
+        rendered = dict(zip(missing, self._render(missing)))
+        self.renders += len(missing)
+        _CELL_HITS.inc(len(keys) - len(missing))
+        _CELL_MISSES.inc(len(missing))
+        buffers = {key: self._cells.get(key) or rendered[key] for key in keys}
+        self._cells = buffers
+
+        blank = " " * cell_width
+        gap = " " * grid.gap
+        rows: List[str] = []
+        for start in range(0, len(keys), grid.columns):
+            group = [buffers[key] for key in keys[start : start + grid.columns]]
+            height = max(len(lines) for lines in group)
+            for index in range(height):
+                rows.append(
+                    gap.join(
+                        lines[index] if index < len(lines) else blank for lines in group
+                    )
+                )
+        return "\n".join(rows)
+
+
+__all__ = [
+    "CellSpec",
+    "GridError",
+    "GridRenderer",
+    "GridSpec",
+    "load_grid",
+    "parse_grid",
+    "render_cell",
+]
@@ -0,0 +1,169 @@
+"""Grid dashboard command wiring for the CLI."""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Literal, Optional, Tuple
+
+from rich.console import Console
+
+import typer
+
+from .blocks import default_jobs, make_executor
+from .common import get_console
+from .grid import GridError, GridRenderer, GridSpec, parse_grid
+from .live import terminal_width
+from .metrics import BYTES_WRITTEN, FRAME_SECONDS, RENDERS, exporting
+
+_HOME_CLEAR = "\x1b[H\x1b[2J"
+
+
+def _load(spec: str, columns: Optional[int]) -> GridSpec:
+    """Read and parse the spec file, raising ``BadParameter`` on bad input."""
+    try:
+        return parse_grid(Path(spec).read_text(encoding="utf-8"), columns)
+    except (OSError, GridError) as error:
+        raise typer.BadParameter(str(error), param_hint="'SPEC'") from error
+
+
+def grid_command(
+    spec: str = typer.Argument(..., metavar="SPEC"),
+    columns: Optional[int] = typer.Option(
+        None,
+        "--columns",
+        metavar="COLUMNS",
+        min=1,
+        help="Number of columns. [dim]Overrides the spec; defaults to a near-square grid.[/]",
+    ),
+    width: Optional[int] = typer.Option(
+        None,
+        "--width",
+        metavar="WIDTH",
+        min=1,
+        help="Total width of the grid. [dim]Defaults to the terminal width.[/]",
+    ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        help=(
+            "Keep running and redraw when the spec changes. [dim]A file is polled every "
+            "--interval seconds; stdin is read as one JSON spec per line.[/]"
+        ),
+    ),
+    interval: float = typer.Option(
+        1.0,
+        "--interval",
+        metavar="SECONDS",
+        min=0.05,
+        help="Polling interval for --watch on a spec file.",
+        show_default=True,
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        metavar="JOBS",
+        min=0,
+        help=(
+            "Render panels across JOBS workers. [dim]0 uses every core; 1 renders "
+            "serially without starting a pool.[/]"
+        ),
+        show_default=True,
+    ),
+    executor: Literal["auto", "thread", "process"] = typer.Option(
+        "auto",
+        "--executor",
+        metavar="EXECUTOR",
+        help=(
+            "Worker pool for --jobs. [lime](auto, thread, process)[/] [dim]auto uses "
+            "threads on free-threaded Python and processes otherwise.[/]"
+        ),
+        show_default=True,
+        case_sensitive=False,
+    ),
+) -> None:
+    """Lay out a JSON spec of gradient panels in rows and columns.
+
+    SPEC is a JSON file (or [bold]-[/] for stdin) holding a list of panels, or an
+    object with [bold]panels[/], [bold]columns[/] and [bold]gap[/]. A panel is a
+    string or an object with [bold]text[/], [bold]title[/], [bold]subtitle[/],
+    [bold]colors[/], [bold]bg_colors[/], [bold]rainbow[/], [bold]box[/],
+    [bold]justify[/] and style keys.
+    """
+    console = get_console()
+    workers = jobs if jobs > 0 else default_jobs()
+    write, flush = console.file.write, console.file.flush
+    renders, written = RENDERS.labels("grid"), BYTES_WRITTEN.labels("grid")
+    frame_seconds = FRAME_SECONDS.labels("grid")
+    with (
+        make_executor(workers, executor) if workers > 1 else nullcontext() as pool,
+        exporting() if watch else nullcontext(),
+    ):
+        renderer = GridRenderer(console.color_system, pool)
+
+        def draw(grid: GridSpec, clear: bool) -> None:
+            start = time.perf_counter()
+            frame = (_HOME_CLEAR if clear else "") + renderer.frame(
+                grid, width or terminal_width()
+            )
+            write(frame + "\n")
+            flush()
+            frame_seconds.observe(time.perf_counter() - start)
+            renders.inc()
+            written.inc(len(frame.encode("utf-8")) + 1)
+
+        if spec == "-" and watch:
+            clear = console.is_terminal
+            try:
+                for line in sys.stdin:
+                    if not line.strip():
+                        continue
+                    try:
+                        draw(parse_grid(line, columns), clear)
+                    except GridError as error:
+                        Console(stderr=True).print(f"[red]Skipped spec:[/] {error}")
+            except KeyboardInterrupt:
+                pass
+            return
+        if spec == "-":
+            try:
+                grid = parse_grid(typer.get_text_stream("stdin").read(), columns)
+            except GridError as error:
+                raise typer.BadParameter(str(error), param_hint="'SPEC'") from error
+            draw(grid, False)
+            return
+
+        grid = _load(spec, columns)
+        if not watch:
+            draw(grid, False)
+            return
+        seen: Tuple[float, int, int] = (-1.0, -1, -1)
+        try:
+            while True:
+                try:
+                    stat = os.stat(spec)
+                except OSError:
+                    stat = None
+                current = (
+                    stat.st_mtime if stat else seen[0],
+                    stat.st_size if stat else seen[1],
+                    width or terminal_width(),
+                )
+                if current != seen:
+                    seen = current
+                    try:
+                        grid = parse_grid(
+                            Path(spec).read_text(encoding="utf-8"), columns
+                        )
+                    except (OSError, GridError):
+                        pass  # keep the last good grid while the file is rewritten
+                    draw(grid, console.is_terminal)
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+
+__all__ = ["grid_command"]
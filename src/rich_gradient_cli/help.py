@@ -5,7 +5,7 @@ from __future__ import annotations
 import io
 import re
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
 
 import click
 from rich import box
@@ -23,6 +23,7 @@ from .common import (
     USAGE_PREFIX,
     USAGE_PROG_STYLE,
 )
+from .options import shared_params
 
 
 @dataclass(frozen=True)
@@ -160,6 +161,7 @@ def _build_commands_table(group: click.Group) -> Optional[Table]:
 
 def render_help(command: click.Command, ctx: click.Context) -> str:
     """Render help text for a Click command using Rich for formatting."""
+
     console = Console(
         record=True,
         force_terminal=True,
@@ -227,7 +229,17 @@ def render_help(command: click.Command, ctx: click.Context) -> str:
 
 
 class RichTyperCommand(TyperCommand):
-    """Custom TyperCommand that uses Rich for help rendering."""
+    """Custom TyperCommand that uses Rich for help rendering.
+
+    Options declared with ``shared_options`` are compiled from their specs
+    and spliced in.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        specs = getattr(self.callback, "__shared_options__", ())
+        if specs:
+            self.params = shared_params(self.params, specs)
 
     def get_help(self, ctx: click.Context) -> str:  # type: ignore[override]
         """Return Rich-rendered help text for this command."""
@@ -0,0 +1,224 @@
+"""HTML export with class names shared through one external stylesheet.
+
+Every distinct style becomes a class named after its CSS values, such as
+``g-ff8800`` or ``g-ff8800-on-001122-b``, so the same color gets the same
+class in every export and every process. Fragments hold only ``<span class>`` runs, and each export
+merges the rules it used into a shared stylesheet, which keeps a report of
+many snippets dominated by its text rather than repeated inline styles.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+from html import escape
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from rich.console import Console, RenderableType
+from rich.segment import Segment
+from rich.style import Style
+from rich.terminal_theme import TerminalTheme
+from rich.text import Text
+
+CSS_NAME = "gradient.css"
+PRE_CLASS = "rich-gradient"
+_BASE_RULE = f"pre.{PRE_CLASS}{{font-family:monospace;line-height:1.25}}"
+_VISIBLE_ON_BLANK = ("bgcolor", "underline", "strike", "reverse", "overline")
+_NAME_TOKENS = {
+    "font-weight:bold": "b",
+    "font-style:italic": "i",
+    "text-decoration:underline": "u",
+    "text-decoration:line-through": "s",
+    "text-decoration:overline": "o",
+}
+
+
+class StyleClasses:
+    """Intern Rich styles as CSS classes named after their values."""
+
+    def __init__(self, theme: Optional[TerminalTheme] = None) -> None:
+        if theme is None:
+            from rich_gradient.theme import GRADIENT_TERMINAL_THEME
+
+            theme = GRADIENT_TERMINAL_THEME
+        self.theme = theme
+        self.rules: Dict[str, str] = {}
+        self._names: Dict[Style, str] = {}
+
+    def name(self, style: Style) -> str:
+        """Return the class for ``style``, or an empty string when unstyled."""
+        name = self._names.get(style)
+        if name is None:
+            declarations = _declarations(style, self.theme)
+            if declarations:
+                name = _class_name(declarations)
+                rule = f".{name}{{{declarations}}}"
+                if self.rules.setdefault(name, rule) != rule:
+                    raise ValueError(f"CSS class {name} names two different styles.")
+            else:
+                name = ""
+            self._names[style] = name
+        return name
+
+
+def _declarations(style: Style, theme: TerminalTheme) -> str:
+    """Return compact CSS declarations, leaving default colors to the page."""
+    color = style.color if style.color and not style.color.is_default else None
+    bgcolor = style.bgcolor
+    if bgcolor is not None and bgcolor.is_default:
+        bgcolor = None
+    plain = style.without_color + Style(color=color, bgcolor=bgcolor)
+    decorated = style.underline or style.strike or style.overline
+    return ";".join(
+        part.strip().replace(": ", ":")
+        for part in plain.get_html_style(theme).split(";")
+        if part and (decorated or "text-decoration-color" not in part)
+    )
+
+
+def _class_name(declarations: str) -> str:
+    """Spell ``declarations`` as a class name: colors by hex, flags by letter.
+
+    ``text-decoration-color`` always repeats ``color`` and is left out.
+    Anything unexpected falls back to a 64-bit digest of the declaration.
+    """
+    tokens = ["g"]
+    for declaration in declarations.split(";"):
+        prop, _, value = declaration.partition(":")
+        if prop == "color":
+            tokens.append(value.lstrip("#"))
+        elif prop == "background-color":
+            tokens.extend(("on", value.lstrip("#")))
+        elif prop != "text-decoration-color":
+            digest = hashlib.blake2s(declaration.encode(), digest_size=8)
+            tokens.append(_NAME_TOKENS.get(declaration) or "x" + digest.hexdigest())
+    return "-".join(tokens)
+
+
+def _blank_safe(style: Optional[Style]) -> bool:
+    """Return True when blanks look the same in ``style`` as unstyled."""
+    if style is None:
+        return True
+    return not style.link and not any(
+        getattr(style, attr) for attr in _VISIBLE_ON_BLANK
+    )
+
+
+def segments_to_html(segments: Iterable[Segment], classes: StyleClasses) -> str:
+    """Encode segments as ``<span class>`` runs, merging equal neighbours.
+
+    Spaces and newlines whose only styling is a foreground color look the
+    same unstyled, so they join the current run when its style is also
+    invisible on blanks and are written unstyled otherwise. Gradient-colored
+    padding therefore does not open a span per cell.
+    """
+    parts: List[str] = []
+    run: List[str] = []
+    current: Tuple[str, Optional[str]] = ("", None)
+    current_safe = True
+
+    def close() -> None:
+        name, link = current
+        text = "".join(run)
+        run.clear()
+        if not text:
+            return
+        if name:
+            text = f'<span class="{name}">{text}</span>'
+        if link:
+            text = f'<a href="{escape(link)}">{text}</a>'
+        parts.append(text)
+
+    for text, style, control in Segment.simplify(segments):
+        if control or not text:
+            continue
+        escaped = escape(text, quote=False)
+        if _blank_safe(style) and not text.strip(" \n"):
+            if current_safe:
+                run.append(escaped)
+                continue
+            style = None
+        key = (classes.name(style), style.link) if style else ("", None)
+        if key != current:
+            close()
+            current = key
+            current_safe = _blank_safe(style)
+        run.append(escaped)
+    close()
+    return "".join(parts)
+
+
+def merge_stylesheet(path: Path, rules: Iterable[str]) -> None:
+    """Add ``rules`` to the stylesheet at ``path``, keeping one sorted copy each.
+
+    The file is locked while it is merged so exports running in parallel
+    all land in the same stylesheet.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+", encoding="utf-8") as handle:
+        try:
+            import fcntl
+
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        except ImportError:  # pragma: no cover - Windows
+            pass
+        handle.seek(0)
+        existing: Set[str] = {line for line in handle.read().splitlines() if line}
+        merged = existing | set(rules) | {_BASE_RULE}
+        if merged == existing:
+            return
+        handle.seek(0)
+        handle.truncate()
+        body = sorted(merged - {_BASE_RULE})
+        handle.write("\n".join([_BASE_RULE, *body]) + "\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+def export_html(
+    renderable: RenderableType,
+    html_path: str,
+    *,
+    css_path: Optional[str] = None,
+    width: Optional[int] = None,
+    end: str = "\n",
+    no_wrap: bool = False,
+) -> Path:
+    """Write ``renderable`` as an HTML fragment and merge its classes into CSS.
+
+    The stylesheet defaults to ``gradient.css`` beside the fragment. Returns
+    the stylesheet path.
+    """
+    html_console = Console(
+        file=io.StringIO(),
+        force_terminal=True,
+        color_system="truecolor",
+        width=width,
+    )
+    if isinstance(renderable, Text):
+        # Console.print joins text with ``end`` the same way.
+        renderable = Text(end=end).join([renderable])
+    lines = Segment.split_and_crop_lines(
+        html_console.render(renderable, html_console.options.update(no_wrap=no_wrap)),
+        html_console.width,
+        pad=False,
+    )
+    segments = [segment for line in lines for segment in line]
+    classes = StyleClasses()
+    body = segments_to_html(segments, classes)
+    target = Path(html_path)
+    stylesheet = Path(css_path) if css_path else target.with_name(CSS_NAME)
+    merge_stylesheet(stylesheet, classes.rules.values())
+    target.write_text(f'<pre class="{PRE_CLASS}">{body}</pre>\n', encoding="utf-8")
+    return stylesheet
+
+
+__all__ = [
+    "CSS_NAME",
+    "StyleClasses",
+    "export_html",
+    "merge_stylesheet",
+    "segments_to_html",
+]
@@ -0,0 +1,123 @@
+"""Resident, resize-aware rendering for rules and panels.
+
+``run_live`` paints a renderable, then sleeps until ``SIGWINCH`` and paints
+again at the new width. A resize that lands while a frame is being painted
+is kept by ``ResizeWatch`` and wakes the next wait. Rendered frames are kept in an LRU keyed by width,
+so switching back to a recent size repaints from cache without touching the
+gradient or Rich layout.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from rich.console import Console, RenderableType
+
+from .common import get_console
+from .metrics import (
+    BYTES_WRITTEN,
+    CACHE_HITS,
+    CACHE_MISSES,
+    FRAME_SECONDS,
+    RENDERS,
+    exporting,
+)
+from .resize import ResizeWatch
+
+LIVE_CACHE_SIZE = 8
+
+_HOME_CLEAR = "\x1b[H\x1b[2J"
+_HIDE_CURSOR = "\x1b[?25l"
+_SHOW_CURSOR = "\x1b[?25h"
+
+_FRAME_HITS = CACHE_HITS.labels("live_frames")
+_FRAME_MISSES = CACHE_MISSES.labels("live_frames")
+
+
+class LayoutCache:
+    """LRU of a renderable's ANSI output keyed by terminal width."""
+
+    def __init__(
+        self,
+        renderable: RenderableType,
+        color_system: Optional[str],
+        maxsize: int = LIVE_CACHE_SIZE,
+    ) -> None:
+        self.renderable = renderable
+        self.color_system = color_system
+        self.maxsize = maxsize
+        self.renders = 0
+        self._frames: "OrderedDict[int, str]" = OrderedDict()
+
+    def __call__(self, width: int) -> str:
+        """Return the frame for ``width``, rendering it on a cache miss."""
+        frame = self._frames.get(width)
+        if frame is not None:
+            self._frames.move_to_end(width)
+            _FRAME_HITS.inc()
+            return frame
+        _FRAME_MISSES.inc()
+        buffer = io.StringIO()
+        Console(
+            file=buffer,
+            width=width,
+            color_system=self.color_system,  # type: ignore[arg-type]
+            force_terminal=self.color_system is not None,
+            legacy_windows=False,
+        ).print(self.renderable)
+        frame = buffer.getvalue().rstrip("\n")
+        self.renders += 1
+        self._frames[width] = frame
+        if len(self._frames) > self.maxsize:
+            self._frames.popitem(last=False)
+        return frame
+
+
+def terminal_width() -> int:
+    """Return the current width of the terminal behind the shared console."""
+    console = get_console()
+    try:
+        return os.get_terminal_size(console.file.fileno()).columns
+    except (AttributeError, OSError, ValueError):
+        return console.width
+
+
+def run_live(
+    renderable: RenderableType,
+    maxsize: int = LIVE_CACHE_SIZE,
+    *,
+    command: str = "live",
+) -> None:
+    """Paint ``renderable`` and repaint it on every resize until interrupted.
+
+    Frames are counted in the metrics registry under ``command``.
+    """
+    console = get_console()
+    layouts = LayoutCache(renderable, console.color_system, maxsize)
+    write, flush = console.file.write, console.file.flush
+    renders, written = RENDERS.labels(command), BYTES_WRITTEN.labels(command)
+    frame_seconds = FRAME_SECONDS.labels(command)
+    write(_HIDE_CURSOR)
+    try:
+        with exporting(), ResizeWatch() as resizes:
+            while True:
+                start = time.perf_counter()
+                frame = _HOME_CLEAR + layouts(terminal_width())
+                write(frame)
+                flush()
+                frame_seconds.observe(time.perf_counter() - start)
+                renders.inc()
+                written.inc(len(frame.encode("utf-8")))
+                resizes.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        write(_SHOW_CURSOR + "\n")
+        flush()
+
+
+__all__ = ["LIVE_CACHE_SIZE", "LayoutCache", "run_live", "terminal_width"]
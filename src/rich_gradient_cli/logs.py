@@ -0,0 +1,166 @@
+"""Regex-driven gradient colorizer for log streams.
+
+All rules are compiled into a single alternation so each chunk of input is
+scanned once. Matched tokens are painted with their rule's gradient using
+escape prefixes looked up from a per-length table, and painted tokens are
+memoized because levels, loggers and keys repeat on almost every line.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .colors import resolve_color
+from .lut import Stops
+from .sgr import paint_bytes
+
+TOKEN_CACHE_SIZE = 4096
+
+
+class LogRule(NamedTuple):
+    """A named regex whose matches are painted with a gradient."""
+
+    name: str
+    pattern: str
+    colors: Tuple[str, ...]
+
+
+DEFAULT_RULES: Tuple[LogRule, ...] = (
+    LogRule("critical", r"\b(?:CRITICAL|FATAL|PANIC)\b", ("#ff0044", "#ff00ff")),
+    LogRule("error", r"\b(?:ERROR|ERR)\b", ("#ff2200", "#ff0077")),
+    LogRule("warning", r"\b(?:WARNING|WARN)\b", ("#ffdd00", "#ff7700")),
+    LogRule("info", r"\bINFO\b", ("#00ff88", "#00ccff")),
+    LogRule("debug", r"\b(?:DEBUG|TRACE)\b", ("#7777ff", "#bb66ff")),
+    LogRule(
+        "request_id",
+        r"\b(?:(?i:req(?:uest)?[-_]?id[=:])[^\s,;]+"
+        r"|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b)",
+        ("#ff9900", "#ffee00"),
+    ),
+    LogRule(
+        "logger",
+        r"\b[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)+\b",
+        ("#00aaff", "#aa55ff"),
+    ),
+)
+
+
+def load_rules(path: Union[str, Path]) -> Tuple[LogRule, ...]:
+    """Load rules from a JSON list of ``{"name", "pattern", "colors"}`` objects.
+
+    ``colors`` may be a list or a comma-separated string.
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    rules = []
+    for entry in data:
+        colors = entry["colors"]
+        if isinstance(colors, str):
+            colors = [color.strip() for color in colors.split(",") if color.strip()]
+        rules.append(LogRule(entry["name"], entry["pattern"], tuple(colors)))
+    return tuple(rules)
+
+
+def _has_top_level_branch(pattern: str) -> bool:
+    """Return True if ``pattern`` contains a ``|`` outside groups and classes."""
+    depth = 0
+    in_class = escaped = False
+    for character in pattern:
+        if escaped:
+            escaped = False
+        elif character == "\\":
+            escaped = True
+        elif in_class:
+            in_class = character != "]"
+        elif character == "[":
+            in_class = True
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif character == "|" and depth == 0:
+            return True
+    return False
+
+
+def compile_rules(rules: Sequence[LogRule]) -> bytes:
+    """Join rules into one alternation of ``_ruleN`` groups.
+
+    When every rule starts with ``\\b`` the boundary is factored out of the
+    alternation, so positions inside words are rejected once rather than once
+    per rule.
+    """
+    patterns = [rule.pattern for rule in rules]
+    factored = all(
+        pattern.startswith(r"\b") and not _has_top_level_branch(pattern)
+        for pattern in patterns
+    )
+    if factored:
+        patterns = [pattern[2:] for pattern in patterns]
+    joined = "|".join(
+        f"(?P<_rule{index}>{pattern})" for index, pattern in enumerate(patterns)
+    )
+    return (rf"\b(?:{joined})" if factored else joined).encode("utf-8")
+
+
+class LogColorizer:
+    """Paint rule matches in chunks of raw log bytes."""
+
+    def __init__(self, rules: Sequence[LogRule], color_system: Optional[str]) -> None:
+        if not rules:
+            raise ValueError("At least one rule is required.")
+        self.rules = tuple(rules)
+        self.color_system = color_system
+        self._stops: List[Stops] = [
+            tuple(tuple(resolve_color(color)) for color in rule.colors)  # type: ignore[misc]
+            for rule in self.rules
+        ]
+        self._pattern = re.compile(compile_rules(self.rules), re.MULTILINE)
+        self._rule_of = {
+            number: int(name[5:])
+            for name, number in self._pattern.groupindex.items()
+            if name.startswith("_rule")
+        }
+        self._tokens: Dict[Tuple[int, bytes], bytes] = {}
+
+    def paint(self, rule: int, token: bytes) -> bytes:
+        """Return ``token`` painted with the gradient of rule number ``rule``."""
+        key = (rule, token)
+        painted = self._tokens.get(key)
+        if painted is not None:
+            return painted
+        color_system = self.color_system
+        if color_system is None:
+            return token
+        painted = paint_bytes(token, self._stops[rule], color_system)
+        if len(self._tokens) >= TOKEN_CACHE_SIZE:
+            self._tokens.clear()
+        self._tokens[key] = painted
+        return painted
+
+    def _replace(self, match: "re.Match[bytes]") -> bytes:
+        token = match.group()
+        if match.lastindex is None:  # pragma: no cover - every rule is a group
+            return token
+        rule = self._rule_of[match.lastindex]
+        painted = self._tokens.get((rule, token))
+        if painted is None:
+            painted = self.paint(rule, token)
+        return painted
+
+    def colorize(self, chunk: bytes) -> bytes:
+        """Colorize a chunk of complete lines."""
+        if self.color_system is None or not chunk:
+            return chunk
+        return self._pattern.sub(self._replace, chunk)
+
+
+__all__ = [
+    "DEFAULT_RULES",
+    "LogColorizer",
+    "LogRule",
+    "compile_rules",
+    "load_rules",
+]
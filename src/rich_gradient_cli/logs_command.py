@@ -0,0 +1,95 @@
+"""Log colorizer command wiring for the CLI."""
+
+from __future__ import annotations
+
+import re
+import time
+from typing import Optional
+
+from rich.console import Console
+
+import typer
+
+from .common import get_console
+from .logs import DEFAULT_RULES, LogColorizer, load_rules
+from .metrics import BYTES_WRITTEN, RENDERS, exporting
+
+READ_SIZE = 1 << 20
+
+
+def logs_command(
+    rules: Optional[str] = typer.Option(
+        None,
+        "--rules",
+        metavar="RULES",
+        help=(
+            "JSON file of rules replacing the defaults. [dim](a list of objects with "
+            '"name", "pattern" and "colors")[/]'
+        ),
+    ),
+    stats: bool = typer.Option(
+        False,
+        "--stats",
+        help="Report lines, bytes and throughput on stderr when input ends.",
+    ),
+) -> None:
+    """Colorize log lines from stdin with a gradient per matching rule.
+
+    The default rules cover log levels, dotted logger names and request ids.
+    """
+    console = get_console()
+    try:
+        colorizer = LogColorizer(
+            load_rules(rules) if rules else DEFAULT_RULES, console.color_system
+        )
+    except (OSError, ValueError, KeyError, re.error) as error:
+        raise typer.BadParameter(str(error), param_hint="'--rules'") from error
+
+    source = typer.get_binary_stream("stdin")
+    sink = typer.get_binary_stream("stdout")
+    read = getattr(source, "read1", source.read)
+    pending = b""
+    lines = total = 0
+    rendered, written = RENDERS.labels("logs"), BYTES_WRITTEN.labels("logs")
+    started = time.perf_counter()
+    try:
+        with exporting():
+            while True:
+                data = read(READ_SIZE)
+                if not data:
+                    break
+                total += len(data)
+                cut = data.rfind(b"\n") + 1
+                if not cut:
+                    pending += data
+                    continue
+                chunk, pending = pending + data[:cut], data[cut:]
+                count = chunk.count(b"\n")
+                lines += count
+                out = colorizer.colorize(chunk)
+                sink.write(out)
+                sink.flush()
+                rendered.inc(count)
+                written.inc(len(out))
+            if pending:
+                lines += 1
+                out = colorizer.colorize(pending)
+                sink.write(out)
+                sink.flush()
+                rendered.inc()
+                written.inc(len(out))
+    except BrokenPipeError:
+        return
+    except KeyboardInterrupt:
+        pass
+    if stats:
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        megabytes = total / 1_000_000
+        Console(stderr=True).print(
+            f"[bold]{lines:,}[/] lines, [bold]{megabytes:,.1f}[/] MB in "
+            f"[bold]{elapsed:.2f}[/]s [dim]({megabytes / elapsed * 60:,.0f} MB/min, "
+            f"{lines / elapsed:,.0f} lines/s)[/]"
+        )
+
+
+__all__ = ["logs_command"]
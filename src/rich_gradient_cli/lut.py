@@ -0,0 +1,188 @@
+"""Gradient color math shared by the CLI's fast render paths.
+
+The helpers in this module reproduce the interpolation used by
+``rich_gradient`` so that paths which bypass Rich layout (parallel blocks,
+streaming, templates) emit exactly the colors the library would.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+Rgb = Tuple[int, int, int]
+Stops = Tuple[Rgb, ...]
+
+GAMMA = 2.2
+REPEAT_SCALE = 2.0
+
+ColumnTables = Callable[[int], Optional[Tuple[Rgb, ...]]]
+_TABLES: Dict[Stops, ColumnTables] = {}
+
+
+def _to_linear(value: float) -> float:
+    """Convert an sRGB channel (0-255) to linear light."""
+    return (value / 255.0) ** GAMMA
+
+
+def _to_srgb(value: float) -> float:
+    """Convert a linear light channel back to sRGB (0-255)."""
+    return (value ** (1.0 / GAMMA)) * 255.0
+
+
+@lru_cache(maxsize=256)
+def linear_stops(stops: Stops) -> Tuple[Tuple[float, float, float], ...]:
+    """Return the color stops converted to linear light."""
+    return tuple((_to_linear(r), _to_linear(g), _to_linear(b)) for r, g, b in stops)
+
+
+def text_color_at(index: int, length: int, stops: Stops) -> Rgb:
+    """Return the color of character ``index`` in a text of ``length`` characters.
+
+    Mirrors ``rich_gradient.text.Text.interpolate_colors``.
+    """
+    if len(stops) == 1:
+        return stops[0]
+    linear = linear_stops(stops)
+    segments = len(stops) - 1
+    pos = index / (length - 1) if length > 1 else 0.0
+    fidx = pos * segments
+    idx = int(fidx)
+    if idx >= segments:
+        idx = segments - 1
+        t = 1.0
+    else:
+        t = fidx - idx
+    (r0, g0, b0), (r1, g1, b1) = linear[idx], linear[idx + 1]
+    return (
+        int(_to_srgb(r0 + (r1 - r0) * t)),
+        int(_to_srgb(g0 + (g1 - g0) * t)),
+        int(_to_srgb(b0 + (b1 - b0) * t)),
+    )
+
+
+def text_colors(
+    stops: Stops, length: int, start: int = 0, stop: Optional[int] = None
+) -> List[Rgb]:
+    """Return the text gradient colors for characters ``start`` to ``stop``.
+
+    This is the hot loop of the parallel and streaming paths, so it inlines
+    ``text_color_at`` while keeping the exact same arithmetic.
+    """
+    end = length if stop is None else min(stop, length)
+    if start >= end:
+        return []
+    if len(stops) == 1 or length <= 1:
+        return [text_color_at(0, length, stops)] * (end - start)
+    linear = linear_stops(stops)
+    segments = len(stops) - 1
+    denominator = length - 1
+    inverse = 1.0 / GAMMA
+    colors: List[Rgb] = []
+    append = colors.append
+    for index in range(start, end):
+        fidx = (index / denominator) * segments
+        idx = int(fidx)
+        if idx >= segments:
+            idx = segments - 1
+            t = 1.0
+        else:
+            t = fidx - idx
+        r0, g0, b0 = linear[idx]
+        r1, g1, b1 = linear[idx + 1]
+        append(
+            (
+                int(((r0 + (r1 - r0) * t) ** inverse) * 255.0),
+                int(((g0 + (g1 - g0) * t) ** inverse) * 255.0),
+                int(((b0 + (b1 - b0) * t) ** inverse) * 255.0),
+            )
+        )
+    return colors
+
+
+def mirror_stops(stops: Stops) -> Stops:
+    """Extend stops with their reverse so a repeating gradient loops smoothly.
+
+    Mirrors the stop handling of ``rich_gradient.gradient.Gradient``.
+    """
+    if len(stops) > 2:
+        return stops + tuple(reversed(stops[:-1]))
+    return stops
+
+
+def fraction_color(frac: float, stops: Stops) -> Rgb:
+    """Interpolate ``stops`` at ``frac`` (0.0-1.0) in linear light."""
+    if frac <= 0:
+        return stops[0]
+    if frac >= 1:
+        return stops[-1]
+    linear = linear_stops(stops)
+    segment_count = len(stops) - 1
+    pos = frac * segment_count
+    idx = int(pos)
+    t = pos - idx
+    (r0, g0, b0) = linear[idx]
+    (r1, g1, b1) = linear[min(idx + 1, segment_count)]
+    return (
+        int(_to_srgb(r0 + (r1 - r0) * t)),
+        int(_to_srgb(g0 + (g1 - g0) * t)),
+        int(_to_srgb(b0 + (b1 - b0) * t)),
+    )
+
+
+@lru_cache(maxsize=64)
+def column_lut(
+    stops: Stops, span: int, repeat_scale: float = REPEAT_SCALE
+) -> Tuple[Rgb, ...]:
+    """Return the column gradient used by panels and rules for a given width.
+
+    The table is indexed by ``2 * column + cell_width`` so that both narrow
+    and wide glyphs resolve to the color at their cell center, matching
+    ``rich_gradient.gradient.Gradient``.
+    """
+    if repeat_scale == REPEAT_SCALE and stops in _TABLES:
+        stored = _TABLES[stops](span)
+        if stored is not None:
+            return stored
+    mirrored = mirror_stops(stops)
+    if len(mirrored) == 1:
+        mirrored = (mirrored[0], mirrored[0])
+    total = span * repeat_scale
+    lut: List[Rgb] = []
+    for half_cells in range(2 * span + 3):
+        frac = (half_cells / 2) / total if total > 0 else 0.0
+        lut.append(fraction_color(frac % 1.0, mirrored))
+    return tuple(lut)
+
+
+def register_tables(stops: Stops, tables: ColumnTables) -> None:
+    """Let ``column_lut`` take ``stops``' tables from ``tables(span)`` when stored."""
+    _TABLES[stops] = tables
+
+
+def hex_color(rgb: Rgb) -> str:
+    """Format an RGB triple as a hex color string."""
+    return "#{:02x}{:02x}{:02x}".format(*rgb)
+
+
+def stops_from(colors: Optional[Sequence[Any]], hues: int, rainbow: bool) -> Stops:
+    """Resolve CLI color arguments into RGB stops the way ``rich_gradient`` does."""
+    from rich_gradient.text import Text
+
+    parsed = Text.parse_colors(list(colors) if colors else None, hues, rainbow)
+    return tuple(tuple(color.get_truecolor()) for color in parsed)  # type: ignore[misc]
+
+
+__all__ = [
+    "Rgb",
+    "Stops",
+    "column_lut",
+    "fraction_color",
+    "hex_color",
+    "linear_stops",
+    "mirror_stops",
+    "register_tables",
+    "stops_from",
+    "text_color_at",
+    "text_colors",
+]
@@ -2,60 +2,56 @@
 
 from __future__ import annotations
 
-from typing import Any, Literal, Optional, cast
+from typing import Any, List, Literal, Optional, cast
 
-import typer
+import click
 from rich.align import AlignMethod, VerticalAlignMethod
+from rich.markdown import Markdown as RichMarkdown
+
+import typer
 
-from rich_gradient.animated_markdown import AnimatedMarkdown
-from rich_gradient.markdown import Markdown
+from .common import color_enabled, export_svg, get_console, parse_style
+from .html_export import export_html
+from .lut import Stops, hex_color
+from .options import (
+    BGCOLORS,
+    COLORS,
+    CSS,
+    END,
+    HTML,
+    HUES,
+    RAINBOW,
+    SEED,
+    SVG,
+    SVG_MINIFY,
+    SVGZ,
+    THEME,
+    GradientOptions,
+    shared_options,
+)
+from .pager import MarkdownRows, Pager
+from .plain import PlainLayout
+from .sgr import segments_to_ansi
 
-from .common import console, export_svg, parse_colors, parse_style
+MARKDOWN_HUES = HUES.replace(default=7)
 
 
+@shared_options(
+    COLORS,
+    BGCOLORS,
+    RAINBOW,
+    MARKDOWN_HUES,
+    SEED,
+    THEME,
+    END,
+    SVG,
+    SVGZ,
+    SVG_MINIFY,
+    HTML,
+    CSS,
+)
 def markdown_command(
     markdown: str = typer.Argument(..., metavar="MARKDOWN"),
-    colors: Optional[str] = typer.Option(
-        None,
-        "-c",
-        "--colors",
-        metavar="COLORS",
-        help=(
-            "Comma-separated list of colors for the gradient. [dim](e.g., "
-            "`[/][red]red[/][dim], [/][#ff9900]#ff9900[/][dim], [/][yellow]yellow[/][dim]`). "
-            "If no colors are provided, the color stops are automatically generated."
-        ),
-    ),
-    bgcolors: Optional[str] = typer.Option(
-        None,
-        "--bgcolors",
-        metavar="BGCOLORS",
-        help=(
-            "Comma-separated list of background colors for the gradient. [dim](e.g., "
-            "`[/][red]red[/][dim], [/][#ff9900]#ff9900[/][dim], [/][#ff0]#ff0[/][dim]`). "
-            "Defaults to [/][bold #fff]transparent[/][dim].[/dim]"
-        ),
-    ),
-    rainbow: bool = typer.Option(
-        False,
-        "-r",
-        "--rainbow",
-        help="[#ff0000]U[/][#ff3b00]s[/][#ff5100]e[/][#ff7400] [/]\
-[#ff9000]r[/][#ffa900]a[/][#ffc000]i[/][#ffd700]n[/]\
-[#ffee00]b[/][#f7ff00]o[/][#d3ff00]w[/][#a7ff00] [/] \
-[#7dff00]c[/][#2eff00]o[/][#00ff64]l[/][#00ff8e]o[/][#00ffc0]r[/]\
-[#00ffec]s[/][#00f4ff] [/][#00ddff]f[/][#00c5ff]o[/][#00afff]r[/]\
-[#1596ff] [/][#3b81ff]t[/][#4e67ff]h[/][#675fff]e[/][#7b57ff] [/]\
-[#924bff]g[/][#a73bff]r[/][#c72cff]a[/][#eb1cff]d[/][#ff00f2]i[/]\
-[#ff00ce]e[/][#ff00a4]n[/][#ff0084]t[/][#ff0054].[/]",
-    ),
-    hues: int = typer.Option(
-        7,
-        "--hues",
-        metavar="HUES",
-        help="The number of hues to use for a random gradient.",
-        show_default=True,
-    ),
     style: Optional[str] = typer.Option(
         None,
         "--style",
@@ -88,14 +84,6 @@ def markdown_command(
         help="Disable wrapping of markdown text.",
         show_default=True,
     ),
-    end: str = typer.Option(
-        "\n",
-        "--end",
-        metavar="END",
-        help=(
-            "String appended after the text is printed. [dim]\\[default: '\\n'][/dim]"
-        ),
-    ),
     animate: bool = typer.Option(
         False,
         "--animate",
@@ -108,21 +96,30 @@ def markdown_command(
         metavar="DURATION",
         help="Duration of the animation in seconds (only used if --animate).",
     ),
-    svg: Optional[str] = typer.Option(
-        None,
-        "--svg",
-        metavar="SVG",
-        help="Save output as an SVG file.",
+    pager: bool = typer.Option(
+        False,
+        "--pager",
+        help=(
+            "Page through the document, rendering only the blocks on screen. "
+            "[dim]Blocks are rendered as you scroll to them.[/]"
+        ),
     ),
+    *,
+    gradient: GradientOptions,
+    end: str,
+    svg: Optional[str],
+    svgz: Optional[str],
+    svg_minify: bool,
+    html: Optional[str],
+    css: Optional[str],
 ) -> None:
     """Render markdown text with gradient colors in a rich console."""
+    console = get_console()
     if markdown == "-":
         markdown = typer.get_text_stream("stdin").read().rstrip("\n")
         if not markdown:
-            raise typer.UsageError("Missing markdown argument.")
+            raise click.UsageError("Missing markdown argument.")
 
-    _colors = parse_colors(colors)
-    _bgcolors = parse_colors(bgcolors)
     markdown_kwargs: dict[str, Any] = {}
     if style:
         markdown_kwargs["style"] = parse_style(style)
@@ -130,18 +127,40 @@ def markdown_command(
     justify_value = cast(AlignMethod, justify)
     vertical_value = cast(VerticalAlignMethod, vertical_justify)
 
-    if animate and svg:
-        raise typer.UsageError("--svg is not supported with --animate.")
+    export = bool(svg or svgz or html)
+    if animate and export:
+        raise click.UsageError(
+            "--svg, --svgz and --html are not supported with --animate."
+        )
+    if pager and (animate or export):
+        raise click.UsageError(
+            "--pager cannot be combined with --animate, --svg, --svgz or --html."
+        )
+    if pager and not console.is_terminal:
+        raise click.UsageError("--pager needs an interactive terminal.")
+    if not (export or animate or pager or color_enabled()):
+        plain = PlainLayout(
+            RichMarkdown(markdown, **markdown_kwargs),
+            justify=justify_value,
+            vertical=vertical_value,
+        )
+        console.print(plain, end=end, no_wrap=no_wrap)
+        return
+
+    from rich_gradient.markdown import Markdown
+
     if animate and console.is_terminal is True:
+        from rich_gradient.animated_markdown import AnimatedMarkdown
+
         console.clear()
         animated = AnimatedMarkdown(
             markdown,
-            colors=_colors,
-            rainbow=rainbow,
-            hues=hues,
+            colors=gradient.fg_list,
+            rainbow=gradient.rainbow,
+            hues=gradient.hues,
             justify=justify_value,
             vertical_justify=vertical_value,
-            bg_colors=_bgcolors,
+            bg_colors=gradient.bg_list,
             markdown_kwargs=markdown_kwargs or None,
             animate=True,
             duration=duration,
@@ -149,20 +168,75 @@ def markdown_command(
         animated.run()
         return
 
+    if pager:
+        _page_markdown(
+            markdown,
+            gradient.stops(),
+            gradient.bg_stops(),
+            justify=justify_value,
+            markdown_kwargs=markdown_kwargs,
+            no_wrap=no_wrap,
+        )
+        return
+
     md = Markdown(
         markdown,
-        colors=_colors,
-        rainbow=rainbow,
-        hues=hues,
+        colors=gradient.fg_list,
+        rainbow=gradient.rainbow,
+        hues=gradient.hues,
         justify=justify_value,
         vertical_justify=vertical_value,
-        bg_colors=_bgcolors,
+        bg_colors=gradient.bg_list,
         markdown_kwargs=markdown_kwargs or None,
     )
     if svg:
-        export_svg(md, svg, end=end, no_wrap=no_wrap)
+        export_svg(md, svg, end=end, no_wrap=no_wrap, minify=svg_minify)
+    if svgz:
+        export_svg(md, svgz, end=end, no_wrap=no_wrap, minify=True, compress=True)
+    if html:
+        export_html(md, html, css_path=css, end=end, no_wrap=no_wrap)
+    if export:
         return
     console.print(md, end=end, no_wrap=no_wrap)
 
 
+def _page_markdown(
+    markdown: str,
+    stops: Stops,
+    bg_stops: Optional[Stops],
+    *,
+    justify: AlignMethod,
+    markdown_kwargs: dict[str, Any],
+    no_wrap: bool,
+) -> None:
+    """Page through markdown, rendering top-level blocks as they come into view.
+
+    The gradient stops are resolved once so every block shares one palette.
+    The document is laid out again whenever the terminal changes width.
+    """
+    console = get_console()
+    color_system = console.color_system
+    colors = [hex_color(rgb) for rgb in stops]
+    bg_colors = [hex_color(rgb) for rgb in bg_stops] if bg_stops else None
+    from rich_gradient.markdown import Markdown
+
+    def source_at(columns: int) -> MarkdownRows:
+        options = console.options.update(width=columns, no_wrap=no_wrap)
+
+        def render(text: str) -> List[str]:
+            block = Markdown(
+                text,
+                colors=cast(Any, colors),
+                bg_colors=cast(Any, bg_colors),
+                justify=justify,
+                markdown_kwargs=markdown_kwargs or None,
+            )
+            rows = console.render_lines(block, options, pad=True, new_lines=False)
+            return [segments_to_ansi(row, color_system) for row in rows]
+
+        return MarkdownRows(markdown, render)
+
+    Pager(source_at(console.width), relayout=source_at).run()
+
+
 __all__ = ["markdown_command"]
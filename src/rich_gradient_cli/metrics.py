@@ -0,0 +1,415 @@
+"""Counters and histograms for the resident modes, exported for Prometheus.
+
+``--live``, ``grid --watch``, ``tail``, ``exec``, ``logs``, ``progress`` and
+``print --cycle`` can run for hours. They record into the process-wide
+``REGISTRY`` as they work. Recording is a couple of integer adds on
+preallocated slots, done only by the thread that renders, so it costs about
+the same whether or not anything reads it. The LRU caches in ``sgr`` are
+reported from ``cache_info()`` when scraped and cost nothing in between.
+
+``exporting()`` publishes the registry for the duration of a mode:
+``GRADIENT_METRICS_FILE`` names a Prometheus text file rewritten atomically
+every ``GRADIENT_METRICS_INTERVAL`` seconds (for node_exporter's textfile
+collector), and ``GRADIENT_METRICS_PORT`` starts an HTTP listener on
+``127.0.0.1`` serving ``/metrics``. With neither set nothing is started.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import click
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+FILE_ENVVAR = "GRADIENT_METRICS_FILE"
+PORT_ENVVAR = "GRADIENT_METRICS_PORT"
+INTERVAL_ENVVAR = "GRADIENT_METRICS_INTERVAL"
+DEFAULT_INTERVAL = 5.0
+LISTEN_HOST = "127.0.0.1"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+FRAME_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+LabelValues = Tuple[str, ...]
+
+
+class Counter:
+    """A monotonically increasing count."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value: float = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+
+class Gauge:
+    """A value that can go up and down, such as a queue depth."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value: float = 0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Histogram:
+    """Observations counted into fixed buckets, plus their sum and count."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Reading:
+    """A counter or gauge whose value is read from a callback at scrape time."""
+
+    __slots__ = ("read",)
+
+    def __init__(self, read: Callable[[], float]) -> None:
+        self.read = read
+
+    @property
+    def value(self) -> float:
+        return self.read()
+
+
+class Family:
+    """One metric name with a child per combination of label values."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        kind: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = FRAME_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self.children: Dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> Any:
+        """Return the child for ``values``; bind it once outside hot loops."""
+        child = self.children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} takes labels {self.labelnames}")
+            with self._lock:
+                child = self.children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    self.children[values] = child
+        return child
+
+    def bind(self, values: LabelValues, read: Callable[[], float]) -> None:
+        """Report the child for ``values`` from ``read()`` instead of recording."""
+        self.children[values] = _Reading(read)
+
+    def _new_child(self) -> object:
+        if self.kind == "histogram":
+            return Histogram(self.buckets)
+        return Gauge() if self.kind == "gauge" else Counter()
+
+    def _label_text(self, values: LabelValues, extra: str = "") -> str:
+        pairs = [
+            f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> List[str]:
+        """Return this family in the Prometheus text exposition format."""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in sorted(self.children.items()):
+            if isinstance(child, Histogram):
+                cumulative = 0
+                for bound, count in zip(child.bounds, child.counts):
+                    cumulative += count
+                    labels = self._label_text(values, f'le="{_number(bound)}"')
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = self._label_text(values, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{labels} {child.count}")
+                labels = self._label_text(values)
+                lines.append(f"{self.name}_sum{labels} {_number(child.sum)}")
+                lines.append(f"{self.name}_count{labels} {child.count}")
+            else:
+                value = child.value  # type: ignore[attr-defined]
+                lines.append(f"{self.name}{self._label_text(values)} {_number(value)}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Registry:
+    """The set of metric families one process exports."""
+
+    def __init__(self) -> None:
+        self.families: Dict[str, Family] = {}
+
+    def _family(
+        self,
+        name: str,
+        help: str,
+        kind: str,
+        labelnames: Sequence[str],
+        **kwargs: object,
+    ) -> Family:
+        family = self.families.get(name)
+        if family is None:
+            family = Family(name, help, kind, labelnames, **kwargs)  # type: ignore[arg-type]
+            self.families[name] = family
+        return family
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Family:
+        return self._family(name, help, "counter", labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Family:
+        return self._family(name, help, "gauge", labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = FRAME_BUCKETS,
+    ) -> Family:
+        return self._family(name, help, "histogram", labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """Return every family in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for family in self.families.values():
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+RENDERS = REGISTRY.counter(
+    "gradient_renders_total",
+    "Frames drawn by live and watch modes, or lines painted by streaming modes.",
+    ("command",),
+)
+BYTES_WRITTEN = REGISTRY.counter(
+    "gradient_bytes_written_total", "Bytes written to the output.", ("command",)
+)
+CACHE_HITS = REGISTRY.counter(
+    "gradient_cache_hits_total", "Lookups answered from a cache.", ("cache",)
+)
+CACHE_MISSES = REGISTRY.counter(
+    "gradient_cache_misses_total", "Lookups that had to render.", ("cache",)
+)
+FRAME_SECONDS = REGISTRY.histogram(
+    "gradient_frame_seconds", "Time to produce one frame.", ("command",)
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    "gradient_queue_depth", "Output chunks waiting to be written.", ("queue",)
+)
+
+
+def _cache_reader(cache_info: Callable[[], Any], field: str) -> Callable[[], float]:
+    def read() -> float:
+        return float(getattr(cache_info(), field))
+
+    return read
+
+
+def _bind_lru_caches() -> None:
+    from . import sgr
+
+    for name in ("color_prefix", "paint_template", "style_prefix"):
+        info = getattr(sgr, name).cache_info
+        CACHE_HITS.bind((name,), _cache_reader(info, "hits"))
+        CACHE_MISSES.bind((name,), _cache_reader(info, "misses"))
+
+
+_bind_lru_caches()
+
+
+def write_textfile(path: Path, registry: Registry = REGISTRY) -> None:
+    """Write ``registry`` to ``path`` atomically, so readers never see half a file."""
+    import tempfile
+
+    fd, temporary = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(registry.render())
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def _handler(registry: Registry) -> type:
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return MetricsHandler
+
+
+class MetricsExporter:
+    """Publish a registry to a text file, a localhost listener, or both."""
+
+    def __init__(
+        self,
+        registry: Registry = REGISTRY,
+        *,
+        path: Optional[Path] = None,
+        port: Optional[int] = None,
+        interval: float = DEFAULT_INTERVAL,
+    ) -> None:
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self.server: Optional[ThreadingHTTPServer] = None
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        if port is not None:
+            from http.server import ThreadingHTTPServer
+
+            self.server = ThreadingHTTPServer((LISTEN_HOST, port), _handler(registry))
+            self.server.daemon_threads = True
+            self._start(self.server.serve_forever)
+        if path is not None:
+            write_textfile(path, registry)
+            self._start(self._write_periodically)
+
+    @property
+    def port(self) -> Optional[int]:
+        return self.server.server_address[1] if self.server else None
+
+    def _start(self, target: Callable[[], None]) -> None:
+        thread = threading.Thread(target=target, name="gradient-metrics", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _write_periodically(self) -> None:
+        assert self.path is not None
+        while not self._stop.wait(self.interval):
+            try:
+                write_textfile(self.path, self.registry)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Stop exporting, writing the text file one last time."""
+        self._stop.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        for thread in self._threads:
+            thread.join()
+        if self.path is not None:
+            try:
+                write_textfile(self.path, self.registry)
+            except OSError:
+                pass
+
+
+def exporter_from_env(
+    environ: Mapping[str, str] = os.environ,
+) -> Optional[MetricsExporter]:
+    """Start the exporter the ``GRADIENT_METRICS_*`` variables ask for, if any."""
+    path = environ.get(FILE_ENVVAR)
+    port = environ.get(PORT_ENVVAR)
+    if not path and not port:
+        return None
+    try:
+        interval = float(environ.get(INTERVAL_ENVVAR) or DEFAULT_INTERVAL)
+        return MetricsExporter(
+            path=Path(path) if path else None,
+            port=int(port) if port else None,
+            interval=max(interval, 0.1),
+        )
+    except (OSError, ValueError) as error:
+        raise click.UsageError(
+            f"Cannot export metrics ({FILE_ENVVAR}, {PORT_ENVVAR}): {error}"
+        ) from error
+
+
+@contextmanager
+def exporting(
+    environ: Mapping[str, str] = os.environ,
+) -> Iterator[Optional[MetricsExporter]]:
+    """Export the registry while a resident mode runs."""
+    exporter = exporter_from_env(environ)
+    try:
+        yield exporter
+    finally:
+        if exporter is not None:
+            exporter.close()
+
+
+__all__ = [
+    "BYTES_WRITTEN",
+    "CACHE_HITS",
+    "CACHE_MISSES",
+    "Counter",
+    "FRAME_SECONDS",
+    "Family",
+    "Gauge",
+    "Histogram",
+    "MetricsExporter",
+    "QUEUE_DEPTH",
+    "REGISTRY",
+    "RENDERS",
+    "Registry",
+    "exporter_from_env",
+    "exporting",
+    "write_textfile",
+]
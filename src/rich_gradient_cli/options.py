@@ -0,0 +1,359 @@
+"""Option specs shared by the print, panel, rule and markdown commands.
+
+The gradient and export options are declared once here as ``OptionSpec``
+records. Each command compiles its own ``click.Option`` from a spec, so Typer
+only introspects the options that are specific to a command and no command
+can change another's parameter. ``shared_options`` hides the shared parameters from Typer and
+hands the command a ``GradientOptions`` tuple instead: colors are resolved
+and seeded once, and because the tuple is frozen and hashable it is also the
+key for caching gradient stops.
+"""
+
+from __future__ import annotations
+
+import inspect
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import click
+from rich.color_triplet import ColorTriplet
+
+from .common import resolve_colors
+from .lut import Stops, stops_from
+from .palette import SEED_ENVVAR, ColorSpec, apply_seed
+from .themes import THEME_ENVVAR, Theme, ThemeError, lookup_theme
+
+GRADIENT_GROUP = "gradient"
+OUTPUT_GROUP = "output"
+
+_RAINBOW_HELP = (
+    "[#ff0000]U[/][#ff3b00]s[/][#ff5100]e[/][#ff7400] [/]"
+    "[#ff9000]r[/][#ffa900]a[/][#ffc000]i[/][#ffd700]n[/]"
+    "[#ffee00]b[/][#f7ff00]o[/][#d3ff00]w[/][#a7ff00] [/] "
+    "[#7dff00]c[/][#2eff00]o[/][#00ff64]l[/][#00ff8e]o[/][#00ffc0]r[/]"
+    "[#00ffec]s[/][#00f4ff] [/][#00ddff]f[/][#00c5ff]o[/][#00afff]r[/]"
+    "[#1596ff] [/][#3b81ff]t[/][#4e67ff]h[/][#675fff]e[/][#7b57ff] [/]"
+    "[#924bff]g[/][#a73bff]r[/][#c72cff]a[/][#eb1cff]d[/][#ff00f2]i[/]"
+    "[#ff00ce]e[/][#ff00a4]n[/][#ff0084]t[/][#ff0054].[/]"
+)
+
+
+class OptionSpec:
+    """Declarative description of one command-line option."""
+
+    __slots__ = (
+        "name",
+        "decls",
+        "default",
+        "type",
+        "metavar",
+        "help",
+        "envvar",
+        "show_default",
+        "group",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        decls: Sequence[str],
+        *,
+        default: Any = None,
+        type: click.ParamType = click.STRING,
+        metavar: Optional[str] = None,
+        help: str = "",
+        envvar: Optional[str] = None,
+        show_default: bool = False,
+        group: str = GRADIENT_GROUP,
+    ) -> None:
+        self.name = name
+        self.decls = tuple(decls)
+        self.default = default
+        self.type = type
+        self.metavar = metavar
+        self.help = help
+        self.envvar = envvar
+        self.show_default = show_default
+        self.group = group
+
+    def replace(self, **changes: Any) -> "OptionSpec":
+        """Return a copy of this spec with some fields changed."""
+        fields = {slot: getattr(self, slot) for slot in self.__slots__}
+        fields.update(changes)
+        name, decls = fields.pop("name"), fields.pop("decls")
+        return OptionSpec(name, decls, **fields)
+
+    def param(self) -> click.Option:
+        """Return a new ``click.Option`` for one command."""
+        flag = self.type is click.BOOL
+        return click.Option(
+            [*self.decls, self.name],
+            default=self.default,
+            type=None if flag else self.type,
+            is_flag=flag or None,
+            metavar=self.metavar,
+            help=self.help,
+            envvar=self.envvar,
+            show_default=self.show_default,
+        )
+
+
+COLORS = OptionSpec(
+    "colors",
+    ("-c", "--colors"),
+    metavar="COLORS",
+    help=(
+        "Comma-separated list of colors for the gradient. [dim](e.g., "
+        "`[/][red]red[/][dim], [/][#ff9900]#ff9900[/][dim], [/][yellow]yellow[/][dim]`). "
+        "If no colors are provided, the color stops are automatically generated."
+    ),
+)
+BGCOLORS = OptionSpec(
+    "bgcolors",
+    ("--bgcolors",),
+    metavar="BGCOLORS",
+    help=(
+        "Comma-separated list of background colors for the gradient. [dim](e.g., "
+        "`[/][red]red[/][dim], [/][#ff9900]#ff9900[/][dim], [/][#ff0]#ff0[/][dim]`). "
+        "Defaults to [/][bold #fff]transparent[/][dim].[/dim]"
+    ),
+)
+RAINBOW = OptionSpec(
+    "rainbow", ("-r", "--rainbow"), default=False, type=click.BOOL, help=_RAINBOW_HELP
+)
+HUES = OptionSpec(
+    "hues",
+    ("--hues",),
+    default=5,
+    type=click.INT,
+    metavar="HUES",
+    help="The number of hues to use for a random gradient.",
+    show_default=True,
+)
+SEED = OptionSpec(
+    "seed",
+    ("--seed",),
+    type=click.INT,
+    metavar="SEED",
+    envvar=SEED_ENVVAR,
+    help=(
+        "Seed for the random gradient used when no colors are given. "
+        "[dim]The same seed always produces the same palette.[/]"
+    ),
+)
+THEME = OptionSpec(
+    "theme",
+    ("--theme",),
+    metavar="NAME",
+    envvar=THEME_ENVVAR,
+    help=(
+        "Use a named theme from the theme profile. [dim]--colors and --bgcolors "
+        "override its layers; see [bold]gradient theme list[/bold].[/]"
+    ),
+)
+END = OptionSpec(
+    "end",
+    ("--end",),
+    default="\n",
+    metavar="END",
+    help="String appended after the text is printed. [dim]\\[default: '\\n'][/dim]",
+    group=OUTPUT_GROUP,
+)
+SVG = OptionSpec(
+    "svg",
+    ("--svg",),
+    metavar="SVG",
+    help="Save output as an SVG file.",
+    group=OUTPUT_GROUP,
+)
+SVGZ = OptionSpec(
+    "svgz",
+    ("--svgz",),
+    metavar="SVGZ",
+    help=(
+        "Save output as a minified, gzip-compressed SVG file. "
+        "[dim]Usually a tenth of the size of --svg.[/]"
+    ),
+    group=OUTPUT_GROUP,
+)
+SVG_MINIFY = OptionSpec(
+    "svg_minify",
+    ("--svg-minify",),
+    default=False,
+    type=click.BOOL,
+    help=(
+        "Minify --svg output: short class names, merged runs and two-decimal "
+        "coordinates."
+    ),
+    group=OUTPUT_GROUP,
+)
+HTML = OptionSpec(
+    "html",
+    ("--html",),
+    metavar="HTML",
+    help=(
+        "Save output as an HTML fragment. [dim]Styles go to a shared stylesheet "
+        "(see --css) instead of inline attributes.[/]"
+    ),
+    group=OUTPUT_GROUP,
+)
+CSS = OptionSpec(
+    "css",
+    ("--css",),
+    metavar="CSS",
+    help=(
+        "Stylesheet that --html merges its color classes into. "
+        "[dim]Defaults to gradient.css beside the HTML file.[/]"
+    ),
+    group=OUTPUT_GROUP,
+)
+
+GRADIENT_OPTIONS = (COLORS, BGCOLORS, RAINBOW, HUES, SEED, THEME)
+EXPORT_OPTIONS = (SVG, SVGZ, SVG_MINIFY, HTML, CSS)
+
+
+class GradientOptions(NamedTuple):
+    """Resolved gradient options, hashable so they can key render caches."""
+
+    colors: Optional[Tuple[ColorSpec, ...]]
+    bg_colors: Optional[Tuple[ColorSpec, ...]]
+    rainbow: bool
+    hues: int
+
+    @classmethod
+    def resolve(
+        cls,
+        colors: Optional[str],
+        bgcolors: Optional[str],
+        rainbow: bool,
+        hues: int,
+        seed: Optional[int],
+        theme: Optional[str] = None,
+    ) -> "GradientOptions":
+        """Parse and seed the raw option values, raising ``BadParameter`` on bad colors.
+
+        A ``theme`` supplies whichever of the colors and background colors
+        were not given explicitly.
+        """
+        fg_list = resolve_colors(colors)
+        bg_list = resolve_colors(bgcolors, "--bgcolors")
+        if theme is not None:
+            profile = _theme(theme)
+            if fg_list is None and not rainbow:
+                fg_list = [ColorTriplet(*color) for color in profile.colors]
+            if bg_list is None and profile.bg_colors:
+                bg_list = [ColorTriplet(*color) for color in profile.bg_colors]
+        fg_list, rainbow = apply_seed(fg_list, hues, rainbow, seed)
+        return cls(
+            tuple(fg_list) if fg_list else None,
+            tuple(bg_list) if bg_list else None,
+            rainbow,
+            hues,
+        )
+
+    @property
+    def fg_list(self) -> Optional[List[ColorSpec]]:
+        """Return the foreground colors as ``rich_gradient`` expects them."""
+        return list(self.colors) if self.colors else None
+
+    @property
+    def bg_list(self) -> Optional[List[ColorSpec]]:
+        """Return the background colors as ``rich_gradient`` expects them."""
+        return list(self.bg_colors) if self.bg_colors else None
+
+    @property
+    def cacheable(self) -> bool:
+        """Return True when the palette is reproducible (not random)."""
+        return bool(self.colors) and not self.rainbow
+
+    def stops(self) -> Stops:
+        """Return the foreground stops, cached when the palette is reproducible."""
+        if self.cacheable:
+            return _stops(self.colors, self.hues)
+        return stops_from(self.colors, self.hues, self.rainbow)
+
+    def bg_stops(self) -> Optional[Stops]:
+        """Return the background stops, or None without background colors."""
+        if not self.bg_colors:
+            return None
+        return _stops(self.bg_colors, self.hues)
+
+
+def _theme(name: str) -> Theme:
+    try:
+        return lookup_theme(name)
+    except ThemeError as error:
+        raise click.BadParameter(str(error), param_hint="'--theme'") from error
+
+
+@lru_cache(maxsize=64)
+def _stops(colors: Tuple[ColorSpec, ...], hues: int) -> Stops:
+    return stops_from(colors, hues, False)
+
+
+def shared_params(
+    params: List[click.Parameter], specs: Sequence[OptionSpec]
+) -> List[click.Parameter]:
+    """Place freshly compiled shared options around a command's own parameters.
+
+    Arguments come first, then the gradient options, the command's own
+    options and finally the output options.
+    """
+    arguments = [param for param in params if isinstance(param, click.Argument)]
+    own = [param for param in params if not isinstance(param, click.Argument)]
+    gradient = [spec.param() for spec in specs if spec.group == GRADIENT_GROUP]
+    output = [spec.param() for spec in specs if spec.group == OUTPUT_GROUP]
+    return [*arguments, *gradient, *own, *output]
+
+
+def shared_options(*specs: OptionSpec) -> Callable[[Callable[..., Any]], Any]:
+    """Declare ``specs`` on a command without repeating them in its signature.
+
+    The decorated function takes a keyword-only ``gradient`` argument (a
+    ``GradientOptions``) in place of the gradient specs, and a keyword-only
+    argument for each output spec.
+    """
+    names = {spec.name for spec in specs}
+    gradient_names = [spec.name for spec in specs if spec.group == GRADIENT_GROUP]
+
+    def decorate(func: Callable[..., Any]) -> Any:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def command(**values: Any) -> Any:
+            raw: Dict[str, Any] = {name: values.pop(name) for name in gradient_names}
+            return func(gradient=GradientOptions.resolve(**raw), **values)
+
+        command.__signature__ = signature.replace(  # type: ignore[attr-defined]
+            parameters=[
+                parameter
+                for name, parameter in signature.parameters.items()
+                if name not in names and name != "gradient"
+            ]
+        )
+        command.__shared_options__ = specs  # type: ignore[attr-defined]
+        return command
+
+    return decorate
+
+
+__all__ = [
+    "BGCOLORS",
+    "COLORS",
+    "CSS",
+    "END",
+    "EXPORT_OPTIONS",
+    "GRADIENT_OPTIONS",
+    "GradientOptions",
+    "HTML",
+    "HUES",
+    "OptionSpec",
+    "RAINBOW",
+    "SEED",
+    "SVG",
+    "SVGZ",
+    "SVG_MINIFY",
+    "THEME",
+    "shared_options",
+    "shared_params",
+]
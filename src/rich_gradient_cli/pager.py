@@ -0,0 +1,372 @@
+"""Virtualized terminal pager for large panels and markdown documents.
+
+Content is exposed as a ``RowSource`` that renders rows on demand. The
+panel source counts wrapped rows just ahead of the viewport and colors only
+the rows that are asked for; the markdown source renders top-level blocks one
+at a time as the reader scrolls towards them. The ``Pager`` keeps the rows around the
+viewport (plus a prefetch window) and drops the rest. When the terminal is
+resized to a new width the source is laid out again for it and redrawn.
+"""
+
+from __future__ import annotations
+
+import os
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .blocks import expand_tabs, wrapped_row_count
+from .common import get_console
+from .resize import ResizeWatch
+
+PREFETCH_ROWS = 64
+BLOCK_CACHE_SIZE = 64
+MEASURE_BATCH = 4096
+
+_ENTER_SCREEN = "\x1b[?1049h\x1b[?25l"
+_LEAVE_SCREEN = "\x1b[?25h\x1b[?1049l"
+_END_ROW = "\x1b[0m\x1b[K"
+_CLEAR_SCREEN = "\x1b[2J"
+
+_KEYS: Dict[bytes, str] = {
+    b"q": "quit",
+    b"Q": "quit",
+    b"\x03": "quit",
+    b"j": "down",
+    b"\r": "down",
+    b"\n": "down",
+    b"\x1b[B": "down",
+    b"k": "up",
+    b"\x1b[A": "up",
+    b" ": "page_down",
+    b"f": "page_down",
+    b"\x1b[6~": "page_down",
+    b"b": "page_up",
+    b"\x1b[5~": "page_up",
+    b"d": "half_down",
+    b"u": "half_up",
+    b"g": "home",
+    b"<": "home",
+    b"\x1b[H": "home",
+    b"\x1b[1~": "home",
+    b"G": "end",
+    b">": "end",
+    b"\x1b[F": "end",
+    b"\x1b[4~": "end",
+}
+
+
+class RowSource(ABC):
+    """Rendered rows of a document, produced lazily."""
+
+    @abstractmethod
+    def rows(self, start: int, stop: int) -> List[str]:
+        """Return rendered rows ``start`` to ``stop`` (fewer at the end)."""
+
+    @abstractmethod
+    def row_count(self, exhaust: bool = False) -> Optional[int]:
+        """Return the total row count, or None if not known yet.
+
+        ``exhaust`` forces the source to measure the whole document.
+        """
+
+
+def wrap_offsets(lines: Sequence[str], width: int, tab_size: int = 8) -> "array[int]":
+    """Return the first wrapped row of every line, plus the total row count.
+
+    Rows are counted without being built, so this pass stays cheap. Tabs are
+    expanded by cell width, as the panel body renderer does.
+    """
+    offsets = array("q", [0])
+    total = 0
+    for line in lines:
+        total += wrapped_row_count(expand_tabs(line, tab_size)[0], width)
+        offsets.append(total)
+    return offsets
+
+
+class PanelRows(RowSource):
+    """Panel frame rows around a body that is wrapped and colored on demand.
+
+    Wrap offsets are measured in batches of ``MEASURE_BATCH`` lines as the
+    reader scrolls, so opening a huge document costs the same as a short one.
+    """
+
+    def __init__(
+        self,
+        top: List[str],
+        bottom: List[str],
+        lines: List[str],
+        text_width: int,
+        render_lines: Callable[[List[str]], List[str]],
+    ) -> None:
+        self.top = top
+        self.bottom = bottom
+        self.lines = lines
+        self.text_width = text_width
+        self.render_lines = render_lines
+        self.offsets = array("q", [0])
+
+    def _measure(self, row: float) -> None:
+        """Extend the wrap offsets until ``row`` is covered or the body ends."""
+        offsets = self.offsets
+        while offsets[-1] < row and len(offsets) <= len(self.lines):
+            done = len(offsets) - 1
+            batch = wrap_offsets(
+                self.lines[done : done + MEASURE_BATCH], self.text_width
+            )
+            base = offsets[-1]
+            offsets.extend(base + offset for offset in batch[1:])
+
+    def row_count(self, exhaust: bool = False) -> Optional[int]:
+        if exhaust:
+            self._measure(float("inf"))
+        if len(self.offsets) > len(self.lines):
+            return len(self.top) + self.offsets[-1] + len(self.bottom)
+        return None
+
+    def _body(self, start: int, stop: int) -> List[str]:
+        if start >= stop:
+            return []
+        first = bisect_right(self.offsets, start) - 1
+        last = bisect_right(self.offsets, stop - 1) - 1
+        rows = self.render_lines(self.lines[first : last + 1])
+        skip = start - self.offsets[first]
+        return rows[skip : skip + stop - start]
+
+    def rows(self, start: int, stop: int) -> List[str]:
+        head = len(self.top)
+        self._measure(stop - head)
+        out = self.top[start:stop]
+        body = self.offsets[-1]
+        out += self._body(max(start - head, 0), min(stop - head, body))
+        if len(self.offsets) > len(self.lines):
+            tail = max(start - head - body, 0), max(stop - head - body, 0)
+            out += self.bottom[tail[0] : tail[1]]
+        return out
+
+
+class MarkdownRows(RowSource):
+    """Markdown rendered one top-level block at a time.
+
+    Blocks are only rendered once the reader scrolls near them. Row counts of
+    rendered blocks are kept; their rows live in a small LRU.
+    """
+
+    def __init__(self, source: str, render: Callable[[str], List[str]]) -> None:
+        self.lines = source.split("\n")
+        self.render = render
+        self.blocks = markdown_blocks(source)
+        self.starts: List[int] = [0]
+        self._standalone: List[int] = []
+        self._separated: List[bool] = []
+        self._blank = ""
+        self._cache: "OrderedDict[int, List[str]]" = OrderedDict()
+
+    def _source(self, first: int, last: int) -> str:
+        return "\n".join(self.lines[self.blocks[first][0] : self.blocks[last][1]])
+
+    def _block(self, index: int) -> List[str]:
+        rows = self._cache.get(index)
+        if rows is not None:
+            self._cache.move_to_end(index)
+            return rows
+        rows = self.render(self._source(index, index))
+        if index == len(self._standalone):
+            self._standalone.append(len(rows))
+            self._separated.append(index > 0 and self._has_separator(index))
+        if self._separated[index]:
+            rows = [self._blank, *rows]
+        self._cache[index] = rows
+        if len(self._cache) > BLOCK_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return rows
+
+    def _has_separator(self, index: int) -> bool:
+        """Return True if Rich puts a blank line between this block and the last.
+
+        Whether it does depends on the elements on both sides, so the pair is
+        rendered together once and compared with the standalone renders.
+        """
+        pair = self.render(self._source(index - 1, index))
+        previous = self._standalone[index - 1]
+        if len(pair) > previous + self._standalone[index]:
+            self._blank = pair[previous]
+            return True
+        return False
+
+    def _measure(self, row: float) -> None:
+        """Render blocks until ``row`` is covered or the document ends."""
+        while self.starts[-1] < row and len(self.starts) <= len(self.blocks):
+            self.starts.append(self.starts[-1] + len(self._block(len(self.starts) - 1)))
+
+    def row_count(self, exhaust: bool = False) -> Optional[int]:
+        if exhaust:
+            self._measure(float("inf"))
+        if len(self.starts) > len(self.blocks):
+            return self.starts[-1]
+        return None
+
+    def rows(self, start: int, stop: int) -> List[str]:
+        self._measure(stop)
+        out: List[str] = []
+        index = bisect_right(self.starts, start) - 1
+        while index < len(self.starts) - 1 and self.starts[index] < stop:
+            rows = self._block(index)
+            first = self.starts[index]
+            out += rows[max(start - first, 0) : stop - first]
+            index += 1
+        return out
+
+
+def markdown_blocks(source: str) -> List[Tuple[int, int]]:
+    """Return the ``(start, end)`` source lines of each top-level markdown block."""
+    from markdown_it import MarkdownIt
+
+    tokens = MarkdownIt().enable("strikethrough").enable("table").parse(source)
+    return [
+        (token.map[0], token.map[1])
+        for token in tokens
+        if token.level == 0 and token.nesting >= 0 and token.map
+    ]
+
+
+class Pager:
+    """Keep the rows around a viewport rendered and scroll through them.
+
+    ``relayout`` builds the source for another terminal width; without it a
+    resize only changes the number of rows shown.
+    """
+
+    def __init__(
+        self,
+        source: RowSource,
+        prefetch: int = PREFETCH_ROWS,
+        relayout: Optional[Callable[[int], RowSource]] = None,
+    ) -> None:
+        self.source = source
+        self.prefetch = prefetch
+        self.relayout = relayout
+        self.top = 0
+        self.width: Optional[int] = None
+        self._rows: Dict[int, str] = {}
+
+    def view(self, height: int) -> List[str]:
+        """Return the rows of the viewport, fetching a prefetch window as needed."""
+        low = max(self.top - self.prefetch, 0)
+        high = self.top + height + self.prefetch
+        wanted = range(self.top, self.top + height)
+        if any(row not in self._rows for row in wanted):
+            for offset, row in enumerate(self.source.rows(low, high)):
+                self._rows[low + offset] = row
+            keep = range(low - height, high + height)
+            self._rows = {key: row for key, row in self._rows.items() if key in keep}
+        return [self._rows[row] for row in wanted if row in self._rows]
+
+    def scroll(self, action: str, height: int) -> None:
+        """Move the viewport for a key action."""
+        steps = {
+            "down": 1,
+            "up": -1,
+            "page_down": height,
+            "page_up": -height,
+            "half_down": height // 2,
+            "half_up": -(height // 2),
+        }
+        if action == "home":
+            self.top = 0
+        elif action == "end":
+            total = self.source.row_count(exhaust=True) or 0
+            self.top = max(total - height, 0)
+        elif action in steps:
+            self.top = max(self.top + steps[action], 0)
+            self._clamp(height)
+
+    def resize(self, width: int, height: int) -> None:
+        """Lay the source out again for a new ``width`` and keep the view in range."""
+        if self.relayout is not None and self.width is not None and width != self.width:
+            self.source = self.relayout(width)
+            self._rows = {}
+        self.width = width
+        self._clamp(height)
+
+    def _clamp(self, height: int) -> None:
+        """Pull the viewport back so it does not run past the last row."""
+        total = self.source.row_count()
+        if total is None:
+            shown = len(self.source.rows(self.top, self.top + height))
+            if shown == height:
+                return
+            total = self.source.row_count() or self.top + shown
+        self.top = max(min(self.top, total - height), 0)
+
+    def run(self) -> None:
+        """Page through the source interactively until the reader quits."""
+        import termios
+        import tty
+
+        console = get_console()
+        tty_fd = os.open("/dev/tty", os.O_RDONLY)
+        saved = termios.tcgetattr(tty_fd)
+        write, flush = console.file.write, console.file.flush
+        try:
+            with ResizeWatch() as resizes:
+                tty.setcbreak(tty_fd)
+                write(_ENTER_SCREEN)
+                width, height = self._size()
+                self.resize(width, height)
+                while True:
+                    self._draw(height)
+                    flush()
+                    resized, ready = resizes.wait(tty_fd)
+                    if resized:
+                        width, height = self._size()
+                        self.resize(width, height)
+                        write(_CLEAR_SCREEN)
+                    if not ready:
+                        continue
+                    action = _KEYS.get(os.read(tty_fd, 16))
+                    if action == "quit":
+                        break
+                    if action:
+                        self.scroll(action, height)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            write(_LEAVE_SCREEN)
+            flush()
+            termios.tcsetattr(tty_fd, termios.TCSADRAIN, saved)
+            os.close(tty_fd)
+
+    @staticmethod
+    def _size() -> Tuple[int, int]:
+        """Return the terminal width and the number of rows left for content."""
+        console = get_console()
+        size = os.get_terminal_size(console.file.fileno())
+        return size.columns, max(size.lines - 1, 1)
+
+    def _draw(self, height: int) -> None:
+        console = get_console()
+        rows = self.view(height)
+        total = self.source.row_count()
+        status = (
+            f" {self.top + 1}-{self.top + len(rows)}/{total if total is not None else '?'}"
+            "  (q quit, space/b page, g/G top/end) "
+        )
+        screen = ["\x1b[H"]
+        screen += [row + _END_ROW + "\r\n" for row in rows]
+        screen += [_END_ROW + "\r\n"] * (height - len(rows))
+        screen.append(f"\x1b[7m{status}\x1b[0m\x1b[K")
+        console.file.write("".join(screen))
+
+
+__all__ = [
+    "MarkdownRows",
+    "PanelRows",
+    "Pager",
+    "RowSource",
+    "markdown_blocks",
+    "wrap_offsets",
+]
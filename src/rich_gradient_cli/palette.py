@@ -0,0 +1,117 @@
+"""Seeded, reproducible random palettes for the CLI.
+
+When no ``--colors`` are given every command falls back to a random
+``Spectrum``. Passing ``--seed`` (or setting ``GRADIENT_SEED``) makes that
+palette deterministic, and a pre-generated palette bank can be loaded from
+``GRADIENT_PALETTE_BANK`` so seeded palettes need not be recomputed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from rich.color_triplet import ColorTriplet
+
+from .colors import resolve_color
+
+SEED_ENVVAR = "GRADIENT_SEED"
+BANK_ENVVAR = "GRADIENT_PALETTE_BANK"
+RAINBOW_HUES = 17
+
+ColorSpec = Union[ColorTriplet, str]
+
+
+def _library_version() -> str:
+    """Return the rich-gradient version palettes were generated with."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("rich-gradient")
+    except PackageNotFoundError:  # pragma: no cover - editable checkouts
+        return "unknown"
+
+
+def _bank_key(hues: int, seed: int) -> str:
+    """Return the palette bank key for a hue count and seed."""
+    return f"{hues}:{seed}"
+
+
+@lru_cache(maxsize=4)
+def load_palette_bank(path: str) -> Dict[str, Tuple[str, ...]]:
+    """Load a palette bank, ignoring banks built by another rich-gradient."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("rich_gradient") != _library_version():
+        return {}
+    return {key: tuple(value) for key, value in data.get("palettes", {}).items()}
+
+
+def generate_palette(hues: int, seed: int) -> Tuple[str, ...]:
+    """Generate the hex color stops of a seeded ``Spectrum``."""
+    from rich_gradient.spectrum import Spectrum
+
+    return tuple(
+        color.get_truecolor().hex for color in Spectrum(hues, seed=seed).colors
+    )
+
+
+@lru_cache(maxsize=256)
+def seeded_palette(hues: int, seed: int) -> Tuple[str, ...]:
+    """Return the seeded palette, preferring a bank from ``GRADIENT_PALETTE_BANK``."""
+    bank_path = os.environ.get(BANK_ENVVAR)
+    if bank_path:
+        banked = load_palette_bank(bank_path).get(_bank_key(hues, seed))
+        if banked:
+            return banked
+    return generate_palette(hues, seed)
+
+
+def apply_seed(
+    colors: Optional[List[ColorSpec]], hues: int, rainbow: bool, seed: Optional[int]
+) -> Tuple[Optional[List[ColorSpec]], bool]:
+    """Replace a random gradient with a seeded one.
+
+    Returns the ``(colors, rainbow)`` pair to hand to ``rich_gradient``.
+    Explicit colors and unseeded calls are passed through unchanged.
+    """
+    if seed is None or (colors and not rainbow):
+        return colors, rainbow
+    palette = seeded_palette(RAINBOW_HUES if rainbow else hues, seed)
+    return [resolve_color(color) for color in palette], False
+
+
+def build_palette_bank(
+    seeds: Iterable[int], hues: Iterable[int]
+) -> Dict[str, List[str]]:
+    """Generate seeded palettes for every ``(hues, seed)`` combination."""
+    hue_counts = list(hues)
+    return {
+        _bank_key(count, seed): list(generate_palette(count, seed))
+        for seed in seeds
+        for count in hue_counts
+    }
+
+
+def save_palette_bank(path: str, palettes: Dict[str, List[str]]) -> None:
+    """Write a palette bank to ``path`` as JSON."""
+    payload = {"rich_gradient": _library_version(), "palettes": palettes}
+    Path(path).write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+
+
+__all__ = [
+    "BANK_ENVVAR",
+    "ColorSpec",
+    "SEED_ENVVAR",
+    "apply_seed",
+    "build_palette_bank",
+    "generate_palette",
+    "load_palette_bank",
+    "save_palette_bank",
+    "seeded_palette",
+]
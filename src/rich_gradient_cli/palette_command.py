@@ -0,0 +1,55 @@
+"""Palette bank command wiring for the CLI."""
+
+from __future__ import annotations
+
+from typing import List
+
+import typer
+
+from .common import get_console
+from .palette import BANK_ENVVAR, build_palette_bank, save_palette_bank
+
+
+def _parse_hue_counts(hues: str) -> List[int]:
+    """Parse ``2-17`` or ``5,7,10`` into a list of hue counts."""
+    counts: List[int] = []
+    for token in (t.strip() for t in hues.split(",") if t.strip()):
+        if "-" in token:
+            low, _, high = token.partition("-")
+            counts.extend(range(int(low), int(high) + 1))
+        else:
+            counts.append(int(token))
+    if not counts or min(counts) < 2 or max(counts) > 17:
+        raise typer.BadParameter("Hue counts must be between 2 and 17.")
+    return counts
+
+
+def palette_command(
+    output: str = typer.Argument(..., metavar="OUTPUT"),
+    seeds: int = typer.Option(
+        256,
+        "--seeds",
+        metavar="SEEDS",
+        help="Number of seeds to generate, starting at 0.",
+        show_default=True,
+    ),
+    hues: str = typer.Option(
+        "2-17",
+        "--hues",
+        metavar="HUES",
+        help="Hue counts to generate. [dim](a range like 2-17 or a list like 5,7,10)[/]",
+        show_default=True,
+    ),
+) -> None:
+    """Pre-generate a bank of seeded palettes for reuse across runs."""
+    console = get_console()
+    counts = _parse_hue_counts(hues)
+    bank = build_palette_bank(range(seeds), counts)
+    save_palette_bank(output, bank)
+    console.print(
+        f"Saved [bold]{len(bank)}[/] palettes to [bold]{output}[/]. "
+        f"[dim]Set {BANK_ENVVAR}={output} to use them.[/]"
+    )
+
+
+__all__ = ["palette_command"]
@@ -3,60 +3,71 @@
 from __future__ import annotations
 
 import sys
-from typing import Any, Literal, Optional, Tuple, cast
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    cast,
+)
 
-import typer
+import click
 from rich.align import Align, AlignMethod
+from rich.cells import cell_len
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.measure import Measurement
+from rich.panel import Panel as RichPanel
+from rich.segment import Segment
+from rich.text import Text
+
+import typer
 
-from rich_gradient.animated_panel import AnimatedPanel
-from rich_gradient.panel import Panel
+from .blocks import (
+    ExecutorKind,
+    default_jobs,
+    make_executor,
+    render_panel_body_block,
+    run_blocks,
+    split_blocks,
+)
+from .common import color_enabled, export_svg, get_console, parse_style
+from .html_export import export_html
+from .live import run_live
+from .lut import Stops, hex_color
+from .options import (
+    BGCOLORS,
+    COLORS,
+    CSS,
+    END,
+    HTML,
+    HUES,
+    RAINBOW,
+    SEED,
+    SVG,
+    SVG_MINIFY,
+    SVGZ,
+    THEME,
+    GradientOptions,
+    shared_options,
+)
+from .pager import Pager, PanelRows
+from .plain import PlainLayout
+from .sgr import segments_to_ansi
 
-from .common import console, export_svg, parse_colors, parse_style
+if TYPE_CHECKING:
+    from rich_gradient.panel import Panel
 
 
+@shared_options(
+    COLORS, BGCOLORS, RAINBOW, HUES, SEED, THEME, END, SVG, SVGZ, SVG_MINIFY, HTML, CSS
+)
 def panel_command(
     renderable: str = typer.Argument(..., metavar="TEXT"),
-    colors: Optional[str] = typer.Option(
-        None,
-        "-c",
-        "--colors",
-        metavar="COLORS",
-        help=(
-            "Comma-separated list of colors for the gradient. [dim](e.g., "
-            "`[/][red]red[/][dim], [/][#ff9900]#ff9900[/][dim], [/][yellow]yellow[/][dim]`). "
-            "If no colors are provided, the color stops are automatically generated."
-        ),
-    ),
-    bgcolors: Optional[str] = typer.Option(
-        None,
-        "--bgcolors",
-        metavar="BGCOLORS",
-        help=(
-            "Comma-separated list of background colors for the gradient. [dim](e.g., "
-            "`[/][red]red[/][dim],[/][#ff9900]#ff9900[/][dim],[/][#ff0]#ff0[/][dim]`). "
-            "Defaults to [/][bold #fff]transparent[/][dim].[/dim]"
-        ),
-    ),
-    rainbow: bool = typer.Option(
-        False,
-        "-r",
-        "--rainbow",
-        help="[#ff0000]U[/][#ff3b00]s[/][#ff5100]e[/][#ff7400] [/]\
-[#ff9000]r[/][#ffa900]a[/][#ffc000]i[/][#ffd700]n[/]\
-[#ffee00]b[/][#f7ff00]o[/][#d3ff00]w[/][#a7ff00] [/] \
-[#7dff00]c[/][#2eff00]o[/][#00ff64]l[/][#00ff8e]o[/][#00ffc0]r[/]\
-[#00ffec]s[/][#00f4ff] [/][#00ddff]f[/][#00c5ff]o[/][#00afff]r[/]\
-[#1596ff] [/][#3b81ff]t[/][#4e67ff]h[/][#675fff]e[/][#7b57ff] [/]\
-[#924bff]g[/][#a73bff]r[/][#c72cff]a[/][#eb1cff]d[/][#ff00f2]i[/]\
-[#ff00ce]e[/][#ff00a4]n[/][#ff0084]t[/][#ff0054].[/]",
-    ),
-    hues: int = typer.Option(
-        5,
-        "--hues",
-        metavar="HUES",
-        help="The number of hues to use for a random gradient.",
-        show_default=True,
-    ),
     title: Optional[str] = typer.Option(
         None,
         "-t",
@@ -165,14 +176,6 @@ def panel_command(
         metavar="HEIGHT",
         help="Height of the panel; content determines by default.",
     ),
-    end: str = typer.Option(
-        "\n",
-        "--end",
-        metavar="END",
-        help=(
-            "String appended after the text is printed. [dim]\\[default: '\\n'][/dim]"
-        ),
-    ),
     box: Literal["SQUARE", "ROUNDED", "HEAVY", "DOUBLE", "ASCII"] = typer.Option(
         "ROUNDED",
         "--box",
@@ -196,21 +199,59 @@ def panel_command(
         metavar="DURATION",
         help="Duration of the panel animation in seconds (only used if --animate).",
     ),
-    svg: Optional[str] = typer.Option(
-        None,
-        "--svg",
-        metavar="SVG",
-        help="Save output as an SVG file.",
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        metavar="JOBS",
+        help=(
+            "Color the panel body in line blocks across JOBS workers. [dim]0 uses "
+            "every core. The body is treated as plain text (no markup).[/]"
+        ),
+        show_default=True,
+    ),
+    executor: Literal["auto", "thread", "process"] = typer.Option(
+        "auto",
+        "--executor",
+        metavar="EXECUTOR",
+        help=(
+            "Worker pool for --jobs. [lime](auto, thread, process)[/] [dim]auto uses "
+            "threads on free-threaded Python and processes otherwise.[/]"
+        ),
+        show_default=True,
+        case_sensitive=False,
+    ),
+    live: bool = typer.Option(
+        False,
+        "--live",
+        help=(
+            "Stay resident and repaint when the terminal is resized. [dim]Layouts "
+            "for recent widths are cached; press Ctrl+C to exit.[/]"
+        ),
+    ),
+    pager: bool = typer.Option(
+        False,
+        "--pager",
+        help=(
+            "Page through the panel, coloring only the rows on screen. [dim]The "
+            "body is treated as plain text (no markup).[/]"
+        ),
     ),
+    *,
+    gradient: GradientOptions,
+    end: str,
+    svg: Optional[str],
+    svgz: Optional[str],
+    svg_minify: bool,
+    html: Optional[str],
+    css: Optional[str],
 ) -> None:
     """Display a renderable inside a gradient panel."""
+    console = get_console()
     if renderable == "-":
         renderable = typer.get_text_stream("stdin").read().rstrip("\n")
         if not renderable:
-            raise typer.UsageError("Missing text argument.")
+            raise click.UsageError("Missing text argument.")
 
-    fg_list = parse_colors(colors)
-    bg_list = parse_colors(bgcolors)
     style_obj = parse_style(style)
     _text_justify = cast(AlignMethod, text_justify)
     padding_tuple: Optional[Tuple[int, ...]] = None
@@ -228,15 +269,60 @@ def panel_command(
     }
     box_style = box_map.get(box.upper(), rich_box.ROUNDED)
 
-    if animate and svg:
-        raise typer.UsageError("--svg is not supported with --animate.")
+    export = bool(svg or svgz or html)
+    if animate and export:
+        raise click.UsageError(
+            "--svg, --svgz and --html are not supported with --animate."
+        )
+    if live and (animate or export or jobs != 1):
+        raise click.UsageError(
+            "--live cannot be combined with --animate, --svg, --svgz, --html or --jobs."
+        )
+    if live and not console.is_terminal:
+        raise click.UsageError("--live needs an interactive terminal.")
+    if pager and (animate or export or live):
+        raise click.UsageError(
+            "--pager cannot be combined with --animate, --svg, --svgz, --html or --live."
+        )
+    if pager and not console.is_terminal:
+        raise click.UsageError("--pager needs an interactive terminal.")
+    if not (export or animate or live or pager or color_enabled()):
+        plain = RichPanel(
+            Align(renderable, align=_text_justify),
+            title=_plain_title(title, title_style),
+            title_align=cast(AlignMethod, title_align),
+            subtitle=_plain_title(subtitle, subtitle_style),
+            subtitle_align=cast(AlignMethod, subtitle_align),
+            style=style_obj,
+            border_style=parse_style(border_style),
+            padding=cast(Any, padding_tuple),
+            expand=expand,
+            width=width,
+            height=height,
+            box=box_style,
+        )
+        console.print(
+            PlainLayout(
+                plain,
+                justify=cast(AlignMethod, justify),
+                vertical=cast(Any, vertical_justify),
+                expand=expand,
+            ),
+            end=end,
+        )
+        return
+
+    from rich_gradient.panel import Panel
+
     if animate and console.is_terminal is True:
-        animated_panel: AnimatedPanel = AnimatedPanel(
+        from rich_gradient.animated_panel import AnimatedPanel
+
+        animated_panel = AnimatedPanel(
             Align(renderable, align=_text_justify),
-            colors=cast(Any, fg_list),
-            rainbow=rainbow,
-            hues=hues,
-            bg_colors=cast(Any, bg_list),
+            colors=cast(Any, gradient.fg_list),
+            rainbow=gradient.rainbow,
+            hues=gradient.hues,
+            bg_colors=cast(Any, gradient.bg_list),
             title=title,
             title_style=parse_style(title_style),
             title_align=cast(AlignMethod, title_align),
@@ -258,12 +344,61 @@ def panel_command(
         animated_panel.run()
         sys.exit(0)
 
+    if (jobs != 1 or pager) and not export:
+        if height is not None:
+            raise click.UsageError("--height is not supported with --jobs or --pager.")
+        stops = gradient.stops()
+        bg_stops = gradient.bg_stops()
+
+        def frame_layout(columns: int) -> _FrameLayout:
+            text_width = _body_width(renderable, columns)
+            frame = Panel(
+                _BodySlot(text_width),
+                colors=[hex_color(rgb) for rgb in stops],
+                bg_colors=[hex_color(rgb) for rgb in bg_stops] if bg_stops else None,
+                title=title,
+                title_style=parse_style(title_style),
+                title_align=cast(AlignMethod, title_align),
+                subtitle=subtitle,
+                subtitle_style=parse_style(subtitle_style),
+                subtitle_align=cast(AlignMethod, subtitle_align),
+                style=style_obj,
+                border_style=parse_style(border_style),
+                padding=cast(Any, padding_tuple),
+                justify=cast(AlignMethod, justify),
+                expand=expand,
+                width=width,
+                box=box_style,
+            )
+            return _layout_frame(frame, text_width, text_justify, columns)
+
+        if pager:
+            _page_panel(
+                frame_layout,
+                renderable,
+                stops=stops,
+                bg_stops=bg_stops,
+                style=style or "",
+            )
+            return
+        _print_panel_blocks(
+            frame_layout(console.width),
+            renderable,
+            stops=stops,
+            bg_stops=bg_stops,
+            style=style or "",
+            end=end,
+            jobs=jobs,
+            executor=executor,
+        )
+        return
+
     panel = Panel(
         Align(renderable, align=_text_justify),
-        colors=cast(Any, fg_list),
-        rainbow=rainbow,
-        hues=hues,
-        bg_colors=cast(Any, bg_list),
+        colors=cast(Any, gradient.fg_list),
+        rainbow=gradient.rainbow,
+        hues=gradient.hues,
+        bg_colors=cast(Any, gradient.bg_list),
         title=title,
         title_style=parse_style(title_style),
         title_align=cast(AlignMethod, title_align),
@@ -281,9 +416,186 @@ def panel_command(
         box=box_style,
     )
     if svg:
-        export_svg(panel, svg, end=end)
+        export_svg(panel, svg, end=end, minify=svg_minify)
+    if svgz:
+        export_svg(panel, svgz, end=end, minify=True, compress=True)
+    if html:
+        export_html(panel, html, css_path=css, end=end)
+    if export:
+        return
+    if live:
+        run_live(panel, command="panel")
         return
     console.print(panel, end=end)
 
 
+_SLOT = "\ue000"
+
+
+class _BodySlot:
+    """Placeholder body that marks the cells where panel text rows go."""
+
+    def __init__(self, width: int) -> None:
+        self.width = max(width, 1)
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        width = min(self.width, options.max_width)
+        return Measurement(width, width)
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        yield Segment(_SLOT * options.max_width)
+
+
+def _body_width(body: str, limit: int) -> int:
+    """Return the widest line of ``body`` in cells, stopping early at ``limit``."""
+    widest = 1
+    for line in body.split("\n"):
+        widest = max(widest, cell_len(line.expandtabs(8)))
+        if widest >= limit:
+            return limit
+    return widest
+
+
+class _FrameLayout(NamedTuple):
+    """A panel frame rendered around an empty body slot."""
+
+    top: List[str]
+    bottom: List[str]
+    frame: Tuple[str, str, int]
+    inner_width: int
+    text_width: int
+    indent: int
+
+
+def _plain_title(title: Optional[str], style: Optional[str]) -> Optional[Text]:
+    """Return a panel title styled the way the gradient panel highlights it."""
+    if not title:
+        return None
+    return Text.from_markup(title, style=parse_style(style))
+
+
+def _layout_frame(
+    frame: Panel, text_width: int, text_justify: str, columns: int
+) -> _FrameLayout:
+    """Render the panel frame once, ``columns`` wide, and measure where body rows go."""
+    console = get_console()
+    color_system = console.color_system
+    options = console.options.update_width(columns)
+    rows = console.render_lines(frame, options, pad=True, new_lines=False)
+    slot_row = next(
+        index
+        for index, row in enumerate(rows)
+        if any(_SLOT in segment.text for segment in row)
+    )
+    left: list[Segment] = []
+    right: list[Segment] = []
+    inner_width = 0
+    for segment in rows[slot_row]:
+        if _SLOT in segment.text:
+            inner_width += len(segment.text)
+        elif inner_width:
+            right.append(segment)
+        else:
+            left.append(segment)
+    text_width = min(text_width, inner_width)
+    excess = inner_width - text_width
+    indent = {"center": excess // 2, "right": excess}.get(text_justify, 0)
+    return _FrameLayout(
+        [segments_to_ansi(row, color_system) for row in rows[:slot_row]],
+        [segments_to_ansi(row, color_system) for row in rows[slot_row + 1 :]],
+        (
+            segments_to_ansi(left, color_system),
+            segments_to_ansi(right, color_system),
+            Segment.get_line_length(left),
+        ),
+        inner_width,
+        text_width,
+        indent,
+    )
+
+
+def _print_panel_blocks(
+    layout: _FrameLayout,
+    body: str,
+    *,
+    stops: Stops,
+    bg_stops: Optional[Stops],
+    style: str,
+    end: str,
+    jobs: int,
+    executor: ExecutorKind,
+) -> None:
+    """Write the panel frame and color its body in parallel line blocks."""
+    console = get_console()
+    write = console.file.write
+    for row in layout.top:
+        write(row + "\n")
+    workers = jobs if jobs > 0 else default_jobs()
+    with make_executor(workers, executor) as pool:
+        chunks = run_blocks(
+            pool,
+            render_panel_body_block,
+            (lines for lines, _offset, _total in split_blocks(body)),
+            layout.inner_width,
+            layout.text_width,
+            layout.indent,
+            stops,
+            bg_stops,
+            console.width,
+            style,
+            console.color_system,
+            layout.frame,
+        )
+        for chunk in chunks:
+            write(chunk + "\n")
+    for index, row in enumerate(layout.bottom):
+        write(row)
+        write(end if index == len(layout.bottom) - 1 else "\n")
+    console.file.flush()
+
+
+def _page_panel(
+    frame_layout: Callable[[int], _FrameLayout],
+    body: str,
+    *,
+    stops: Stops,
+    bg_stops: Optional[Stops],
+    style: str,
+) -> None:
+    """Page through the panel, coloring only the body rows that are shown.
+
+    The frame is laid out again whenever the terminal changes width.
+    """
+    console = get_console()
+    lines = body.split("\n")
+
+    def source_at(columns: int) -> PanelRows:
+        layout = frame_layout(columns)
+        render_lines = partial(
+            render_panel_body_block,
+            inner_width=layout.inner_width,
+            text_width=layout.text_width,
+            indent=layout.indent,
+            stops=stops,
+            bg_stops=bg_stops,
+            span=columns,
+            style=style,
+            color_system=console.color_system,
+            frame=layout.frame,
+        )
+        return PanelRows(
+            layout.top,
+            layout.bottom,
+            lines,
+            layout.text_width,
+            lambda rows: render_lines(rows).split("\n"),
+        )
+
+    Pager(source_at(console.width), relayout=source_at).run()
+
+
 __all__ = ["panel_command"]
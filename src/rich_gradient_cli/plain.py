@@ -0,0 +1,73 @@
+"""Uncolored layout for output that will not show a gradient.
+
+When stdout is redirected, ``NO_COLOR`` is set or ``TERM=dumb``, the
+shared console drops every color the gradient would add. The commands then
+lay their content out with plain Rich renderables wrapped in
+``PlainLayout``, which reproduces the alignment and line handling of
+``rich_gradient.gradient.Gradient`` without computing a color per cell. This
+module never imports ``rich_gradient``, so neither do the plain paths.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from rich.align import Align, AlignMethod, VerticalAlignMethod
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.measure import Measurement
+from rich.segment import Segment
+
+RULE_CHARACTERS = {0: "─", 1: "━", 2: "═", 3: "█"}
+
+
+class PlainLayout:
+    """Lay out ``renderable`` the way a gradient would, minus the colors.
+
+    With a ``justify`` the renderable is aligned within the full width like
+    ``Gradient``; with ``justify=None`` it is rendered as-is and followed by
+    a blank line, as ``rich_gradient.rule.Rule`` does.
+    """
+
+    __slots__ = ("renderable", "justify", "vertical", "expand")
+
+    def __init__(
+        self,
+        renderable: RenderableType,
+        *,
+        justify: Optional[AlignMethod] = "left",
+        vertical: VerticalAlignMethod = "middle",
+        expand: bool = True,
+    ) -> None:
+        self.renderable = renderable
+        self.justify = justify
+        self.vertical = vertical
+        self.expand = expand
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        return Measurement(0, options.max_width)
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        content: RenderableType = self.renderable
+        if self.justify is not None:
+            content = Align(
+                content,
+                align=self.justify,
+                vertical=self.vertical,
+                width=options.max_width,
+                pad=self.expand,
+            )
+        lines = console.render_lines(content, options, pad=True, new_lines=False)
+        new_line = Segment.line()
+        for index, line in enumerate(lines):
+            if index:
+                yield new_line
+            yield from line
+        if self.justify is None:
+            yield new_line
+
+
+__all__ = ["PlainLayout", "RULE_CHARACTERS"]
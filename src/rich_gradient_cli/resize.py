@@ -0,0 +1,87 @@
+"""Terminal resize notifications that cannot be missed.
+
+A Python signal handler only runs between bytecodes, so a loop that paints
+and then blocks (``signal.pause()``, ``os.read``) loses a ``SIGWINCH`` that
+arrives in between and sleeps at the old size until the next signal.
+``ResizeWatch`` routes signals through ``signal.set_wakeup_fd`` instead: the
+byte the interpreter writes for each signal stays in a pipe until ``wait``
+reads it, however late that is.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import signal
+from types import TracebackType
+from typing import Any, List, Optional, Tuple, Type
+
+from . import termprobe
+
+
+def _ignore(_signum: int, _frame: object) -> None:
+    """Python-level handler so the interpreter writes ``SIGWINCH`` to the wakeup fd."""
+
+
+class ResizeWatch:
+    """Context manager that turns ``SIGWINCH`` into a readable pipe.
+
+    Must be entered on the main thread. Other signals with Python handlers
+    (such as ``SIGINT``) also wake ``wait``, and their handlers still run.
+    """
+
+    def __init__(self) -> None:
+        self._read = self._write = -1
+        self._previous_fd = -1
+        self._previous_handler: Any = signal.SIG_DFL
+
+    def __enter__(self) -> "ResizeWatch":
+        if not hasattr(signal, "SIGWINCH"):
+            raise RuntimeError("Resizes need a terminal that sends SIGWINCH.")
+        self._read, self._write = os.pipe()
+        os.set_blocking(self._read, False)
+        os.set_blocking(self._write, False)
+        self._previous_handler = signal.signal(signal.SIGWINCH, _ignore)
+        self._previous_fd = signal.set_wakeup_fd(self._write, warn_on_full_buffer=False)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        signal.set_wakeup_fd(self._previous_fd)
+        signal.signal(signal.SIGWINCH, self._previous_handler or signal.SIG_DFL)
+        os.close(self._read)
+        os.close(self._write)
+
+    def _drain(self) -> bool:
+        """Empty the pipe; return True if a ``SIGWINCH`` was among the signals."""
+        resized = False
+        while True:
+            try:
+                data = os.read(self._read, 512)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            resized = resized or signal.SIGWINCH in data
+        if resized:
+            termprobe.invalidate()
+        return resized
+
+    def wait(
+        self, *fds: int, timeout: Optional[float] = None
+    ) -> Tuple[bool, List[int]]:
+        """Block until a signal arrives or one of ``fds`` is readable.
+
+        Returns whether the terminal was resized since the last call and
+        which of ``fds`` are ready to read.
+        """
+        ready, _, _ = select.select([self._read, *fds], [], [], timeout)
+        resized = self._drain() if self._read in ready else False
+        return resized, [fd for fd in ready if fd != self._read]
+
+
+__all__ = ["ResizeWatch"]
@@ -4,14 +4,50 @@ from __future__ import annotations
 
 from typing import Literal, Optional, cast
 
-import typer
+import click
 from rich.align import AlignMethod
+from rich.rule import Rule as RichRule
+
+import typer
 
-from rich_gradient.rule import Rule
+from .common import color_enabled, export_svg, get_console, parse_style
+from .html_export import export_html
+from .live import run_live
+from .options import (
+    BGCOLORS,
+    COLORS,
+    CSS,
+    END,
+    HTML,
+    HUES,
+    RAINBOW,
+    SEED,
+    SVG,
+    SVG_MINIFY,
+    SVGZ,
+    THEME,
+    GradientOptions,
+    shared_options,
+)
+from .plain import RULE_CHARACTERS, PlainLayout
 
-from .common import console, export_svg, parse_colors, parse_style
+RULE_HUES = HUES.replace(default=10)
 
 
+@shared_options(
+    COLORS,
+    BGCOLORS,
+    RAINBOW,
+    RULE_HUES,
+    SEED,
+    THEME,
+    END,
+    SVG,
+    SVGZ,
+    SVG_MINIFY,
+    HTML,
+    CSS,
+)
 def rule_command(
     title: Optional[str] = typer.Option(
         None,
@@ -31,55 +67,6 @@ def rule_command(
         ),
         show_default=True,
     ),
-    colors: Optional[str] = typer.Option(
-        "",
-        "-c",
-        "--colors",
-        metavar="COLORS",
-        help=(
-            "Comma-separated list of colors for the gradient. [dim](e.g., "
-            "`[/][red]red[/][dim], [/][#ff9900]#ff9900[/][dim], [/][yellow]yellow[/][dim]`)."
-        ),
-        show_default=True,
-    ),
-    bgcolors: Optional[str] = typer.Option(
-        "",
-        "--bgcolors",
-        metavar="BGCOLORS",
-        help=(
-            "Comma-separated list of background colors for the gradient. [dim](e.g., "
-            "`[/][red]red[/][dim], [/][#ff9900]#ff9900[/][dim], [/][#ff0]#ff0[/][dim]`). "
-            "Defaults to [/][bold #fff]transparent[/][dim].[/dim]"
-        ),
-    ),
-    rainbow: bool = typer.Option(
-        False,
-        "-r",
-        "--rainbow",
-        help="[#ff0000]U[/][#ff3b00]s[/][#ff5100]e[/][#ff7400] [/]\
-[#ff9000]r[/][#ffa900]a[/][#ffc000]i[/][#ffd700]n[/]\
-[#ffee00]b[/][#f7ff00]o[/][#d3ff00]w[/][#a7ff00] [/] \
-[#7dff00]c[/][#2eff00]o[/][#00ff64]l[/][#00ff8e]o[/][#00ffc0]r[/]\
-[#00ffec]s[/][#00f4ff] [/][#00ddff]f[/][#00c5ff]o[/][#00afff]r[/]\
-[#1596ff] [/][#3b81ff]t[/][#4e67ff]h[/][#675fff]e[/][#7b57ff] [/]\
-[#924bff]g[/][#a73bff]r[/][#c72cff]a[/][#eb1cff]d[/][#ff00f2]i[/]\
-[#ff00ce]e[/][#ff00a4]n[/][#ff0084]t[/][#ff0054].[/]",
-    ),
-    hues: int = typer.Option(
-        10,
-        "--hues",
-        metavar="HUES",
-        help="The number of hues to use for a random gradient.",
-        show_default=True,
-    ),
-    end: str = typer.Option(
-        "\n",
-        "--end",
-        metavar="END",
-        help=(
-            "String appended after the text is printed. [dim]\\[default: '\\n'][/dim]"
-        ),
-    ),
     thickness: int = typer.Option(
         2,
         "-T",
@@ -96,31 +83,71 @@ def rule_command(
         show_default=True,
         case_sensitive=False,
     ),
-    svg: Optional[str] = typer.Option(
-        None,
-        "--svg",
-        metavar="SVG",
-        help="Save output as an SVG file.",
+    live: bool = typer.Option(
+        False,
+        "--live",
+        help=(
+            "Stay resident and repaint when the terminal is resized. [dim]Layouts "
+            "for recent widths are cached; press Ctrl+C to exit.[/]"
+        ),
     ),
+    *,
+    gradient: GradientOptions,
+    end: str,
+    svg: Optional[str],
+    svgz: Optional[str],
+    svg_minify: bool,
+    html: Optional[str],
+    css: Optional[str],
 ) -> None:
     """Display a gradient rule in the console."""
-    _colors = parse_colors(colors)
-    _bgcolors = parse_colors(bgcolors)
+    console = get_console()
     _title_style = parse_style(title_style)
+    export = bool(svg or svgz or html)
+    if live and export:
+        raise click.UsageError(
+            "--live cannot be combined with --svg, --svgz or --html."
+        )
+    if live and not console.is_terminal:
+        raise click.UsageError("--live needs an interactive terminal.")
+
+    if not (export or live or color_enabled()):
+        plain_title = None
+        if title:
+            plain_title = console.render_str(title, style="rule.text")
+            plain_title.stylize(_title_style)
+        plain = RichRule(
+            title=plain_title or "",
+            characters=RULE_CHARACTERS.get(thickness, RULE_CHARACTERS[2]),
+            end=end,
+            align=cast(AlignMethod, align),
+        )
+        console.print(PlainLayout(plain, justify=None))
+        return
+
+    from rich_gradient.rule import Rule
 
     rule = Rule(
         title=title or "",
         title_style=_title_style,
-        colors=_colors,
-        rainbow=rainbow,
-        hues=hues,
-        bg_colors=_bgcolors,
+        colors=gradient.fg_list,
+        rainbow=gradient.rainbow,
+        hues=gradient.hues,
+        bg_colors=gradient.bg_list,
         thickness=thickness,
         end=end,
         align=cast(AlignMethod, align),
     )
     if svg:
-        export_svg(rule, svg, end=end)
+        export_svg(rule, svg, end=end, minify=svg_minify)
+    if svgz:
+        export_svg(rule, svgz, end=end, minify=True, compress=True)
+    if html:
+        export_html(rule, html, css_path=css, end=end)
+    if export:
+        return
+    if live:
+        run_live(rule, command="rule")
         return
     console.print(rule)
 
@@ -0,0 +1,147 @@
+"""Minimal ANSI SGR writer used by the CLI's fast render paths."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Sequence
+
+from rich.cells import cell_len
+from rich.color import Color
+from rich.console import COLOR_SYSTEMS
+from rich.segment import Segment
+from rich.style import Style
+
+from .lut import Rgb, Stops, text_colors
+
+RESET = "\x1b[0m"
+_MARK = "\x00"
+_ESCAPE = re.compile(r"\x1b\[[0-9;:?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)")
+
+
+@lru_cache(maxsize=8192)
+def style_prefix(style: Style, color_system: Optional[str]) -> str:
+    """Return the escape sequence that opens ``style`` for ``color_system``."""
+    if color_system is None or not style:
+        return ""
+    rendered = style.render(_MARK, color_system=COLOR_SYSTEMS[color_system])
+    return rendered.partition(_MARK)[0]
+
+
+@lru_cache(maxsize=8192)
+def color_prefix(
+    color: Rgb,
+    bgcolor: Optional[Rgb],
+    base: Style,
+    color_system: Optional[str],
+) -> str:
+    """Return the escape sequence for a gradient color layered over ``base``."""
+    layer = Style(
+        color=Color.from_rgb(*color),
+        bgcolor=Color.from_rgb(*bgcolor) if bgcolor is not None else None,
+    )
+    return style_prefix(base + layer, color_system)
+
+
+@lru_cache(maxsize=1024)
+def paint_template(stops: Stops, length: int, color_system: str) -> bytes:
+    """Return a ``%c`` format painting ``length`` characters with ``stops``.
+
+    Filling the template with ``template % tuple(token)`` interleaves the
+    escape prefixes and the token's bytes in a single C-level operation.
+    """
+    null = Style.null()
+    prefixes = (
+        color_prefix(color, None, null, color_system)
+        .encode("ascii")
+        .replace(b"%", b"%%")
+        for color in text_colors(stops, length)
+    )
+    return b"".join(prefix + b"%c" for prefix in prefixes) + RESET.encode("ascii")
+
+
+def paint_bytes(token: bytes, stops: Stops, color_system: str) -> bytes:
+    """Return UTF-8 ``token`` painted with a gradient spanning its characters."""
+    if token.isascii():
+        return paint_template(stops, len(token), color_system) % tuple(token)
+    text = token.decode("utf-8", "replace")
+    template = paint_template(stops, len(text), color_system).decode("ascii")
+    return (template % tuple(text)).encode("utf-8")
+
+
+def segments_to_ansi(segments: Iterable[Segment], color_system: Optional[str]) -> str:
+    """Encode already-styled Rich segments as a single ANSI string."""
+    if color_system is None:
+        return "".join(segment.text for segment in segments)
+    system = COLOR_SYSTEMS[color_system]
+    return "".join(
+        style.render(text, color_system=system) if style else text
+        for text, style, _control in segments
+    )
+
+
+def paint(
+    text: str,
+    colors: Sequence[Rgb],
+    color_system: Optional[str],
+    *,
+    base: Style = Style.null(),
+    bgcolors: Optional[Sequence[Rgb]] = None,
+) -> str:
+    """Color ``text`` one character per entry in ``colors``.
+
+    Runs of identical escapes are coalesced and the line is closed with a
+    single reset.
+    """
+    if color_system is None or not text:
+        return text
+    parts: List[str] = []
+    append = parts.append
+    current = ""
+    run_start = 0
+    for index, color in enumerate(colors):
+        bg = bgcolors[index] if bgcolors is not None else None
+        prefix = color_prefix(color, bg, base, color_system)
+        if prefix != current:
+            if index > run_start:
+                append(text[run_start:index])
+            append(prefix)
+            current = prefix
+            run_start = index
+    append(text[run_start:])
+    if current:
+        append(RESET)
+    return "".join(parts)
+
+
+class OutputSize(NamedTuple):
+    """Byte, visible-cell and escape-sequence counts for a rendered output."""
+
+    bytes: int
+    cells: int
+    escapes: int
+
+    @property
+    def bytes_per_cell(self) -> float:
+        """Return the encoded bytes spent per visible cell."""
+        return self.bytes / self.cells if self.cells else float(self.bytes)
+
+
+def measure_ansi(text: str) -> OutputSize:
+    """Count the UTF-8 bytes, visible cells and escape sequences in ``text``."""
+    plain, escapes = _ESCAPE.subn("", text)
+    cells = sum(cell_len(line) for line in plain.splitlines())
+    return OutputSize(len(text.encode("utf-8")), cells, escapes)
+
+
+__all__ = [
+    "OutputSize",
+    "RESET",
+    "color_prefix",
+    "measure_ansi",
+    "paint",
+    "paint_bytes",
+    "paint_template",
+    "segments_to_ansi",
+    "style_prefix",
+]
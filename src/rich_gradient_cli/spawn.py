@@ -0,0 +1,272 @@
+"""Run a command under pseudo-terminals and paint its output line by line.
+
+The child's stdout and stderr are each attached to a pseudo-terminal of their
+own, so the command keeps the line buffering and terminal behavior it would
+have interactively while the two streams stay apart. Both masters are read
+with non-blocking reads from one asyncio loop. Every complete line is painted
+with its stream's gradient as soon as its chunk arrives, and a trailing
+partial line (a prompt, a progress counter) is written once it has waited
+``LATENCY`` seconds, so no output is held back longer than that.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import struct
+import sys
+from typing import BinaryIO, List, Optional, Sequence, Tuple
+
+from .lut import Stops
+from .metrics import BYTES_WRITTEN, RENDERS
+from .sgr import paint_bytes
+
+LATENCY = 0.05
+READ_SIZE = 1 << 16
+DRAIN_TIMEOUT = 1.0
+
+_ESCAPE = b"\x1b"
+_LINES = RENDERS.labels("exec")
+_WRITTEN = BYTES_WRITTEN.labels("exec")
+
+
+class LinePainter:
+    """Split one stream's bytes into lines and paint each with ``stops``.
+
+    Lines the command styled itself (anything containing an escape sequence)
+    are passed through untouched, as is everything when ``color_system`` is
+    None.
+    """
+
+    __slots__ = ("stops", "color_system", "pending")
+
+    def __init__(self, stops: Stops, color_system: Optional[str]) -> None:
+        self.stops = stops
+        self.color_system = color_system
+        self.pending = b""
+
+    def paint_line(self, line: bytes) -> bytes:
+        """Return ``line`` (without its newline) painted with the gradient."""
+        if self.color_system is None or not line or _ESCAPE in line:
+            return line
+        return paint_bytes(line, self.stops, self.color_system)
+
+    def feed(self, data: bytes) -> bytes:
+        """Return the complete lines of ``data`` painted; keep the remainder."""
+        data = self.pending + data
+        cut = data.rfind(b"\n") + 1
+        self.pending = data[cut:]
+        if not cut or self.color_system is None:
+            return data[:cut]
+        paint_line = self.paint_line
+        return b"".join(
+            paint_line(line) + b"\n" for line in data[: cut - 1].split(b"\n")
+        )
+
+    def flush(self) -> bytes:
+        """Return the pending partial line painted and forget it."""
+        pending, self.pending = self.pending, b""
+        return self.paint_line(pending)
+
+
+class _Reader:
+    """Read one pseudo-terminal master and write its painted lines to ``sink``."""
+
+    __slots__ = ("master", "painter", "sink", "latency", "loop", "timer", "done")
+
+    def __init__(
+        self,
+        master: int,
+        painter: LinePainter,
+        sink: BinaryIO,
+        latency: float,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self.master = master
+        self.painter = painter
+        self.sink: Optional[BinaryIO] = sink
+        self.latency = latency
+        self.loop = loop
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.done: asyncio.Future[None] = loop.create_future()
+        os.set_blocking(master, False)
+        loop.add_reader(master, self.on_readable)
+
+    def write(self, data: bytes) -> None:
+        if not data or self.sink is None:
+            return
+        try:
+            self.sink.write(data)
+            self.sink.flush()
+            _LINES.inc(data.count(b"\n"))
+            _WRITTEN.inc(len(data))
+        except BrokenPipeError:
+            # Keep draining the command so it is never blocked on a full
+            # pseudo-terminal, but stop writing where nobody is reading.
+            self.sink = None
+
+    def read(self) -> Optional[bytes]:
+        """Return available bytes, ``b""`` at end of output, None if none yet."""
+        try:
+            return os.read(self.master, READ_SIZE)
+        except BlockingIOError:
+            return None
+        except OSError:
+            # Linux reports EIO once every slave descriptor is closed.
+            return b""
+
+    def on_readable(self) -> None:
+        data = self.read()
+        if data is None:
+            return
+        if not data:
+            self.finish()
+            return
+        painter = self.painter
+        self.write(painter.feed(data))
+        if not painter.pending:
+            self.cancel_timer()
+        elif len(painter.pending) >= READ_SIZE:
+            self.flush_partial()
+        elif self.timer is None:
+            self.timer = self.loop.call_later(self.latency, self.flush_partial)
+
+    def flush_partial(self) -> None:
+        self.cancel_timer()
+        self.write(self.painter.flush())
+
+    def cancel_timer(self) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+    def finish(self) -> None:
+        if self.done.done():
+            return
+        self.loop.remove_reader(self.master)
+        self.flush_partial()
+        self.done.set_result(None)
+
+    def close(self) -> None:
+        """Write whatever output is still buffered, then close the master."""
+        while not self.done.done():
+            data = self.read()
+            if not data:
+                break
+            self.write(self.painter.feed(data))
+        self.finish()
+        os.close(self.master)
+
+
+def window_size() -> bytes:
+    """Return the terminal size of stdout packed for ``TIOCSWINSZ``."""
+    try:
+        size = os.get_terminal_size(sys.stdout.fileno())
+    except (AttributeError, ValueError, OSError):
+        from .startup import terminal_width
+
+        return struct.pack("HHHH", 24, terminal_width(), 0, 0)
+    return struct.pack("HHHH", size.lines, size.columns, 0, 0)
+
+
+def _prepare(slave: int, size: bytes) -> None:
+    """Size ``slave`` like our terminal and keep newlines as written."""
+    import fcntl
+    import termios
+
+    fcntl.ioctl(slave, termios.TIOCSWINSZ, size)
+    attributes = termios.tcgetattr(slave)
+    # Without output processing the command's ``\n`` reaches us as ``\n``
+    # rather than ``\r\n``, so redirected output stays byte-for-byte.
+    attributes[1] &= ~termios.OPOST
+    termios.tcsetattr(slave, termios.TCSANOW, attributes)
+
+
+def _resize(masters: Sequence[int]) -> None:
+    import fcntl
+    import termios
+
+    size = window_size()
+    for master in masters:
+        try:
+            fcntl.ioctl(master, termios.TIOCSWINSZ, size)
+        except OSError:
+            pass
+
+
+async def _run(
+    argv: Sequence[str],
+    streams: Sequence[Tuple[LinePainter, BinaryIO]],
+    latency: float,
+) -> int:
+    import pty
+
+    loop = asyncio.get_running_loop()
+    size = window_size()
+    pairs = [pty.openpty() for _ in streams]
+    masters = [master for master, _slave in pairs]
+    try:
+        for _master, slave in pairs:
+            _prepare(slave, size)
+        process = await asyncio.create_subprocess_exec(
+            *argv, stdout=pairs[0][1], stderr=pairs[1][1]
+        )
+    except BaseException:
+        for master in masters:
+            os.close(master)
+        raise
+    finally:
+        for _master, slave in pairs:
+            os.close(slave)
+
+    readers: List[_Reader] = [
+        _Reader(master, painter, sink, latency, loop)
+        for master, (painter, sink) in zip(masters, streams)
+    ]
+    # The terminal sends ^C and ^\ to the command too, so the runner ignores
+    # them and lets the command decide; signals aimed at the runner alone
+    # are passed on.
+    handled = [signal.SIGINT, signal.SIGQUIT, signal.SIGTERM, signal.SIGHUP]
+    loop.add_signal_handler(signal.SIGINT, lambda: None)
+    loop.add_signal_handler(signal.SIGQUIT, lambda: None)
+    for forwarded in (signal.SIGTERM, signal.SIGHUP):
+        loop.add_signal_handler(forwarded, process.send_signal, forwarded)
+    if sys.stdout.isatty():
+        handled.append(signal.SIGWINCH)
+        loop.add_signal_handler(signal.SIGWINCH, _resize, masters)
+    try:
+        returncode = await process.wait()
+        await asyncio.wait([reader.done for reader in readers], timeout=DRAIN_TIMEOUT)
+    finally:
+        for handled_signal in handled:
+            loop.remove_signal_handler(handled_signal)
+        for reader in readers:
+            reader.close()
+    return returncode
+
+
+def run_command(
+    argv: Sequence[str],
+    stdout_painter: LinePainter,
+    stderr_painter: LinePainter,
+    *,
+    stdout: Optional[BinaryIO] = None,
+    stderr: Optional[BinaryIO] = None,
+    latency: float = LATENCY,
+) -> int:
+    """Run ``argv`` under pseudo-terminals, painting its output; return its status.
+
+    A command killed by a signal reports ``128 + signal`` like a shell.
+    """
+    streams = (
+        (stdout_painter, stdout or sys.stdout.buffer),
+        (stderr_painter, stderr or sys.stderr.buffer),
+    )
+    for _painter, sink in streams:
+        sink.flush()
+    returncode = asyncio.run(_run(argv, streams, latency))
+    return 128 - returncode if returncode < 0 else returncode
+
+
+__all__ = ["LATENCY", "LinePainter", "READ_SIZE", "run_command", "window_size"]
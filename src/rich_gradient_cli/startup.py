@@ -0,0 +1,143 @@
+"""Answer trivial invocations before the Typer app is built.
+
+Importing every command module and registering its options costs far more
+than ``gradient --version`` or ``gradient -h`` needs, so ``entrypoint``
+asks ``run_fast_path`` first. None of these paths build the Typer app:
+the version comes from ``common``, the help screen is read from a cache
+keyed by everything that changes its rendering, and piped stdin with no
+arguments builds only the ``print`` command.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+HELP_ARGS = (["-h"], ["--help"])
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def terminal_width() -> int:
+    """Return the width Rich would pick for a forced-terminal console."""
+    if os.environ.get("TERM", "").lower() in ("dumb", "unknown"):
+        return 80
+    width = None
+    for fd in (0, 1, 2):
+        try:
+            width = os.get_terminal_size(fd).columns
+        except (AttributeError, ValueError, OSError):
+            continue
+        break
+    columns = os.environ.get("COLUMNS")
+    if columns is not None and columns.isdigit():
+        width = int(columns)
+    return width or 80
+
+
+def _source_stamp() -> str:
+    """Return the newest modification time among the package's modules."""
+    with os.scandir(_PACKAGE_DIR) as entries:
+        return str(
+            max(
+                (
+                    entry.stat().st_mtime_ns
+                    for entry in entries
+                    if entry.name.endswith(".py")
+                ),
+                default=0,
+            )
+        )
+
+
+def help_cache_path() -> Path:
+    """Return the cache file for the help screen in the current environment."""
+    from .common import VERSION, cache_dir
+
+    main = sys.modules.get("__main__")
+    key = "\0".join(
+        (
+            VERSION,
+            sys.argv[0] if sys.argv else "",
+            str(getattr(main, "__package__", None)),
+            str(terminal_width()),
+            _source_stamp(),
+        )
+    )
+    digest = hashlib.blake2s(key.encode("utf-8"), digest_size=8).hexdigest()
+    return cache_dir() / f"help-{digest}.txt"
+
+
+def render_help() -> str:
+    """Build the app and render its top-level help screen, as ``-h`` prints it."""
+    import typer
+
+    from .application import app
+
+    command = typer.main.get_command(app)
+    prog_name = os.path.basename(sys.argv[0])
+    with command.make_context(prog_name, [], resilient_parsing=True) as ctx:
+        return command.get_help(ctx) + "\n"
+
+
+def cached_help() -> str:
+    """Return the help screen, rendering and caching it on first use."""
+    path = help_cache_path()
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    text = render_help()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(f".{os.getpid()}.tmp")
+        partial.write_text(text, encoding="utf-8")
+        os.replace(partial, path)
+    except OSError:
+        pass
+    return text
+
+
+def print_stdin() -> None:
+    """Run ``print`` on piped stdin with every option at its default."""
+    import typer
+
+    from .help import RichTyperCommand
+    from .text_command import print_command
+
+    single = typer.Typer(add_completion=False, rich_markup_mode="rich")
+    single.command("print", cls=RichTyperCommand)(print_command)
+    typer.main.get_command(single).main([], prog_name="gradient")
+
+
+def run_fast_path(argv: List[str], stdin_isatty: Optional[bool] = None) -> bool:
+    """Handle ``argv`` without the full app when possible; return True if handled."""
+    if argv == ["--version"]:
+        from .common import VERSION
+
+        sys.stdout.write(f"gradient version {VERSION}\n")
+        sys.stdout.flush()
+        return True
+    if argv and argv not in HELP_ARGS:
+        return False
+    if stdin_isatty is None:
+        stdin_isatty = sys.stdin.isatty()
+    if argv or stdin_isatty:
+        sys.stdout.write(cached_help())
+        sys.stdout.flush()
+        return True
+    print_stdin()
+    return True
+
+
+__all__ = [
+    "HELP_ARGS",
+    "cached_help",
+    "help_cache_path",
+    "print_stdin",
+    "render_help",
+    "run_fast_path",
+    "terminal_width",
+]
@@ -0,0 +1,191 @@
+"""Minified and gzip-compressed SVG export.
+
+Rich's SVG gives every gradient cell its own ``<text>`` with a long,
+per-export class name, a ``clip-path`` and full float precision. ``minify_svg``
+rewrites that markup without changing what it draws: identifiers shrink to a
+letter or two, numbers keep two decimals, each line's cells share one
+clipped group, adjacent cells or backgrounds with the same style merge into
+one run, and invisible blank cells are dropped. ``write_svg`` streams the
+result through gzip for ``.svgz`` files, with a zero timestamp so identical
+renders produce identical artifacts.
+"""
+
+from __future__ import annotations
+
+import gzip
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Match, Optional, Union
+
+_IDENTIFIER = re.compile(r"\bterminal-\d+-([\w-]+)")
+_STYLE = re.compile(r"(<style>)(.*?)(</style>)", re.DOTALL)
+_CSS_SPACE = re.compile(r"\s*([{};:,>])\s*")
+_CSS_RULE = re.compile(r"\.([\w-]+)\s*\{([^}]*)\}")
+_HEX6 = re.compile(r"#([0-9a-fA-F])\1([0-9a-fA-F])\2([0-9a-fA-F])\3\b")
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_TAG = re.compile(r"<[^>]+>")
+_NUMBER = re.compile(r"(?<![\w#.])(-?\d+\.\d+)")
+_BETWEEN_TAGS = re.compile(r">\s+<")
+_TEXT = re.compile(
+    r'<text class="(?P<cls>[^"]+)" x="(?P<x>[^"]+)" y="(?P<y>[^"]+)" '
+    r'textLength="(?P<length>[^"]+)" clip-path="url\(#(?P<clip>[^)]+)\)">'
+    r"(?P<body>[^<]*)</text>"
+)
+_RECT = re.compile(
+    r'<rect fill="(?P<fill>[^"]+)" x="(?P<x>[^"]+)" y="(?P<y>[^"]+)" '
+    r'width="(?P<width>[^"]+)" height="(?P<height>[^"]+)" '
+    r'shape-rendering="crispEdges"/>'
+)
+_RUNS = re.compile(rf"(?:\s*(?:{_TEXT.pattern}))+")
+_RECTS = re.compile(rf"(?:\s*(?:{_RECT.pattern}))+")
+_BLANK = re.compile(r"^(?:\s|&#160;)*$")
+_EPSILON = 0.01
+
+
+def _short_name(index: int) -> str:
+    """Return the ``index``-th identifier: ``a`` ... ``z``, ``aa`` ..."""
+    name = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = chr(97 + remainder) + name
+    return name
+
+
+def _number(value: Union[str, float]) -> str:
+    """Format ``value`` with at most two decimals and no trailing zeros."""
+    text = f"{float(value):.2f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def _trim_numbers(tag: Match[str]) -> str:
+    return _NUMBER.sub(lambda match: _number(match.group(1)), tag.group())
+
+
+def _minify_css(match: Match[str]) -> str:
+    css = _CSS_SPACE.sub(r"\1", match.group(2).strip()).replace(";}", "}")
+    return match.group(1) + _HEX6.sub(r"#\1\2\3", css) + match.group(3)
+
+
+def _visible_on_blank(rules: Dict[str, str], cls: str) -> bool:
+    rule = rules.get(cls, "")
+    return "text-decoration" in rule or "stroke" in rule
+
+
+def _merge_texts(block: str, rules: Dict[str, str]) -> str:
+    """Group one run of cell ``<text>`` tags by line and merge equal neighbors."""
+    out: List[str] = []
+    clip: Optional[str] = None
+    run: Optional[List[str]] = None  # [cls, x, y, length, body]
+
+    def flush_run() -> None:
+        if run is not None:
+            cls, x, y, length, body = run
+            out.append(
+                f'<text class="{cls}" x="{_number(x)}" y="{_number(y)}" '
+                f'textLength="{_number(length)}">{body}</text>'
+            )
+
+    for match in _TEXT.finditer(block):
+        cls, body = match["cls"], match["body"]
+        if _BLANK.match(body) and not _visible_on_blank(rules, cls):
+            continue
+        if match["clip"] != clip:
+            flush_run()
+            run = None
+            if clip is not None:
+                out.append("</g>")
+            clip = match["clip"]
+            out.append(f'<g clip-path="url(#{clip})">')
+        x, length = float(match["x"]), float(match["length"])
+        if (
+            run is not None
+            and run[0] == cls
+            and run[2] == match["y"]
+            and abs(float(run[1]) + float(run[3]) - x) < _EPSILON
+        ):
+            run[3] = str(float(run[3]) + length)
+            run[4] += body
+            continue
+        flush_run()
+        run = [cls, match["x"], match["y"], str(length), body]
+    flush_run()
+    if clip is not None:
+        out.append("</g>")
+    return "".join(out)
+
+
+def _merge_rects(block: str) -> str:
+    """Merge horizontally adjacent background rectangles of the same fill."""
+    out: List[str] = []
+    run: Optional[List[str]] = None  # [fill, x, y, width, height]
+
+    def flush_run() -> None:
+        if run is not None:
+            fill, x, y, width, height = run
+            out.append(
+                f'<rect fill="{fill}" x="{_number(x)}" y="{_number(y)}" '
+                f'width="{_number(width)}" height="{_number(height)}" '
+                'shape-rendering="crispEdges"/>'
+            )
+
+    for match in _RECT.finditer(block):
+        if (
+            run is not None
+            and run[0] == match["fill"]
+            and run[2] == match["y"]
+            and run[4] == match["height"]
+            and abs(float(run[1]) + float(run[3]) - float(match["x"])) < _EPSILON
+        ):
+            run[3] = str(float(run[3]) + float(match["width"]))
+            continue
+        flush_run()
+        run = [
+            match["fill"],
+            match["x"],
+            match["y"],
+            match["width"],
+            match["height"],
+        ]
+    flush_run()
+    return "".join(out)
+
+
+def minify_svg(svg: str) -> str:
+    """Return Rich's ``svg`` with the same drawing in far fewer bytes."""
+    names: Dict[str, str] = {}
+    svg = _IDENTIFIER.sub(
+        lambda match: names.setdefault(match.group(1), _short_name(len(names))), svg
+    )
+    rules = {name: body for name, body in _CSS_RULE.findall(svg)}
+    svg = _COMMENT.sub("", svg)
+    svg = _RUNS.sub(lambda match: _merge_texts(match.group(), rules), svg)
+    svg = _RECTS.sub(lambda match: _merge_rects(match.group()), svg)
+    svg = _STYLE.sub(_minify_css, svg)
+    svg = _TAG.sub(_trim_numbers, svg)
+    return _BETWEEN_TAGS.sub("><", svg.strip())
+
+
+def _chunks(text: str, size: int = 1 << 16) -> Iterator[bytes]:
+    for start in range(0, len(text), size):
+        yield text[start : start + size].encode("utf-8")
+
+
+def write_svg(
+    svg: str, path: Union[str, Path], *, minify: bool = False, compress: bool = False
+) -> None:
+    """Write ``svg`` to ``path``, optionally minified and gzip-compressed."""
+    if minify:
+        svg = minify_svg(svg)
+    if not compress:
+        Path(path).write_text(svg, encoding="utf-8")
+        return
+    with (
+        open(path, "wb") as raw,
+        gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0) as stream,
+    ):
+        for chunk in _chunks(svg):
+            stream.write(chunk)
+
+
+__all__ = ["minify_svg", "write_svg"]
@@ -0,0 +1,101 @@
+"""Multi-file follower command wiring for the CLI."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List, Optional
+
+import typer
+
+from .common import color_enabled, get_console, resolve_colors
+from .follow import TAIL_LINES, BatchWriter, follow, make_sources
+from .metrics import exporting
+
+
+def tail_command(
+    files: List[str] = typer.Argument(..., metavar="FILE..."),
+    lines: int = typer.Option(
+        TAIL_LINES,
+        "-n",
+        "--lines",
+        metavar="N",
+        min=0,
+        help=f"Lines to show from the end of each file first. [dim](default: {TAIL_LINES})[/]",
+    ),
+    follow_files: bool = typer.Option(
+        True,
+        "--follow/--no-follow",
+        help="Keep printing lines as the files grow.",
+    ),
+    colors: Optional[str] = typer.Option(
+        None,
+        "-c",
+        "--colors",
+        metavar="COLORS",
+        help=(
+            "Comma-separated colors; each file's gradient runs from one to the "
+            "next. [dim](default: a distinct hue per file)[/]"
+        ),
+    ),
+    flush_interval: float = typer.Option(
+        0.0,
+        "--flush-interval",
+        metavar="MS",
+        min=0.0,
+        help=(
+            "Write output in one batch every MS milliseconds instead of as lines "
+            "arrive. [dim](default: 0)[/]"
+        ),
+    ),
+    poll: Optional[float] = typer.Option(
+        None,
+        "--poll",
+        metavar="SECONDS",
+        min=0.01,
+        help="Check the files every SECONDS instead of waiting on inotify.",
+    ),
+) -> None:
+    """Follow one or more files, giving each its own gradient and prefix.
+
+    Lines from every file are interleaved whole into one output.
+    """
+    console = get_console()
+    stops = tuple(
+        tuple(color)
+        for color in resolve_colors(colors) or ()
+        if not isinstance(color, str)
+    )
+    sources = make_sources(
+        files,
+        console.color_system if color_enabled() else None,
+        stops,  # type: ignore[arg-type]
+    )
+    writer = BatchWriter(typer.get_binary_stream("stdout"))
+    try:
+        for source in sources:
+            try:
+                writer.write(source.open(lines))
+            except OSError as error:
+                raise typer.BadParameter(
+                    f"{source.path}: {error.strerror}", param_hint="'FILE...'"
+                ) from error
+        if not follow_files:
+            for source in sources:
+                writer.write(source.finish())
+            writer.flush()
+            return
+        writer.flush()
+        with exporting():
+            asyncio.run(
+                follow(sources, writer, flush_interval=flush_interval / 1000, poll=poll)
+            )
+    except BrokenPipeError:
+        return
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for source in sources:
+            source.close()
+
+
+__all__ = ["tail_command"]
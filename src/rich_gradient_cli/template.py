@@ -0,0 +1,244 @@
+"""Precompiled gradient banners with fill-in slots.
+
+A template is the captured output of a ``print``, ``panel`` or ``rule``
+command whose text contained slot placeholders such as ``{host:20}``. Every
+cell keeps the color Rich gave it, and slot cells are tagged with the slot
+and position they belong to. Rendering substitutes slot values cell by cell
+and joins precomputed escape sequences, so no Rich layout runs at all.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from rich.ansi import AnsiDecoder
+from rich.cells import get_character_cell_size
+from rich.console import Console
+from rich.segment import Segment
+from rich.style import Style
+
+from .sgr import RESET, style_prefix
+
+FORMAT_VERSION = 1
+SLOT_BASE = 0xF0000
+SLOT_SPAN = 1024
+MAX_SLOTS = (0xFFFFD - SLOT_BASE) // SLOT_SPAN
+
+_PLACEHOLDER = re.compile(r"\{([A-Za-z_]\w*)(?::(\d+))?\}")
+_SLOT_CELLS = re.compile("[\U000f0000-\U000ffffd]+")
+
+Slot = Tuple[str, int]
+Run = Tuple[str, int]
+Part = Union[str, Tuple[int, int, int, str]]
+
+
+class TemplateError(ValueError):
+    """Raised when a banner template cannot be compiled or loaded."""
+
+
+def substitute_slots(text: str, slots: List[Slot]) -> str:
+    """Replace ``{name}``/``{name:width}`` placeholders with slot marker cells.
+
+    New slots are appended to ``slots``. ``{name}`` reserves as many cells as
+    the placeholder itself occupies.
+    """
+
+    def marker(match: "re.Match[str]") -> str:
+        name, width = match.group(1), match.group(2)
+        cells = int(width) if width else len(match.group(0))
+        if not 0 < cells <= SLOT_SPAN:
+            raise TemplateError(f"Slot '{name}' must be 1-{SLOT_SPAN} cells wide.")
+        if len(slots) >= MAX_SLOTS:
+            raise TemplateError(f"A template can hold at most {MAX_SLOTS} slots.")
+        base = SLOT_BASE + len(slots) * SLOT_SPAN
+        slots.append((name, cells))
+        return "".join(chr(base + position) for position in range(cells))
+
+    return _PLACEHOLDER.sub(marker, text)
+
+
+def _cells(value: str, width: int) -> List[str]:
+    """Split ``value`` into exactly ``width`` cells, truncating or padding."""
+    cells: List[str] = []
+    for character in value:
+        size = get_character_cell_size(character)
+        if size == 0:
+            continue
+        if len(cells) + size > width:
+            break
+        cells.append(character)
+        if size == 2:
+            cells.append("")
+    cells.extend(" " * (width - len(cells)))
+    return cells
+
+
+class BannerTemplate:
+    """A compiled banner whose slots can be filled without Rich layout.
+
+    ``render`` returns ANSI text for the CLI; ``segments`` yields Rich
+    segments so a template can be embedded in other renderables via
+    ``rich.segment.Segments``.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        slots: Sequence[Slot],
+        styles: Sequence[str],
+        rows: Sequence[Sequence[Run]],
+    ) -> None:
+        self.width = width
+        self.slots: List[Slot] = [(name, int(cells)) for name, cells in slots]
+        self.styles: List[str] = list(styles)
+        self.rows: List[List[Run]] = [
+            [(text, int(style)) for text, style in row] for row in rows
+        ]
+        self._programs: Dict[Optional[str], List[Part]] = {}
+
+    @property
+    def slot_names(self) -> List[str]:
+        """Return the distinct slot names in order of appearance."""
+        return list(dict.fromkeys(name for name, _cells in self.slots))
+
+    @classmethod
+    def from_ansi(
+        cls, output: str, slots: Sequence[Slot], width: int
+    ) -> "BannerTemplate":
+        """Build a template from captured command output."""
+        console = Console(width=width, color_system="truecolor", force_terminal=True)
+        style_ids: Dict[str, int] = {"": 0}
+        rows: List[List[Run]] = []
+        for line in AnsiDecoder().decode(output.rstrip("\n")):
+            row: List[Run] = []
+            for text, style, _control in line.render(console):
+                key = str(style) if style else ""
+                style_id = style_ids.setdefault(key, len(style_ids))
+                if row and row[-1][1] == style_id:
+                    row[-1] = (row[-1][0] + text, style_id)
+                else:
+                    row.append((text, style_id))
+            rows.append(row)
+        return cls(width, slots, list(style_ids), rows)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "BannerTemplate":
+        """Load a template written by ``save``."""
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as error:
+            raise TemplateError(f"Cannot read template {path}: {error}") from error
+        if data.get("format") != FORMAT_VERSION:
+            raise TemplateError(f"{path} is not a version {FORMAT_VERSION} template.")
+        return cls(data["width"], data["slots"], data["styles"], data["rows"])
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the template as compact JSON."""
+        payload = {
+            "format": FORMAT_VERSION,
+            "width": self.width,
+            "slots": self.slots,
+            "styles": self.styles,
+            "rows": self.rows,
+        }
+        Path(path).write_text(
+            json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+            encoding="utf-8",
+        )
+
+    def _split(self, text: str) -> Iterator[Union[str, Tuple[int, int, int]]]:
+        """Yield static text and ``(slot, start, end)`` ranges of a run."""
+        index = 0
+        for match in _SLOT_CELLS.finditer(text):
+            if match.start() > index:
+                yield text[index : match.start()]
+            codes = [ord(character) - SLOT_BASE for character in match.group(0)]
+            start = codes[0]
+            for previous, code in zip(codes, codes[1:]):
+                if code != previous + 1 or code // SLOT_SPAN != start // SLOT_SPAN:
+                    yield self._range(start, previous)
+                    start = code
+            yield self._range(start, codes[-1])
+            index = match.end()
+        if index < len(text):
+            yield text[index:]
+
+    @staticmethod
+    def _range(first: int, last: int) -> Tuple[int, int, int]:
+        slot, position = divmod(first, SLOT_SPAN)
+        return slot, position, position + last - first + 1
+
+    def _program(self, color_system: Optional[str]) -> List[Part]:
+        """Compile rows into static strings and slot ranges for a color system."""
+        program = self._programs.get(color_system)
+        if program is not None:
+            return program
+        prefixes = [
+            style_prefix(Style.parse(style), color_system) if style else ""
+            for style in self.styles
+        ]
+        program = []
+        static: List[str] = []
+        for row in self.rows:
+            for text, style_id in row:
+                prefix = prefixes[style_id]
+                for piece in self._split(text):
+                    if isinstance(piece, str):
+                        static.append(f"{prefix}{piece}{RESET}" if prefix else piece)
+                        continue
+                    if static:
+                        program.append("".join(static))
+                        static = []
+                    program.append((*piece, prefix))
+            static.append("\n")
+        if static:
+            program.append("".join(static))
+        self._programs[color_system] = program
+        return program
+
+    def render(
+        self, values: Mapping[str, str], color_system: Optional[str] = "truecolor"
+    ) -> str:
+        """Return the banner with ``values`` filled in, as ANSI text.
+
+        Missing slots render blank; longer values are truncated to the slot.
+        """
+        cells = [_cells(str(values.get(name, "")), width) for name, width in self.slots]
+        parts: List[str] = []
+        append = parts.append
+        for part in self._program(color_system):
+            if isinstance(part, str):
+                append(part)
+                continue
+            slot, start, end, prefix = part
+            text = "".join(cells[slot][start:end])
+            append(f"{prefix}{text}{RESET}" if prefix else text)
+        return "".join(parts)
+
+    def segments(self, values: Mapping[str, str]) -> Iterator[Segment]:
+        """Yield the filled-in banner as Rich segments."""
+        cells = [_cells(str(values.get(name, "")), width) for name, width in self.slots]
+        styles = [Style.parse(style) if style else None for style in self.styles]
+        for row in self.rows:
+            for text, style_id in row:
+                pieces = (
+                    piece
+                    if isinstance(piece, str)
+                    else "".join(cells[piece[0]][piece[1] : piece[2]])
+                    for piece in self._split(text)
+                )
+                yield Segment("".join(pieces), styles[style_id])
+            yield Segment.line()
+
+
+__all__ = [
+    "BannerTemplate",
+    "MAX_SLOTS",
+    "SLOT_SPAN",
+    "Slot",
+    "TemplateError",
+    "substitute_slots",
+]
@@ -0,0 +1,149 @@
+"""Banner template command wiring for the CLI."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+import typer
+
+from .common import capture_console, get_console
+from .help import RichTyperCommand, RichTyperGroup
+from .template import BannerTemplate, Slot, TemplateError, substitute_slots
+
+TEMPLATE_COMMANDS = ("print", "panel", "rule")
+
+template_app = typer.Typer(
+    cls=RichTyperGroup,
+    add_completion=False,
+    no_args_is_help=True,
+    help="Compile gradient banners once and render them with filled-in slots.",
+    rich_markup_mode="rich",
+)
+
+
+def _parse_values(values: Optional[List[str]], names: List[str]) -> Dict[str, str]:
+    """Parse repeated ``NAME=VALUE`` options, rejecting unknown slot names."""
+    parsed: Dict[str, str] = {}
+    for item in values or []:
+        name, sep, value = item.partition("=")
+        if not sep:
+            raise typer.BadParameter(f"Expected NAME=VALUE, got '{item}'.")
+        if name not in names:
+            known = ", ".join(names) or "none"
+            raise typer.BadParameter(f"Unknown slot '{name}' (slots: {known}).")
+        parsed[name] = value
+    return parsed
+
+
+def _leading_width(
+    args: List[str], width: Optional[int]
+) -> Tuple[Optional[int], List[str]]:
+    """Take ``--width`` given between OUTPUT and COMMAND off the front of ``args``.
+
+    Click stops parsing compile's own options at OUTPUT, because everything
+    from COMMAND on belongs to that command (``panel`` has its own
+    ``--width``).
+    """
+    args = list(args)
+    while args and args[0].startswith("-"):
+        option, sep, value = args.pop(0).partition("=")
+        if option != "--width":
+            raise click.UsageError(
+                f"No such option: {option}. Options for the compiled command "
+                "go after COMMAND."
+            )
+        if not sep:
+            if not args:
+                raise click.UsageError("Option '--width' requires an argument.")
+            value = args.pop(0)
+        try:
+            width = int(value)
+        except ValueError:
+            raise typer.BadParameter(
+                f"'{value}' is not a valid integer.", param_hint="'--width'"
+            ) from None
+    if not args:
+        raise click.UsageError("Missing argument 'COMMAND [ARGS]...'.")
+    return width, args
+
+
+@template_app.command(
+    "compile",
+    cls=RichTyperCommand,
+    context_settings={"ignore_unknown_options": True, "allow_interspersed_args": False},
+)
+def compile_command(
+    output: str = typer.Argument(..., metavar="OUTPUT"),
+    args: List[str] = typer.Argument(..., metavar="COMMAND [ARGS]..."),
+    width: Optional[int] = typer.Option(
+        None,
+        "--width",
+        metavar="WIDTH",
+        help="Terminal width to lay the banner out for. [dim]Defaults to the current width.[/]",
+    ),
+) -> None:
+    """Pre-render a print, panel or rule command into a banner template.
+
+    Write slots as [bold]{name}[/] or [bold]{name:WIDTH}[/] anywhere in the
+    command's text, title or subtitle. [bold]--width[/] may come before or
+    after OUTPUT; options after COMMAND belong to that command.
+    """
+    console = get_console()
+    width, args = _leading_width(args, width)
+    command, *command_args = args
+    if command not in TEMPLATE_COMMANDS:
+        raise typer.BadParameter(
+            f"Templates can be compiled from {', '.join(TEMPLATE_COMMANDS)}.",
+            param_hint="'COMMAND'",
+        )
+    unsupported = {"--svg", "--svgz", "--html", "--animate"} | (
+        {"-a"} if command == "panel" else set()
+    )
+    if unsupported & set(command_args):
+        raise click.UsageError(
+            "--animate, --svg, --svgz and --html cannot be compiled into a template."
+        )
+    slots: List[Slot] = []
+    try:
+        command_args = [substitute_slots(arg, slots) for arg in command_args]
+    except TemplateError as error:
+        raise typer.BadParameter(str(error)) from error
+
+    from . import app  # the package imports this module while building ``app``
+
+    layout_width = width or console.width
+    with capture_console(layout_width) as buffer:
+        app([command, *command_args], prog_name="gradient", standalone_mode=False)
+    if not buffer.getvalue().strip():
+        raise click.UsageError(f"'{command}' produced no output to compile.")
+    template = BannerTemplate.from_ansi(buffer.getvalue(), slots, layout_width)
+    template.save(output)
+    names = ", ".join(template.slot_names) or "no slots"
+    console.print(f"Compiled [bold]{output}[/] [dim]({names})[/]")
+
+
+@template_app.command("render", cls=RichTyperCommand)
+def render_command(
+    template_path: str = typer.Argument(..., metavar="TEMPLATE"),
+    values: Optional[List[str]] = typer.Option(
+        None,
+        "-v",
+        "--set",
+        metavar="NAME=VALUE",
+        help="Value for a slot. [dim](repeatable)[/]",
+    ),
+) -> None:
+    """Render a compiled banner template with slot values."""
+    console = get_console()
+    try:
+        template = BannerTemplate.load(template_path)
+    except TemplateError as error:
+        raise typer.BadParameter(str(error), param_hint="'TEMPLATE'") from error
+    filled = _parse_values(values, template.slot_names)
+    console.file.write(template.render(filled, console.color_system))
+    console.file.flush()
+
+
+__all__ = ["compile_command", "render_command", "template_app"]
@@ -0,0 +1,156 @@
+"""Terminal capabilities probed once per terminal and reused across runs.
+
+``Console()`` works out the color system from the environment, the terminal
+and platform checks every time it is built. A script calling ``gradient``
+thousands of times from one terminal gets the same answer each time, so the
+answer is kept in a one-line file under ``$XDG_RUNTIME_DIR`` (or the cache
+directory), named after everything that can change it: the tty device, the
+session and the ``TERM``/``COLORTERM``/``NO_COLOR``/``FORCE_COLOR``
+variables. The file also records the terminal size; a different size, or a
+``SIGWINCH`` in a resident mode, throws it away and the next run probes again.
+Output that is not a terminal is never cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import Any, Dict, NamedTuple, Optional
+
+_KEY_VARIABLES = (
+    "TERM",
+    "COLORTERM",
+    "NO_COLOR",
+    "FORCE_COLOR",
+    "TTY_COMPATIBLE",
+    "TTY_INTERACTIVE",
+)
+
+
+class Capabilities(NamedTuple):
+    """What the probe found: the color system (None for none) and the size."""
+
+    color_system: Optional[str]
+    columns: int
+    lines: int
+
+    def dumps(self) -> str:
+        return f"{self.color_system or 'none'} {self.columns} {self.lines}\n"
+
+    @classmethod
+    def loads(cls, text: str) -> Optional["Capabilities"]:
+        try:
+            color_system, columns, lines = text.split()
+            return cls(
+                None if color_system == "none" else color_system,
+                int(columns),
+                int(lines),
+            )
+        except ValueError:
+            return None
+
+
+def runtime_dir() -> str:
+    """Return the directory for per-terminal files that need not outlive a login."""
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    if base:
+        return os.path.join(base, "rich-gradient-cli")
+    from .common import cache_dir
+
+    return str(cache_dir() / "runtime")
+
+
+def probe_path(fd: int = 1) -> Optional[str]:
+    """Return the probe file for the terminal on ``fd``, or None if it is not one."""
+    try:
+        if not os.isatty(fd):
+            return None
+        key = [str(os.fstat(fd).st_rdev), str(os.getsid(0))]
+    except (AttributeError, OSError):
+        return None
+    environ = os.environ
+    key.extend(environ.get(name, "") for name in _KEY_VARIABLES)
+    digest = hashlib.blake2b("\0".join(key).encode(), digest_size=8).hexdigest()
+    return os.path.join(runtime_dir(), f"term-{digest}")
+
+
+def load(path: str, fd: int = 1) -> Optional[Capabilities]:
+    """Return the capabilities stored at ``path`` if the terminal size still matches."""
+    try:
+        handle = os.open(path, os.O_RDONLY)
+        try:
+            text = os.read(handle, 64).decode("ascii")
+        finally:
+            os.close(handle)
+        size = os.get_terminal_size(fd)
+    except (OSError, ValueError):
+        return None
+    capabilities = Capabilities.loads(text)
+    if capabilities is None or (capabilities.columns, capabilities.lines) != size:
+        return None
+    return capabilities
+
+
+def save(path: str, capabilities: Capabilities) -> None:
+    """Store ``capabilities`` at ``path``; failures only cost the next run a probe."""
+    directory, name = os.path.split(path)
+    temporary = os.path.join(directory, f".{name}.{os.getpid()}")
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        with open(temporary, "w", encoding="ascii") as handle:
+            handle.write(capabilities.dumps())
+        os.replace(temporary, path)
+    except OSError:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+
+
+def invalidate(fd: int = 1) -> None:
+    """Forget the probe for the terminal on ``fd``, e.g. after ``SIGWINCH``."""
+    path = probe_path(fd)
+    if path is not None:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def console_options(fd: int = 1) -> Dict[str, Any]:
+    """Return ``Console`` keyword arguments that skip a probe already cached."""
+    path = probe_path(fd)
+    if path is None:
+        return {}
+    capabilities = load(path, fd)
+    if capabilities is None:
+        return {}
+    return {
+        "color_system": capabilities.color_system,
+        "force_jupyter": False,
+        "legacy_windows": False,
+    }
+
+
+def remember(color_system: Optional[str], fd: int = 1) -> None:
+    """Cache a freshly probed ``color_system`` for the terminal on ``fd``."""
+    path = probe_path(fd)
+    if path is None:
+        return
+    try:
+        size = os.get_terminal_size(fd)
+    except OSError:
+        return
+    save(path, Capabilities(color_system, size.columns, size.lines))
+
+
+__all__ = [
+    "Capabilities",
+    "console_options",
+    "invalidate",
+    "load",
+    "probe_path",
+    "remember",
+    "runtime_dir",
+    "save",
+]
@@ -5,48 +5,61 @@ from __future__ import annotations
 import sys
 from typing import List, Literal, Optional, cast
 
-import typer
+import click
 from rich.console import JustifyMethod, OverflowMethod
+from rich.text import Text as RichText
+
+import typer
 
-from rich_gradient.text import Text
+from .blocks import (
+    ExecutorKind,
+    default_jobs,
+    make_executor,
+    render_text_block,
+    run_blocks,
+    split_blocks,
+)
+from .common import color_enabled, export_svg, get_console, parse_style
+from .cycle import RING_SIZE, CyclePeriod, GradientRing, parse_period, stream_cycle
+from .html_export import export_html
+from .lut import Stops
+from .metrics import exporting
+from .options import (
+    BGCOLORS,
+    COLORS,
+    CSS,
+    END,
+    HTML,
+    HUES,
+    RAINBOW,
+    SEED,
+    SVG,
+    SVG_MINIFY,
+    SVGZ,
+    THEME,
+    GradientOptions,
+    shared_options,
+)
 
-from .common import console, export_svg, parse_colors, parse_style
+PRINT_HUES = HUES.replace(decls=("-h", "--hues"), default=7)
 
 
+@shared_options(
+    COLORS,
+    BGCOLORS,
+    RAINBOW,
+    PRINT_HUES,
+    SEED,
+    THEME,
+    END,
+    SVG,
+    SVGZ,
+    SVG_MINIFY,
+    HTML,
+    CSS,
+)
 def print_command(
     text: Optional[List[str]] = typer.Argument(None),
-    colors: Optional[str] = typer.Option(
-        None,
-        "-c",
-        "--colors",
-        metavar="COLORS",
-        help=(
-            "Comma-separated list of colors for the gradient. [dim](e.g., "
-            "`[/][red]red[/][dim], [/][#ff9900]#ff9900[/][dim], [/][yellow]yellow[/][dim]`). "
-            "If no colors are provided, the color stops are automatically generated."
-        ),
-    ),
-    rainbow: bool = typer.Option(
-        False,
-        "-r",
-        "--rainbow",
-        help="[#ff0000]U[/][#ff3b00]s[/][#ff5100]e[/][#ff7400] [/]\
-[#ff9000]r[/][#ffa900]a[/][#ffc000]i[/][#ffd700]n[/]\
-[#ffee00]b[/][#f7ff00]o[/][#d3ff00]w[/][#a7ff00] [/] \
-[#7dff00]c[/][#2eff00]o[/][#00ff64]l[/][#00ff8e]o[/][#00ffc0]r[/]\
-[#00ffec]s[/][#00f4ff] [/][#00ddff]f[/][#00c5ff]o[/][#00afff]r[/]\
-[#1596ff] [/][#3b81ff]t[/][#4e67ff]h[/][#675fff]e[/][#7b57ff] [/]\
-[#924bff]g[/][#a73bff]r[/][#c72cff]a[/][#eb1cff]d[/][#ff00f2]i[/]\
-[#ff00ce]e[/][#ff00a4]n[/][#ff0084]t[/][#ff0054].[/]",
-    ),
-    hues: int = typer.Option(
-        7,
-        "-h",
-        "--hues",
-        metavar="HUES",
-        help="The number of hues to use for a random gradient.",
-        show_default=True,
-    ),
     style: Optional[str] = typer.Option(
         None,
         "--style",
@@ -79,28 +92,60 @@ def print_command(
         help="Disable wrapping of text.",
         show_default=True,
     ),
-    end: str = typer.Option(
-        "\n",
-        "--end",
-        metavar="END",
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        metavar="JOBS",
         help=(
-            "String appended after the text is printed. [dim]\\[default: '\\n'][/dim]"
+            "Color wrapped lines in blocks across JOBS workers. [dim]0 uses every "
+            "core. Input is treated as plain text (no markup).[/]"
         ),
+        show_default=True,
     ),
-    bgcolors: Optional[str] = typer.Option(
-        None,
-        "--bgcolors",
-        metavar="BGCOLORS",
-        help="Optional comma separated string of background colors. [dim]If not provided, background is transparent.[/]",
+    executor: Literal["auto", "thread", "process"] = typer.Option(
+        "auto",
+        "--executor",
+        metavar="EXECUTOR",
+        help=(
+            "Worker pool for --jobs. [lime](auto, thread, process)[/] [dim]auto uses "
+            "threads on free-threaded Python and processes otherwise.[/]"
+        ),
+        show_default=True,
+        case_sensitive=False,
     ),
-    svg: Optional[str] = typer.Option(
+    cycle: Optional[str] = typer.Option(
         None,
-        "--svg",
-        metavar="SVG",
-        help="Save output as an SVG file.",
+        "--cycle",
+        metavar="PERIOD",
+        help=(
+            "Stream stdin line by line with a gradient that repeats every PERIOD "
+            "lines, or every PERIOD seconds when given as [lime]2.5s[/] or "
+            "[lime]500ms[/]. [dim]Memory stays constant for endless input.[/]"
+        ),
     ),
+    *,
+    gradient: GradientOptions,
+    end: str,
+    svg: Optional[str],
+    svgz: Optional[str],
+    svg_minify: bool,
+    html: Optional[str],
+    css: Optional[str],
 ) -> None:
     """Print text in gradient color to the console."""
+    if cycle is not None:
+        if svg or svgz or html or jobs != 1:
+            raise click.UsageError(
+                "--cycle cannot be combined with --svg, --svgz, --html or --jobs."
+            )
+        if text and text != ["-"]:
+            raise click.UsageError("--cycle reads from stdin; pass '-' or no text.")
+        try:
+            period = parse_period(cycle)
+        except ValueError as error:
+            raise typer.BadParameter(str(error), param_hint="'--cycle'") from error
+        _print_cycle(period, gradient, style=style, end=end)
+        return
     if text:
         if len(text) == 1 and text[0] == "-":
             content = typer.get_text_stream("stdin").read().rstrip("\n")
@@ -115,25 +160,156 @@ def print_command(
         if not content:
             raise typer.BadParameter("Missing text argument.")
 
-    fg_list = parse_colors(colors)
-    bg_list = parse_colors(bgcolors)
+    export = bool(svg or svgz or html)
+    if not (export or color_enabled()):
+        plain = RichText.from_markup(
+            content,
+            style=parse_style(style),
+            justify=cast(JustifyMethod, justify),
+            overflow=cast(OverflowMethod, overflow),
+            end=end,
+        )
+        plain.no_wrap = no_wrap
+        _print_text(plain, justify, overflow, no_wrap, end)
+        return
+
+    if jobs != 1 and not export:
+        _print_blocks(
+            content,
+            stops=gradient.stops(),
+            bg_stops=gradient.bg_stops(),
+            style=style or "",
+            justify=justify,
+            overflow=overflow,
+            no_wrap=no_wrap,
+            end=end,
+            jobs=jobs,
+            executor=executor,
+        )
+        return
+
+    from rich_gradient.text import Text
+
     style_obj = parse_style(style)
-    gradient = Text(
+    rendered = Text(
         content,
-        colors=fg_list,
-        rainbow=rainbow,
-        hues=hues,
+        colors=gradient.fg_list,
+        rainbow=gradient.rainbow,
+        hues=gradient.hues,
         style=style_obj,
         justify=cast(JustifyMethod, justify),
         overflow=cast(OverflowMethod, overflow),
         end=end,
         no_wrap=no_wrap,
-        bg_colors=bg_list,
+        bg_colors=gradient.bg_list,
     )
     if svg:
-        export_svg(gradient, svg, end="")
+        export_svg(rendered, svg, end="", minify=svg_minify)
+    if svgz:
+        export_svg(rendered, svgz, end="", minify=True, compress=True)
+    if html:
+        export_html(rendered, html, css_path=css, end="")
+    if export:
+        return
+    _print_text(rendered, justify, overflow, no_wrap, end)
+
+
+def _print_text(
+    text: RichText, justify: str, overflow: str, no_wrap: bool, end: str
+) -> None:
+    """Print ``text`` with its layout options.
+
+    ``Console.print`` joins its arguments into a fresh ``Text``, dropping the
+    renderable's own justify, overflow, no_wrap and end, so they are passed
+    explicitly. Left justification is left to Rich's default so rows are not
+    padded with trailing spaces.
+    """
+    console = get_console()
+    console.print(
+        text,
+        justify=None if justify == "left" else cast(JustifyMethod, justify),
+        overflow=cast(OverflowMethod, overflow),
+        no_wrap=no_wrap,
+        end=end,
+    )
+
+
+def _print_cycle(
+    period: CyclePeriod,
+    gradient: GradientOptions,
+    *,
+    style: Optional[str],
+    end: str,
+) -> None:
+    """Stream stdin through a ``GradientRing`` until it closes."""
+    console = get_console()
+    if color_enabled():
+        ring = GradientRing(
+            gradient.stops(),
+            period.lines or RING_SIZE,
+            console.color_system,
+            base=parse_style(style),
+            bg_stops=gradient.bg_stops(),
+        )
+    else:
+        ring = GradientRing(((0, 0, 0),), 1, None)
+    file = console.file
+    try:
+        with exporting():
+            stream_cycle(
+                typer.get_text_stream("stdin"),
+                file.write,
+                ring,
+                period,
+                flush=file.flush,
+            )
+        if end != "\n":
+            file.write(end)
+        file.flush()
+    except BrokenPipeError:
         return
-    console.print(gradient)
+    except KeyboardInterrupt:
+        pass
+
+
+def _print_blocks(
+    content: str,
+    *,
+    stops: Stops,
+    bg_stops: Optional[Stops],
+    style: str,
+    justify: str,
+    overflow: str,
+    no_wrap: bool,
+    end: str,
+    jobs: int,
+    executor: ExecutorKind,
+) -> None:
+    """Wrap, color and write ``content`` in parallel line blocks."""
+    console = get_console()
+    workers = jobs if jobs > 0 else default_jobs()
+    write = console.file.write
+    with make_executor(workers, executor) as pool:
+        chunks = run_blocks(
+            pool,
+            render_text_block,
+            split_blocks(content),
+            stops,
+            bg_stops,
+            console.width,
+            justify,
+            overflow,
+            no_wrap,
+            style,
+            console.color_system,
+            console.tab_size,
+        )
+        for index, chunk in enumerate(chunks):
+            if index:
+                write("\n")
+            write(chunk)
+    write(end)
+    console.file.flush()
 
 
 __all__ = ["print_command"]
@@ -0,0 +1,76 @@
+"""Theme profile command wiring for the CLI."""
+
+from __future__ import annotations
+
+import click
+from rich.text import Text
+
+import typer
+
+from .common import get_console
+from .help import RichTyperCommand, RichTyperGroup
+from .lut import hex_color
+from .themes import (
+    ThemeError,
+    compile_themes,
+    load_themes,
+    source_key,
+    store_path,
+    themes_path,
+)
+
+theme_app = typer.Typer(
+    cls=RichTyperGroup,
+    add_completion=False,
+    no_args_is_help=True,
+    help="Manage named gradient themes for [bold]--theme[/].",
+    rich_markup_mode="rich",
+)
+
+
+@theme_app.command("compile", cls=RichTyperCommand)
+def compile_command() -> None:
+    """Resolve every theme once into the binary store [bold]--theme[/] reads.
+
+    The store is also rebuilt whenever the profile changes; compiling ahead
+    of time keeps that work out of the first themed call.
+    """
+    console = get_console()
+    path = themes_path()
+    try:
+        themes = load_themes(path)
+    except ThemeError as error:
+        raise click.ClickException(str(error)) from error
+    output = store_path()
+    compile_themes(themes, output, source_key(path) or "")
+    console.print(
+        f"Compiled [bold]{len(themes)}[/] themes to [bold]{output}[/] "
+        f"[dim]({output.stat().st_size:,} bytes)[/]"
+    )
+
+
+@theme_app.command("list", cls=RichTyperCommand)
+def list_command() -> None:
+    """Show every theme in the profile with its color stops.
+
+    The profile is [bold]$GRADIENT_THEMES[/], or
+    [bold]~/.config/rich-gradient-cli/themes.toml[/] when unset.
+    """
+    console = get_console()
+    try:
+        themes = load_themes(themes_path())
+    except ThemeError as error:
+        raise click.ClickException(str(error)) from error
+    width = max((len(name) for name in themes), default=0)
+    for name, theme in sorted(themes.items()):
+        line = Text(name.ljust(width + 2), style="bold")
+        for color in theme.colors:
+            line.append("██", style=hex_color(color))
+        if theme.bg_colors:
+            line.append("  on ")
+            for color in theme.bg_colors:
+                line.append("██", style=hex_color(color))
+        console.print(line)
+
+
+__all__ = ["compile_command", "list_command", "theme_app"]
@@ -0,0 +1,354 @@
+"""Named gradient themes from a TOML profile, compiled to a binary store.
+
+Themes live in ``$GRADIENT_THEMES`` (default
+``$XDG_CONFIG_HOME/rich-gradient-cli/themes.toml``)::
+
+    [themes.ocean]
+    colors = ["#00ccff", "#0044ff", "navy"]
+    bgcolors = ["#001122", "#000000"]
+
+``compile_themes`` resolves every theme once into ``themes.bin`` in the cache
+directory: its RGB stops plus the column lookup tables for the common
+terminal widths. The store is keyed by the TOML file's path, size and
+modification time. Looking a theme up maps the store and binary-searches
+its fixed-size index, so no TOML is parsed and no color name is resolved.
+A missing or stale store is rebuilt from the TOML on first use.
+
+Layout (little-endian)::
+
+    header   magic "RGTS", version, key length, width count, theme count
+    key      UTF-8 source key
+    widths   one uint16 per precomputed width
+    index    per theme, sorted by name: name offset, name length,
+             foreground stop count, background stop count, data offset
+    names    UTF-8 names, back to back
+    data     per theme: foreground stops, background stops, then for each
+             width the foreground table and (with a background) the
+             background table, all as RGB byte triples
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .colors import ColorResolutionError, resolve_color
+from .common import cache_dir
+from .lut import Rgb, Stops, column_lut, register_tables, stops_from
+
+THEMES_ENVVAR = "GRADIENT_THEMES"
+THEME_ENVVAR = "GRADIENT_THEME"
+STORE_NAME = "themes.bin"
+LUT_WIDTHS = (40, 60, 80, 100, 120, 132, 160, 200)
+
+_MAGIC = b"RGTS"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHHI")
+_ENTRY = struct.Struct("<IHBBI")
+_WIDTH = struct.Struct("<H")
+
+
+class ThemeError(ValueError):
+    """Raised when a theme profile is missing, malformed or names a bad color."""
+
+
+class ThemeSpec(NamedTuple):
+    """One theme as resolved from the profile: RGB stops for each layer."""
+
+    name: str
+    colors: Stops
+    bg_colors: Optional[Stops]
+
+
+def themes_path() -> Path:
+    """Return the theme profile ``$GRADIENT_THEMES`` names, or the default."""
+    override = os.environ.get(THEMES_ENVVAR)
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(base) / "rich-gradient-cli" / "themes.toml"
+
+
+def _toml_loads(text: str) -> Dict[str, Any]:
+    try:
+        import tomllib
+    except ModuleNotFoundError:  # pragma: no cover - Python 3.10
+        import tomli as tomllib  # type: ignore[no-redef]
+    try:
+        return tomllib.loads(text)
+    except tomllib.TOMLDecodeError as error:
+        raise ThemeError(f"Invalid theme profile: {error}") from error
+
+
+def _stops(name: str, key: str, value: Any) -> Stops:
+    tokens = value.split(",") if isinstance(value, str) else value
+    if not isinstance(tokens, list) or not all(isinstance(t, str) for t in tokens):
+        raise ThemeError(f"Theme '{name}': {key} must be a list of colors.")
+    tokens = [token.strip() for token in tokens if token.strip()]
+    if not tokens:
+        raise ThemeError(f"Theme '{name}': {key} is empty.")
+    try:
+        colors = [resolve_color(token) for token in tokens]
+    except ColorResolutionError as error:
+        raise ThemeError(f"Theme '{name}': {error}") from error
+    return stops_from(colors, len(colors), False)
+
+
+def parse_themes(text: str) -> Dict[str, ThemeSpec]:
+    """Parse a TOML profile into resolved themes, raising ``ThemeError``."""
+    table = _toml_loads(text).get("themes", {})
+    if not isinstance(table, dict):
+        raise ThemeError("Invalid theme profile: [themes] must be a table.")
+    themes: Dict[str, ThemeSpec] = {}
+    for name, body in table.items():
+        if not isinstance(body, dict) or "colors" not in body:
+            raise ThemeError(f"Theme '{name}' needs a colors list.")
+        unknown = set(body) - {"colors", "bgcolors"}
+        if unknown:
+            raise ThemeError(
+                f"Theme '{name}': unknown keys {', '.join(sorted(unknown))}."
+            )
+        bg = body.get("bgcolors")
+        themes[name] = ThemeSpec(
+            name,
+            _stops(name, "colors", body["colors"]),
+            _stops(name, "bgcolors", bg) if bg is not None else None,
+        )
+    return themes
+
+
+def load_themes(path: Path) -> Dict[str, ThemeSpec]:
+    """Read and parse the profile at ``path``."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError as error:
+        raise ThemeError(f"No theme profile at {path}.") from error
+    except OSError as error:
+        raise ThemeError(f"Cannot read {path}: {error.strerror}") from error
+    return parse_themes(text)
+
+
+def source_key(path: Path) -> Optional[str]:
+    """Return the key a store compiled from ``path`` must carry, if it exists."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{os.path.abspath(path)}\0{stat.st_size}\0{stat.st_mtime_ns}"
+
+
+def _rgb_bytes(colors: Sequence[Rgb]) -> bytes:
+    return bytes(channel for color in colors for channel in color)
+
+
+def pack_themes(
+    themes: Dict[str, ThemeSpec], key: str, widths: Sequence[int] = LUT_WIDTHS
+) -> bytes:
+    """Return ``themes`` in the binary store layout, tagged with ``key``."""
+    encoded_key = key.encode("utf-8")
+    ordered = sorted(themes.values(), key=lambda theme: theme.name.encode("utf-8"))
+    entries: List[bytes] = []
+    names: List[bytes] = []
+    data: List[bytes] = []
+    name_offset = data_offset = 0
+    for theme in ordered:
+        name = theme.name.encode("utf-8")
+        bg = theme.bg_colors or ()
+        entries.append(
+            _ENTRY.pack(name_offset, len(name), len(theme.colors), len(bg), data_offset)
+        )
+        names.append(name)
+        name_offset += len(name)
+        block = [_rgb_bytes(theme.colors), _rgb_bytes(bg)]
+        for width in widths:
+            block.append(_rgb_bytes(column_lut(theme.colors, width)))
+            if bg:
+                block.append(_rgb_bytes(column_lut(bg, width)))
+        chunk = b"".join(block)
+        data.append(chunk)
+        data_offset += len(chunk)
+    return b"".join(
+        [
+            _HEADER.pack(_MAGIC, _VERSION, len(encoded_key), len(widths), len(ordered)),
+            encoded_key,
+            b"".join(_WIDTH.pack(width) for width in widths),
+            *entries,
+            *names,
+            *data,
+        ]
+    )
+
+
+def compile_themes(
+    themes: Dict[str, ThemeSpec],
+    path: Path,
+    key: str,
+    widths: Sequence[int] = LUT_WIDTHS,
+) -> None:
+    """Write ``themes`` to a binary store at ``path``, tagged with ``key``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{os.getpid()}")
+    temporary.write_bytes(pack_themes(themes, key, widths))
+    os.replace(temporary, path)
+
+
+def _rgb_tuple(data: Any, offset: int, count: int) -> Tuple[Rgb, ...]:
+    return tuple(
+        (data[index], data[index + 1], data[index + 2])
+        for index in range(offset, offset + 3 * count, 3)
+    )
+
+
+class Theme(NamedTuple):
+    """A theme read from a store, with its lookup tables still in the map."""
+
+    name: str
+    colors: Stops
+    bg_colors: Optional[Stops]
+    store: "ThemeStore"
+    offset: int
+
+    def column_lut(
+        self, width: int, background: bool = False
+    ) -> Optional[Tuple[Rgb, ...]]:
+        """Return the precomputed table for ``width``, or None if not stored."""
+        store = self.store
+        slot = store.width_slots.get(width)
+        if slot is None or (background and not self.bg_colors):
+            return None
+        layers = 2 if self.bg_colors else 1
+        offset = self.offset + 3 * (len(self.colors) + len(self.bg_colors or ()))
+        offset += sum(3 * (2 * earlier + 3) * layers for earlier in store.widths[:slot])
+        if background:
+            offset += 3 * (2 * width + 3)
+        return _rgb_tuple(store.data, offset, 2 * width + 3)
+
+
+class ThemeStore:
+    """A compiled theme store, memory-mapped and searched in place."""
+
+    def __init__(self, data: Any) -> None:
+        magic, version, key_len, width_count, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ThemeError("Not a compiled theme store.")
+        offset = _HEADER.size
+        self.data = data
+        self.key = bytes(data[offset : offset + key_len]).decode("utf-8")
+        offset += key_len
+        self.widths = tuple(
+            _WIDTH.unpack_from(data, offset + _WIDTH.size * index)[0]
+            for index in range(width_count)
+        )
+        self.width_slots = {width: slot for slot, width in enumerate(self.widths)}
+        self.count = count
+        self._index = offset + _WIDTH.size * width_count
+        self._names = self._index + _ENTRY.size * count
+        names_len = 0
+        if count:
+            name_offset, name_len, *_rest = self._entry(count - 1)
+            names_len = name_offset + name_len
+        self._data = self._names + names_len
+
+    @classmethod
+    def open(cls, path: Path) -> Optional["ThemeStore"]:
+        """Map the store at ``path``, or return None if it is missing or invalid."""
+        try:
+            with open(path, "rb") as handle:
+                data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            return cls(data)
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def _entry(self, index: int) -> Tuple[int, int, int, int, int]:
+        return _ENTRY.unpack_from(self.data, self._index + _ENTRY.size * index)
+
+    def _name(self, index: int) -> bytes:
+        name_offset, name_len, *_rest = self._entry(index)
+        start = self._names + name_offset
+        return bytes(self.data[start : start + name_len])
+
+    def names(self) -> List[str]:
+        """Return every theme name, sorted."""
+        return [self._name(index).decode("utf-8") for index in range(self.count)]
+
+    def get(self, name: str) -> Optional[Theme]:
+        """Return the theme called ``name`` by binary search of the index."""
+        wanted = name.encode("utf-8")
+        index = bisect_left(range(self.count), wanted, key=self._name)
+        if index == self.count or self._name(index) != wanted:
+            return None
+        _name_offset, _name_len, fg, bg, data_offset = self._entry(index)
+        offset = self._data + data_offset
+        colors = _rgb_tuple(self.data, offset, fg)
+        bg_colors = _rgb_tuple(self.data, offset + 3 * fg, bg) if bg else None
+        return Theme(name, colors, bg_colors, self, offset)
+
+
+def store_path() -> Path:
+    """Return where the compiled theme store is kept."""
+    return cache_dir() / STORE_NAME
+
+
+@lru_cache(maxsize=1)
+def _current_store(key: str) -> ThemeStore:
+    """Return the store for the profile ``key`` names, rebuilding it if stale."""
+    path = store_path()
+    store = ThemeStore.open(path)
+    if store is not None and store.key == key:
+        return store
+    themes = load_themes(themes_path())
+    try:
+        compile_themes(themes, path, key)
+        store = ThemeStore.open(path)
+    except OSError:
+        store = None
+    if store is None or store.key != key:
+        # An unwritable cache directory still gets the in-memory layout.
+        store = ThemeStore(pack_themes(themes, key))
+    return store
+
+
+def lookup_theme(name: str) -> Theme:
+    """Return the theme called ``name``, raising ``ThemeError`` if unknown.
+
+    Its precomputed tables are registered with ``lut.column_lut``.
+    """
+    profile = themes_path()
+    key = source_key(profile)
+    if key is None:
+        raise ThemeError(f"No theme profile at {profile}.")
+    store = _current_store(key)
+    theme = store.get(name)
+    if theme is None:
+        known = ", ".join(store.names()) or "none"
+        raise ThemeError(f"Unknown theme '{name}' (themes: {known}).")
+    register_tables(theme.colors, theme.column_lut)
+    if theme.bg_colors:
+        register_tables(
+            theme.bg_colors, lambda width: theme.column_lut(width, background=True)
+        )
+    return theme
+
+
+__all__ = [
+    "LUT_WIDTHS",
+    "THEMES_ENVVAR",
+    "THEME_ENVVAR",
+    "Theme",
+    "ThemeError",
+    "ThemeSpec",
+    "ThemeStore",
+    "compile_themes",
+    "load_themes",
+    "lookup_theme",
+    "pack_themes",
+    "parse_themes",
+    "source_key",
+    "store_path",
+    "themes_path",
+]
@@ -0,0 +1,29 @@
+import json
+
+from typer.testing import CliRunner
+
+from rich_gradient_cli import app
+from rich_gradient_cli.bench import run_bench
+
+runner = CliRunner()
+
+
+def test_bench_measures_plain_and_gradient_on_the_same_cells() -> None:
+    (result,) = run_bench(["rule"], ["#ff5500", "#00ccff"], 40, 2)
+    assert result.case == "rule"
+    assert result.plain.cells == result.gradient.cells == 40
+    assert result.gradient.bytes_per_cell > result.plain.bytes_per_cell
+    assert result.overhead > 0
+    assert result.as_dict()["gradient"]["cells"] == 40  # type: ignore[index]
+
+
+def test_bench_command_json_and_unknown_case() -> None:
+    result = runner.invoke(
+        app, ["bench", "rule", "text", "--rounds", "1", "--json", "-"]
+    )
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert [entry["case"] for entry in report["results"]] == ["rule", "text"]
+    assert set(report["results"][0]) == {"case", "overhead", "plain", "gradient"}
+    assert report["versions"]["rich"]
+    assert runner.invoke(app, ["bench", "table"]).exit_code == 2
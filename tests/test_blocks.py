@@ -0,0 +1,133 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from rich.console import Console
+from rich.text import Text as RichText
+from rich_gradient.text import Text
+
+from rich_gradient_cli import app
+from rich_gradient_cli.blocks import (
+    render_text_block,
+    run_blocks,
+    split_blocks,
+    wrap_line,
+    wrapped_row_count,
+)
+from rich_gradient_cli.common import capture_console
+from rich_gradient_cli.lut import stops_from, text_colors
+
+
+def test_wrap_line_matches_rich_wrapping() -> None:
+    line = "alpha beta gamma delta epsilon zeta eta theta iota kappa"
+    rows = [row for _offset, row in wrap_line(line, 16)]
+    expected = [
+        str(row)
+        for row in RichText(line).wrap(Console(width=16), 16, justify="default")
+    ]
+    assert rows == expected
+
+
+def test_text_colors_match_rich_gradient() -> None:
+    stops = stops_from(["red", "#00ff00", "blue"], 3, False)
+    gradient = Text("x" * 37, colors=["red", "#00ff00", "blue"])
+    expected = [tuple(c.get_truecolor()) for c in gradient.interpolate_colors()]
+    assert text_colors(stops, 37) == expected
+
+
+def test_run_blocks_preserves_order() -> None:
+    content = "\n".join(f"line {index}" for index in range(50))
+    stops = stops_from(["red", "blue"], 2, False)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        chunks = run_blocks(
+            pool,
+            render_text_block,
+            split_blocks(content, block_lines=7),
+            stops,
+            None,
+            80,
+            "left",
+            "fold",
+            False,
+            "",
+            None,
+        )
+        assert "\n".join(chunks) == content
+
+
+def test_wrapped_row_count_matches_wrap_line() -> None:
+    lines = [
+        "",
+        "   ",
+        "short",
+        "alpha beta gamma delta epsilon zeta eta theta iota kappa",
+        "x" * 45 + " tail",
+        "lead " + "y" * 33,
+        "wide 漢字 text that falls back to the wrapper",
+    ]
+    for line in lines:
+        for width in (1, 7, 16, 40):
+            assert wrapped_row_count(line, width) == len(wrap_line(line, width))
+
+
+def test_jobs_expands_tabs_like_the_default_path() -> None:
+    content = (
+        "a\tb\nab\tcd\te\n漢字\tz\t\tend\n\ttabbed line that wraps past the width\tx"
+    )
+
+    def cells(*args: str) -> list:
+        with capture_console(30) as buffer:
+            app(["print", "-c", "red,blue", *args, content], standalone_mode=False)
+        text = RichText.from_ansi(buffer.getvalue())
+        console = Console()
+        return [
+            (char, text.get_style_at_offset(console, index).color)
+            for index, char in enumerate(text.plain)
+        ]
+
+    default = cells()
+    assert "a       b" in "".join(char for char, _color in default)
+    assert cells("--jobs", "2") == default
+
+
+@pytest.mark.parametrize("width", [9, 20])
+@pytest.mark.parametrize(
+    "options",
+    [
+        [],
+        ["-j", "center"],
+        ["-j", "right"],
+        ["--overflow", "ellipsis"],
+        ["--no-wrap"],
+        ["--bgcolors", "#000,#111"],
+    ],
+)
+def test_jobs_matches_the_default_path(width: int, options: list) -> None:
+    content = (
+        "…🌈 日c  b漢a e é… more words here\n"
+        "a\tb  \n漢字\tz\t\tend   \n"
+        "plain ascii words that wrap around a little"
+    )
+
+    def cells(*args: str) -> list:
+        with capture_console(width) as buffer:
+            app(
+                ["print", "-c", "red,blue", *options, *args, content],
+                standalone_mode=False,
+            )
+        text = RichText.from_ansi(buffer.getvalue())
+        console = Console()
+        styles = [
+            text.get_style_at_offset(console, index) for index in range(len(text))
+        ]
+        return [
+            (
+                char,
+                None if style.color is None or style.color.is_default else style.color,
+                None
+                if style.bgcolor is None or style.bgcolor.is_default
+                else style.bgcolor,
+            )
+            for char, style in zip(text.plain, styles)
+        ]
+
+    assert cells("--jobs", "2") == cells()
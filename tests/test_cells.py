@@ -0,0 +1,45 @@
+from array import array
+
+from rich._wrap import divide_line
+from rich.cells import cell_len
+
+from rich_gradient_cli.blocks import render_column_block, wrap_cells
+from rich_gradient_cli.cells import CellLine, cell_offsets
+from rich_gradient_cli.lut import column_lut, stops_from
+
+LINES = [
+    "plain ascii words that wrap around a little",
+    "漢字 テキスト グラデーション パネル 表示 端末 漢字",
+    "rich-gradient 🌈 ✨ ❤️ 👩‍👩‍👧 done café naïve",
+    "x" * 40 + " 🌈" * 6,
+]
+
+
+def test_prefix_sums_match_rich_measurement() -> None:
+    assert cell_offsets("ascii only") is None
+    for line in LINES:
+        measured = CellLine(line)
+        assert measured.width == cell_len(line)
+        for width in (2, 5, 11, 24):
+            assert measured.divide(width) == divide_line(line, width)
+            assert measured.divide(width, fold=False) == divide_line(
+                line, width, fold=False
+            )
+            for start, row, cells in wrap_cells(measured, width):
+                assert cells == cell_len(row) <= width
+                assert line.startswith(row, start)
+
+
+def test_offsets_without_rich_internals() -> None:
+    assert cell_offsets("café") == array("l", [0, 1, 2, 3, 4])
+    assert cell_offsets("❤️!") == array("l", [0, 2, 2, 3])
+    assert CellLine("ab 漢字 c").divide(1) == [1, 2, 3, 4, 5, 6]
+
+
+def test_column_colors_follow_cell_columns() -> None:
+    stops = stops_from(["red", "blue"], 2, False)
+    lut = column_lut(stops, 20)
+    painted = render_column_block(["a漢b"], stops, None, 20, "", "truecolor")
+    expected = [lut[1], lut[4], lut[7]]
+    for rgb in expected:
+        assert "38;2;{};{};{}m".format(*rgb) in painted
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+from rich.color_triplet import ColorTriplet
+
+from rich_gradient_cli.colors import (
+    ColorResolutionError,
+    compile_color_table,
+    load_color_table,
+    resolve_color,
+)
+
+
+def test_resolve_color_handles_hex_css_and_ansi_names() -> None:
+    assert resolve_color("#f90") == (255, 153, 0)
+    assert resolve_color("#FF9900") == (255, 153, 0)
+    assert resolve_color(" AliceBlue ") == (240, 248, 255)
+    assert resolve_color("grey0") == (0, 0, 0)
+
+
+def test_resolve_color_rejects_invalid_tokens() -> None:
+    with pytest.raises(ColorResolutionError):
+        resolve_color("not-a-color")
+
+
+def test_color_table_round_trips(tmp_path: Path) -> None:
+    path = tmp_path / "colors.bin"
+    table = {"red": ColorTriplet(255, 0, 0), "teal": ColorTriplet(0, 128, 128)}
+    compile_color_table(path, table)
+    assert load_color_table(path) == table
+
+
+def test_stale_color_table_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "colors.bin"
+    path.write_bytes(b"garbage")
+    assert load_color_table(path) is None
+
+
+def test_corrupt_color_table_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "colors.bin"
+    compile_color_table(path, {"red": ColorTriplet(255, 0, 0)})
+    path.write_bytes(path.read_bytes().replace(b"red", b"r\xffd"))
+    assert load_color_table(path) is None
+    assert not list(tmp_path.glob(".colors.bin.*"))
@@ -1,6 +1,15 @@
+import pytest
 from rich.style import Style
 
-from rich_gradient_cli.common import parse_colors, parse_style
+import typer
+from rich_gradient_cli.common import (
+    capture_console,
+    console,
+    get_console,
+    parse_colors,
+    parse_style,
+    resolve_colors,
+)
 
 
 def test_parse_colors_splits_and_trims() -> None:
@@ -14,3 +23,23 @@ def test_parse_colors_none() -> None:
 def test_parse_style_none_returns_null_style() -> None:
     assert parse_style(None) == Style.null()
 
+
+def test_resolve_colors_returns_triplets() -> None:
+    assert resolve_colors("red, #00f") == [(255, 0, 0), (0, 0, 255)]
+
+
+def test_resolve_colors_names_the_option_on_error() -> None:
+    with pytest.raises(typer.BadParameter) as excinfo:
+        resolve_colors("red,nope", "--bgcolors")
+    assert excinfo.value.param_hint == "'--bgcolors'"
+
+
+def test_capture_console_leaves_the_shared_console_alone() -> None:
+    before = dict(vars(console))
+    with capture_console(20) as buffer:
+        active = get_console()
+        assert active is not console
+        active.print("[#ff0000]hi[/]")
+    assert buffer.getvalue() == "\x1b[38;2;255;0;0mhi\x1b[0m\n"
+    assert get_console() is console
+    assert vars(console) == before
@@ -0,0 +1,66 @@
+from typing import List
+
+import pytest
+from typer.testing import CliRunner
+
+from rich_gradient_cli import app
+from rich_gradient_cli.cycle import (
+    CyclePeriod,
+    GradientRing,
+    parse_period,
+    stream_cycle,
+)
+from rich_gradient_cli.sgr import RESET
+
+runner = CliRunner()
+STOPS = ((255, 0, 0), (0, 0, 255))
+
+
+def test_parse_period() -> None:
+    assert parse_period("40") == CyclePeriod(40, 0.0)
+    assert parse_period("2.5s") == CyclePeriod(0, 2.5)
+    assert parse_period("500ms") == CyclePeriod(0, 0.5)
+    for bad in ("1", "1.5", "0s", "soon"):
+        with pytest.raises(ValueError):
+            parse_period(bad)
+
+
+def test_ring_loops_back_to_its_first_color() -> None:
+    ring = GradientRing(STOPS, 4, "truecolor")
+    assert ring.prefixes == (
+        "\x1b[38;2;255;0;0m",
+        "\x1b[38;2;186;0;186m",
+        "\x1b[38;2;0;0;255m",
+        "\x1b[38;2;186;0;186m",
+    )
+    assert ring[4] == ring[0] and ring[10**12 + 1] == ring[1]
+
+
+def test_stream_cycle_by_lines_and_by_time() -> None:
+    ring = GradientRing(STOPS, 4, "truecolor")
+    written: List[str] = []
+    lines = ["a\n", "\n", "b\n", "c\n", "d\n", "e"]
+    assert stream_cycle(lines, written.append, ring, CyclePeriod(4, 0.0)) == 6
+    assert written[0] == f"{ring[0]}a{RESET}\n"
+    assert written[1] == "\n"
+    assert written[4] == f"{ring[0]}d{RESET}\n"
+    assert written[5] == f"{ring[1]}e{RESET}"
+
+    ticks = iter([0.0, 0.0, 0.5, 1.0, 1.25])
+    written.clear()
+    stream_cycle(
+        ["a", "b", "c", "d"],
+        written.append,
+        ring,
+        CyclePeriod(0, 1.0),
+        clock=lambda: next(ticks),
+    )
+    assert written == [f"{ring[p]}{t}{RESET}" for p, t in zip((0, 2, 0, 1), "abcd")]
+
+
+def test_print_cycle_streams_stdin() -> None:
+    result = runner.invoke(app, ["print", "--cycle", "3s", "-"], input="one\ntwo\n")
+    assert result.exit_code == 0, result.output
+    assert result.output == "one\ntwo\n"
+    result = runner.invoke(app, ["print", "--cycle", "3", "--jobs", "2"], input="x\n")
+    assert result.exit_code == 2
@@ -0,0 +1,74 @@
+import io
+import time
+from typing import List, Tuple
+
+from typer.testing import CliRunner
+
+from rich_gradient_cli import app
+from rich_gradient_cli.sgr import paint_bytes
+from rich_gradient_cli.spawn import LinePainter, run_command
+
+runner = CliRunner()
+STOPS = ((255, 0, 0), (0, 0, 255))
+
+
+class TimedSink(io.BytesIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: List[Tuple[float, bytes]] = []
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self.writes.append((time.monotonic(), bytes(data)))
+        return super().write(data)
+
+
+def test_line_painter_paints_complete_lines_only() -> None:
+    painter = LinePainter(STOPS, "truecolor")
+    assert painter.feed(b"ab") == b""
+    assert painter.feed(b"c\n\n\x1b[1mbold\x1b[0m\nde") == (
+        paint_bytes(b"abc", STOPS, "truecolor") + b"\n\n\x1b[1mbold\x1b[0m\n"
+    )
+    assert painter.flush() == paint_bytes(b"de", STOPS, "truecolor")
+    assert painter.flush() == b""
+    assert LinePainter(STOPS, None).feed(b"x\ny") == b"x\n"
+
+
+def test_run_command_separates_streams_and_returns_status() -> None:
+    out, err = io.BytesIO(), io.BytesIO()
+    status = run_command(
+        ["sh", "-c", "echo one; echo two >&2; echo three; exit 3"],
+        LinePainter(STOPS, None),
+        LinePainter(STOPS, "truecolor"),
+        stdout=out,
+        stderr=err,
+    )
+    assert status == 3
+    assert out.getvalue() == b"one\nthree\n"
+    assert err.getvalue() == paint_bytes(b"two", STOPS, "truecolor") + b"\n"
+    plain = LinePainter(STOPS, None)
+    killed = ["sh", "-c", "kill -TERM $$"]
+    assert run_command(killed, plain, plain, stdout=out, stderr=err) == 143
+
+
+def test_partial_line_waits_at_most_the_latency() -> None:
+    sink = TimedSink()
+    started = time.monotonic()
+    run_command(
+        ["sh", "-c", "printf 'prompt> '; sleep 1; echo done"],
+        LinePainter(STOPS, None),
+        LinePainter(STOPS, None),
+        stdout=sink,
+        stderr=io.BytesIO(),
+        latency=0.02,
+    )
+    first_at, first = sink.writes[0]
+    assert first == b"prompt> "
+    assert first_at - started < 0.8
+    assert sink.getvalue() == b"prompt> done\n"
+
+
+def test_exec_command_forwards_exit_status() -> None:
+    result = runner.invoke(app, ["exec", "--", "sh", "-c", "echo hi; exit 5"])
+    assert result.exit_code == 5
+    assert result.output == "hi\n"
+    assert runner.invoke(app, ["exec", "no-such-command-here"]).exit_code == 127
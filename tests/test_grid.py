@@ -0,0 +1,58 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from rich.cells import cell_len
+from typer.testing import CliRunner
+
+from rich_gradient_cli import app
+from rich_gradient_cli.grid import GridError, GridRenderer, load_grid, parse_grid
+
+runner = CliRunner()
+
+
+def test_load_grid_defaults_and_validation() -> None:
+    grid = load_grid(["a", {"text": "b", "colors": "red,blue"}, "c"])
+    assert grid.columns == 2
+    assert grid.cells[1].colors == ("#ff0000", "#0000ff")
+    with pytest.raises(GridError, match="panel 1"):
+        load_grid([{"title": "no text"}])
+    with pytest.raises(GridError, match="unknown keys"):
+        load_grid([{"text": "x", "colour": "red"}])
+    with pytest.raises(GridError, match="Invalid JSON"):
+        parse_grid("{")
+
+
+def test_frame_lays_out_rows_and_columns() -> None:
+    grid = load_grid({"columns": 2, "gap": 2, "panels": ["a", "b\nc", "d"]})
+    frame = GridRenderer(None).frame(grid, 40)
+    rows = frame.split("\n")
+    assert len(rows) == 4 + 3
+    assert {cell_len(row) for row in rows[:4]} == {40}
+    assert rows[1].startswith("│ a ")
+    assert "│ b " in rows[1]
+
+
+def test_refresh_only_renders_changed_panels() -> None:
+    panels = [{"text": f"panel {index}", "colors": "red,blue"} for index in range(4)]
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        renderer = GridRenderer("truecolor", pool)
+        first = renderer.frame(load_grid(panels), 60)
+        assert renderer.renders == 4
+        assert renderer.frame(load_grid(panels), 60) == first
+        assert renderer.renders == 4
+        panels[2]["text"] = "changed"
+        renderer.frame(load_grid(panels), 60)
+        assert renderer.renders == 5
+
+
+def test_grid_command_reads_stdin(monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_pool(*_args: object) -> None:
+        raise AssertionError("the default --jobs 1 must not start a worker pool")
+
+    monkeypatch.setattr("rich_gradient_cli.grid_command.make_executor", no_pool)
+    spec = json.dumps({"columns": 3, "panels": ["one", "two", "three"]})
+    result = runner.invoke(app, ["grid", "--width", "60", "-"], input=spec)
+    assert result.exit_code == 0
+    assert "one" in result.stdout and "three" in result.stdout
+    assert len(result.stdout.splitlines()) == 3
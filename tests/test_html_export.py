@@ -0,0 +1,61 @@
+from pathlib import Path
+
+from rich.segment import Segment
+from rich.style import Style
+from typer.testing import CliRunner
+
+from rich_gradient_cli import app
+from rich_gradient_cli.html_export import StyleClasses, segments_to_html
+
+runner = CliRunner()
+
+
+def test_exports_share_one_stylesheet(tmp_path: Path) -> None:
+    for name in ("a", "b"):
+        result = runner.invoke(
+            app,
+            [
+                "print",
+                "-c",
+                "red,blue",
+                "gradient",
+                "--html",
+                str(tmp_path / f"{name}.html"),
+            ],
+        )
+        assert result.exit_code == 0, result.output
+    first = (tmp_path / "a.html").read_text(encoding="utf-8")
+    assert first == (tmp_path / "b.html").read_text(encoding="utf-8")
+    assert "style=" not in first
+    rules = (tmp_path / "gradient.css").read_text(encoding="utf-8").splitlines()
+    assert len(rules) == len(set(rules))
+    for rule in rules[1:]:
+        assert f'class="{rule[1:].split("{")[0]}"' in first
+
+
+def test_blank_cells_do_not_open_spans() -> None:
+    red, blue = Style(color="red"), Style(color="blue")
+    underlined = Style(color="blue", underline=True)
+    segments = [
+        Segment("ab", red),
+        Segment("  ", blue),
+        Segment("c", red),
+        Segment(" ", underlined),
+    ]
+    classes = StyleClasses()
+    html = segments_to_html(segments, classes)
+    assert html == (
+        f'<span class="{classes.name(red)}">ab  c</span>'
+        f'<span class="{classes.name(underlined)}"> </span>'
+    )
+    assert set(classes.rules) == {classes.name(red), classes.name(underlined)}
+
+
+def test_classes_are_named_after_their_values() -> None:
+    classes = StyleClasses()
+    assert classes.name(Style(color="#ff8800")) == "g-ff8800"
+    styled = Style(color="#ff8800", bgcolor="#001122", bold=True, underline=True)
+    assert classes.name(styled) == "g-ff8800-on-001122-b-u"
+    assert classes.name(Style(italic=True)) == "g-i"
+    assert classes.name(Style()) == ""
+    assert classes.rules["g-ff8800"] == ".g-ff8800{color:#ff8800}"
@@ -0,0 +1,34 @@
+import os
+import signal
+
+from rich_gradient.rule import Rule
+
+from rich_gradient_cli.live import LayoutCache
+from rich_gradient_cli.resize import ResizeWatch
+
+
+def test_layout_cache_reuses_frames_per_width() -> None:
+    layouts = LayoutCache(Rule("", colors=["red", "blue"]), "truecolor", maxsize=2)
+    narrow = layouts(20)
+    assert layouts(20) is narrow
+    assert layouts(30) != narrow
+    assert layouts.renders == 2
+    layouts(40)
+    layouts(20)
+    assert layouts.renders == 4
+
+
+def test_resize_before_the_wait_is_not_lost() -> None:
+    read, write = os.pipe()
+    try:
+        with ResizeWatch() as resizes:
+            # Delivered while "painting", before the loop blocks again.
+            os.kill(os.getpid(), signal.SIGWINCH)
+            assert resizes.wait(timeout=5) == (True, [])
+            assert resizes.wait(read, timeout=0) == (False, [])
+            os.write(write, b"k")
+            assert resizes.wait(read, timeout=5) == (False, [read])
+    finally:
+        os.close(read)
+        os.close(write)
+    assert signal.getsignal(signal.SIGWINCH) == signal.SIG_DFL
@@ -0,0 +1,39 @@
+import re
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from rich_gradient_cli import app
+from rich_gradient_cli.logs import DEFAULT_RULES, LogColorizer, LogRule, compile_rules
+
+runner = CliRunner()
+ANSI = re.compile(rb"\x1b\[[0-9;]*m")
+
+
+def test_colorize_paints_matches_and_keeps_text() -> None:
+    colorizer = LogColorizer(DEFAULT_RULES, "truecolor")
+    line = b"12:00 ERROR app.db request_id=abc123 failed\n"
+    painted = colorizer.colorize(line)
+    assert painted != line
+    assert ANSI.sub(b"", painted) == line
+    assert b"\x1b[38;2;255;34;0mE" in painted
+
+
+def test_custom_rules_without_word_boundaries() -> None:
+    rules = [LogRule("path", r"/\S+|GET", ("red", "blue"))]
+    assert not compile_rules(rules).startswith(rb"\b")
+    painted = LogColorizer(rules, "truecolor").colorize(b"GET /a/b ok\n")
+    assert ANSI.sub(b"", painted) == b"GET /a/b ok\n"
+    assert painted.count(b"\x1b[0m") == 2
+
+
+def test_uncolored_output_is_passed_through() -> None:
+    line = b"INFO ready\n"
+    assert LogColorizer(DEFAULT_RULES, None).colorize(line) is line
+
+
+def test_logs_rejects_invalid_rules(tmp_path: Path) -> None:
+    path = tmp_path / "rules.json"
+    path.write_text('[{"name": "x", "pattern": "(", "colors": "red"}]')
+    result = runner.invoke(app, ["logs", "--rules", str(path)], input="x\n")
+    assert result.exit_code == 2
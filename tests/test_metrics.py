@@ -0,0 +1,90 @@
+import urllib.request
+from pathlib import Path
+
+import click
+import pytest
+
+from rich_gradient_cli.grid import GridRenderer, parse_grid
+from rich_gradient_cli.live import LayoutCache
+from rich_gradient_cli.metrics import (
+    CACHE_HITS,
+    CACHE_MISSES,
+    REGISTRY,
+    MetricsExporter,
+    Registry,
+    exporter_from_env,
+)
+
+
+def test_registry_renders_prometheus_text() -> None:
+    registry = Registry()
+    renders = registry.counter("demo_total", "Demo renders.", ("command",))
+    seconds = registry.histogram("demo_seconds", "Demo time.", ("command",), (0.1, 1))
+    depth = registry.gauge("demo_depth", "Demo depth.")
+    renders.labels('a"b').inc(2)
+    for value in (0.05, 0.5, 5):
+        seconds.labels("x").observe(value)
+    depth.labels().set(3)
+    assert registry.render().splitlines() == [
+        "# HELP demo_total Demo renders.",
+        "# TYPE demo_total counter",
+        'demo_total{command="a\\"b"} 2',
+        "# HELP demo_seconds Demo time.",
+        "# TYPE demo_seconds histogram",
+        'demo_seconds_bucket{command="x",le="0.1"} 1',
+        'demo_seconds_bucket{command="x",le="1"} 2',
+        'demo_seconds_bucket{command="x",le="+Inf"} 3',
+        'demo_seconds_sum{command="x"} 5.55',
+        'demo_seconds_count{command="x"} 3',
+        "# HELP demo_depth Demo depth.",
+        "# TYPE demo_depth gauge",
+        "demo_depth 3",
+    ]
+    with pytest.raises(ValueError):
+        renders.labels()
+
+
+def test_render_caches_record_hits_and_misses() -> None:
+    hits, misses = CACHE_HITS.labels("live_frames"), CACHE_MISSES.labels("live_frames")
+    before = hits.value, misses.value
+    layouts = LayoutCache("frame", None)
+    for width in (40, 60, 40, 40):
+        layouts(width)
+    assert (hits.value - before[0], misses.value - before[1]) == (2, 2)
+
+    hits, misses = CACHE_HITS.labels("grid_cells"), CACHE_MISSES.labels("grid_cells")
+    before = hits.value, misses.value
+    renderer = GridRenderer(None)
+    grid = parse_grid('["a", "b", "a"]', None)
+    renderer.frame(grid, 60)
+    renderer.frame(grid, 60)
+    assert (hits.value - before[0], misses.value - before[1]) == (4, 2)
+    assert 'gradient_cache_hits_total{cache="paint_template"}' in REGISTRY.render()
+
+
+def test_exporter_writes_textfile_and_serves_localhost(tmp_path: Path) -> None:
+    path = tmp_path / "gradient.prom"
+    registry = Registry()
+    counter = registry.counter("demo_total", "Demo.").labels()
+    exporter = MetricsExporter(registry, path=path, port=0, interval=0.1)
+    try:
+        assert (
+            path.read_text()
+            == "# HELP demo_total Demo.\n# TYPE demo_total counter\ndemo_total 0\n"
+        )
+        counter.inc(7)
+        url = f"http://127.0.0.1:{exporter.port}/metrics"
+        opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+        with opener.open(url, timeout=5) as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert response.read().decode().endswith("demo_total 7\n")
+    finally:
+        exporter.close()
+    assert path.read_text().endswith("demo_total 7\n")
+    assert [entry.name for entry in tmp_path.iterdir()] == ["gradient.prom"]
+
+
+def test_exporter_from_env() -> None:
+    assert exporter_from_env({}) is None
+    with pytest.raises(click.UsageError, match="GRADIENT_METRICS_PORT"):
+        exporter_from_env({"GRADIENT_METRICS_PORT": "http"})
@@ -0,0 +1,43 @@
+import click
+import pytest
+
+import typer
+from rich_gradient_cli import app
+from rich_gradient_cli.options import COLORS, HUES, SEED, GradientOptions
+
+
+def _params(name: str) -> dict[str, click.Parameter]:
+    group = typer.main.get_command(app)
+    assert isinstance(group, click.Group)
+    command = group.commands[name]
+    return {param.name: param for param in command.params if param.name}
+
+
+def test_shared_options_are_compiled_per_command() -> None:
+    commands = [_params(name) for name in ("print", "panel", "rule", "markdown")]
+    colors = [params["colors"] for params in commands]
+    assert len({id(param) for param in colors}) == len(commands)
+    for params in commands:
+        assert params["colors"].opts == ["-c", "--colors"]
+        assert params["seed"].envvar == SEED.envvar
+    assert COLORS.param() is not COLORS.param()
+    assert commands[1]["hues"].default == HUES.default
+    assert commands[0]["hues"].opts == ["-h", "--hues"]
+    assert commands[0]["hues"].default == 7
+    assert commands[2]["hues"].default == 10
+
+
+def test_gradient_options_are_hashable_cache_keys() -> None:
+    first = GradientOptions.resolve("red,#00f", None, False, 5, None)
+    second = GradientOptions.resolve("red, #00f", None, False, 5, None)
+    assert first == second and hash(first) == hash(second)
+    assert first.cacheable
+    assert first.stops() is second.stops()
+    assert not GradientOptions.resolve(None, None, False, 5, None).cacheable
+    assert GradientOptions.resolve(None, None, False, 5, 3).cacheable
+
+
+def test_bad_background_color_names_its_option() -> None:
+    with pytest.raises(click.BadParameter) as error:
+        GradientOptions.resolve(None, "nope", False, 5, None)
+    assert error.value.param_hint == "'--bgcolors'"
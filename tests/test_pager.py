@@ -0,0 +1,119 @@
+from typing import List
+
+import pytest
+from rich.console import Console
+from rich.markdown import Markdown
+
+from rich_gradient_cli.blocks import render_panel_body_block
+from rich_gradient_cli.lut import stops_from
+from rich_gradient_cli.pager import (
+    MarkdownRows,
+    Pager,
+    PanelRows,
+    RowSource,
+    wrap_offsets,
+)
+
+
+def _plain_rows(lines: List[str]) -> List[str]:
+    return [f"<{line}>" for line in lines for _ in range(2 if len(line) > 4 else 1)]
+
+
+def _markdown_rows(source: str) -> List[str]:
+    console = Console(width=40, color_system=None, legacy_windows=False)
+    lines = console.render_lines(Markdown(source), pad=False, new_lines=False)
+    return ["".join(segment.text for segment in line) for line in lines]
+
+
+def test_wrap_offsets_are_prefix_sums() -> None:
+    offsets = wrap_offsets(["one", "two words here", "", "x" * 12], 5)
+    assert list(offsets) == [0, 1, 4, 5, 8]
+
+
+def test_wrap_offsets_match_rendered_rows_with_wide_text_before_tabs() -> None:
+    lines = ["日本\tx", "second line", "third", "漢字\t\tlonger tail here"]
+    stops = stops_from(["red", "blue"], 2, False)
+
+    def rendered(line: str) -> int:
+        block = render_panel_body_block(
+            [line], 10, 10, 0, stops, None, 12, "", None, ("|", "|", 1)
+        )
+        return len(block.split("\n"))
+
+    offsets = wrap_offsets(lines, 10)
+    assert [b - a for a, b in zip(offsets, offsets[1:])] == [
+        rendered(line) for line in lines
+    ]
+    assert list(offsets[:4]) == [0, 1, 3, 4]
+
+
+def test_panel_rows_render_only_requested_slices() -> None:
+    rendered: List[List[str]] = []
+
+    def render(lines: List[str]) -> List[str]:
+        rendered.append(lines)
+        return _plain_rows(lines)
+
+    lines = [f"row {index:05d}" for index in range(10_000)]
+    source = PanelRows(["top"], ["bottom"], lines, 5, render)
+    assert source.rows(0, 3) == ["top", "<row 00000>", "<row 00000>"]
+    assert source.row_count() is None
+    assert all(len(batch) <= 2 for batch in rendered)
+    assert source.row_count(exhaust=True) == 20_002
+    assert source.rows(20_000, 20_005) == ["<row 09999>", "bottom"]
+
+
+def test_markdown_rows_match_whole_document() -> None:
+    source = "# Title\n\nSome *text*.\n\n- one\n- two\n\n```\ncode\n```\n\n> quote\n"
+    rows = MarkdownRows(source, _markdown_rows)
+    assert rows.row_count() is None
+    assert rows.rows(0, 100) == _markdown_rows(source)
+    assert rows.row_count() == len(_markdown_rows(source))
+
+
+def test_pager_scrolls_within_bounds() -> None:
+    lines = [str(index) for index in range(50)]
+    pager = Pager(PanelRows([], [], lines, 10, _plain_rows), prefetch=4)
+    assert pager.view(5) == ["<0>", "<1>", "<2>", "<3>", "<4>"]
+    pager.scroll("page_down", 5)
+    assert pager.view(5)[0] == "<5>"
+    pager.scroll("end", 5)
+    assert pager.view(5)[-1] == "<49>"
+    pager.scroll("down", 5)
+    assert pager.top == 45
+    pager.scroll("home", 5)
+    assert pager.top == 0
+
+
+def test_row_source_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        RowSource()  # type: ignore[abstract]
+
+
+def test_pager_lays_out_again_when_the_width_changes() -> None:
+    lines = [f"{index:02d}" * 4 for index in range(20)]
+    widths: List[int] = []
+
+    def layout(width: int) -> PanelRows:
+        widths.append(width)
+
+        def render(batch: List[str]) -> List[str]:
+            return [
+                line[start : start + width]
+                for line in batch
+                for start in range(0, len(line), width)
+            ]
+
+        return PanelRows([], [], lines, width, render)
+
+    pager = Pager(layout(4), prefetch=2, relayout=layout)
+    pager.resize(4, 5)
+    pager.scroll("end", 5)
+    assert pager.top == 35
+    pager.resize(4, 6)
+    assert widths == [4]
+    assert pager.top == 34
+    pager.resize(8, 5)
+    assert widths == [4, 8]
+    assert pager.top == 15
+    assert pager.view(5) == [f"{index:02d}" * 4 for index in range(15, 20)]
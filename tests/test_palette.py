@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+
+from rich_gradient_cli.options import GradientOptions
+from rich_gradient_cli.palette import (
+    BANK_ENVVAR,
+    apply_seed,
+    build_palette_bank,
+    generate_palette,
+    save_palette_bank,
+    seeded_palette,
+)
+
+
+def test_generate_palette_is_deterministic() -> None:
+    assert generate_palette(7, 42) == generate_palette(7, 42)
+    assert len(generate_palette(7, 42)) == 7
+
+
+def test_apply_seed_keeps_explicit_colors() -> None:
+    assert apply_seed(["red", "blue"], 5, False, 1) == (["red", "blue"], False)
+    assert apply_seed(None, 5, False, None) == (None, False)
+
+
+def test_apply_seed_replaces_rainbow_with_seeded_spectrum() -> None:
+    colors, rainbow = apply_seed(None, 5, True, 3)
+    assert rainbow is False
+    assert colors is not None and len(colors) == 17
+    assert all(len(color) == 3 for color in colors)
+
+
+def test_only_seeded_or_explicit_palettes_are_cacheable() -> None:
+    assert not GradientOptions.resolve(None, None, False, 5, None).cacheable
+    assert not GradientOptions.resolve(None, None, True, 5, None).cacheable
+    assert GradientOptions.resolve(None, None, False, 5, 0).cacheable
+    assert GradientOptions.resolve(None, None, True, 5, 0).cacheable
+    assert GradientOptions.resolve("red", None, False, 5, None).cacheable
+
+
+def test_seeded_palette_reads_bank(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bank = build_palette_bank(range(2), [3])
+    bank["3:1"] = ["#010203", "#040506", "#070809"]
+    path = tmp_path / "bank.json"
+    save_palette_bank(str(path), bank)
+    monkeypatch.setenv(BANK_ENVVAR, str(path))
+    seeded_palette.cache_clear()
+    try:
+        assert seeded_palette(3, 1) == ("#010203", "#040506", "#070809")
+    finally:
+        seeded_palette.cache_clear()
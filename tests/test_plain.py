@@ -0,0 +1,58 @@
+import subprocess
+import sys
+from typing import List
+
+import pytest
+from typer.testing import CliRunner
+
+import rich_gradient_cli.markdown_command as markdown_command
+import rich_gradient_cli.panel_command as panel_command
+import rich_gradient_cli.rule_command as rule_command
+import rich_gradient_cli.text_command as text_command
+from rich_gradient_cli import app
+from rich_gradient_cli.common import capture_console
+
+runner = CliRunner()
+
+CASES = [
+    ["print", "-j", "center", "hello [bold]world[/] 123 " * 5],
+    ["panel", "-t", "Title", "-s", "sub", "--no-expand", "-j", "center", "body"],
+    ["rule", "-t", "Section 42", "-a", "left", "-T", "3"],
+    ["markdown", "# Head\n\n- *a*\n- `b`\n\n> quote", "--end", "!"],
+]
+
+
+def _render(args: List[str], colored: bool, monkeypatch: pytest.MonkeyPatch) -> str:
+    for module in (text_command, panel_command, rule_command, markdown_command):
+        monkeypatch.setattr(module, "color_enabled", lambda: colored)
+    with capture_console(60, None) as buffer:
+        result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("args", CASES, ids=[case[0] for case in CASES])
+def test_plain_path_matches_gradient_layout(
+    args: List[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert _render(args, False, monkeypatch) == _render(args, True, monkeypatch)
+
+
+def test_redirected_output_skips_rich_gradient() -> None:
+    script = (
+        "import sys\n"
+        "from rich_gradient_cli.application import app\n"
+        "try:\n"
+        "    app(sys.argv[1:], prog_name='gradient')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "sys.stderr.write(str('rich_gradient' in sys.modules))\n"
+    )
+    for args in CASES:
+        result = subprocess.run(
+            [sys.executable, "-c", script, *args],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stderr == "False", args
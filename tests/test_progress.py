@@ -0,0 +1,53 @@
+import os
+import threading
+
+import pytest
+
+from rich_gradient_cli.progress import ProgressBar, copy_stream, format_size, parse_size
+
+
+def test_parse_and_format_sizes() -> None:
+    assert parse_size("4096") == 4096
+    assert parse_size("64K") == 65536
+    assert parse_size("1.5GiB") == 3 * 2**29
+    assert parse_size("2mb") == 2 * 2**20
+    with pytest.raises(ValueError):
+        parse_size("12Q")
+    assert format_size(512) == "512 B"
+    assert format_size(3 * 2**29) == "1.5 GiB"
+
+
+def test_copy_stream_from_pipe_and_file(tmp_path) -> None:
+    payload = os.urandom(3 * 2**20 + 17)
+    source = tmp_path / "in.bin"
+    source.write_bytes(payload)
+    seen = []
+    with open(source, "rb") as reader, open(tmp_path / "a.bin", "wb") as writer:
+        assert copy_stream(reader.fileno(), writer.fileno(), seen.append) == len(
+            payload
+        )
+    assert (tmp_path / "a.bin").read_bytes() == payload
+    assert seen[-1] == len(payload)
+
+    read_end, write_end = os.pipe()
+
+    def feed() -> None:
+        with open(write_end, "wb") as pipe:
+            pipe.write(payload)
+
+    thread = threading.Thread(target=feed)
+    thread.start()
+    with open(tmp_path / "b.bin", "wb") as writer:
+        copy_stream(read_end, writer.fileno(), lambda _count: None)
+    thread.join()
+    os.close(read_end)
+    assert (tmp_path / "b.bin").read_bytes() == payload
+
+
+def test_bar_fills_to_the_terminal_width() -> None:
+    bar = ProgressBar(((255, 0, 0), (0, 0, 255)), 1000, None)
+    line = bar.render(500, bar.started + 1.0, 60)
+    assert line.startswith("\r") and line.endswith("\x1b[K")
+    text = line[1:-3]
+    assert len(text) == 59
+    assert text.startswith("━" * 10 + "╸" + "─" * 10 + "  50%")
@@ -0,0 +1,216 @@
+"""Golden-output and output-size regression tests.
+
+Every case renders a fixed input through the CLI at a fixed width and color
+system and compares it with ``tests/snapshots/<case>.txt`` byte for byte.
+``tests/snapshots/sizes.json`` separately records the bytes, visible cells
+and escape sequences of each case (for SVG and HTML, the number of
+``<text>`` or ``<span>`` runs; for SVGZ, the compressed bytes); a change of
+more than ``SIZE_TOLERANCE`` in bytes or escapes fails even when the goldens
+are refreshed. Rich's random hyperlink ids are replaced with zeros before
+comparing. A missing golden or size entry fails; the tests only write files
+when asked to:
+
+    GRADIENT_UPDATE_SNAPSHOTS=1 pytest tests/test_snapshots.py    # goldens
+    GRADIENT_UPDATE_SNAPSHOTS=all pytest tests/test_snapshots.py  # and sizes
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import re
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+from rich.color import ColorSystem
+
+from rich_gradient_cli import app
+from rich_gradient_cli.common import capture_console
+from rich_gradient_cli.sgr import OutputSize, measure_ansi
+
+SNAPSHOTS = Path(__file__).parent / "snapshots"
+SIZES = SNAPSHOTS / "sizes.json"
+SIZE_TOLERANCE = 0.02
+UPDATE = os.environ.get("GRADIENT_UPDATE_SNAPSHOTS", "")
+
+COLORS = "#ff5500,#00ccff,#aa00ff"
+PARAGRAPH = (
+    "rich-gradient turns plain terminal text into smooth color gradients. "
+    "Wide characters such as 漢字 and 🌈 are positioned by cell width, and "
+    "long lines wrap at word boundaries."
+)
+MARKDOWN = """# Release notes
+
+Gradient **markdown** with `inline code` and a [link](https://example.com).
+
+- fast column lookup tables
+- coalesced escape sequences
+
+```python
+print("hello")
+```
+"""
+
+COMMANDS: Dict[str, List[str]] = {
+    "print": ["print", "-c", COLORS, PARAGRAPH],
+    "panel": ["panel", "-c", COLORS, "-t", "Status", "-s", "ok", PARAGRAPH],
+    "rule": ["rule", "-c", COLORS, "-t", "Section"],
+    "markdown": ["markdown", "-c", COLORS, MARKDOWN],
+}
+TERMINALS: List[Tuple[int, Optional[ColorSystem]]] = [
+    (80, ColorSystem.TRUECOLOR),
+    (40, ColorSystem.TRUECOLOR),
+    (80, ColorSystem.EIGHT_BIT),
+    (80, ColorSystem.STANDARD),
+    (80, None),
+]
+_SVG_TEXT = re.compile(r"<text\b")
+_HTML_SPAN = re.compile(r"<span\b")
+_LINK_ID = re.compile(r"(\x1b]8;id=)\d+")
+_RENDER = (
+    "import json, sys\n"
+    "from rich.color import ColorSystem\n"
+    "from rich_gradient_cli import app\n"
+    "from rich_gradient_cli.common import capture_console\n"
+    "width, system, commands = json.loads(sys.argv[1])\n"
+    "outputs = {}\n"
+    "for name, args in commands.items():\n"
+    "    with capture_console(width, system and ColorSystem[system]) as buffer:\n"
+    "        app(args, prog_name='gradient', standalone_mode=False)\n"
+    "    outputs[name] = buffer.getvalue()\n"
+    "sys.stdout.write(json.dumps(outputs))\n"
+)
+
+
+def _case(command: str, width: int, system: Optional[ColorSystem]) -> str:
+    name = system.name.lower() if system is not None else "plain"
+    return f"{command}-{width}-{name}"
+
+
+def _load_sizes() -> Dict[str, Dict[str, float]]:
+    if SIZES.exists():
+        return json.loads(SIZES.read_text(encoding="utf-8"))
+    return {}
+
+
+def _check(case: str, output: str, size: OutputSize) -> None:
+    """Compare ``output`` with its golden file and ``size`` with its budget."""
+    golden = SNAPSHOTS / f"{case}.txt"
+    if UPDATE:
+        SNAPSHOTS.mkdir(exist_ok=True)
+        golden.write_text(output, encoding="utf-8", newline="")
+    elif not golden.exists():
+        pytest.fail(
+            f"{case}: no golden {golden.name}; "
+            "rerun with GRADIENT_UPDATE_SNAPSHOTS=1 to record it"
+        )
+    sizes = _load_sizes()
+    if case not in sizes and UPDATE != "all":
+        pytest.fail(
+            f"{case}: no entry in {SIZES.name}; "
+            "rerun with GRADIENT_UPDATE_SNAPSHOTS=all to record it"
+        )
+    if UPDATE == "all":
+        sizes[case] = {
+            **size._asdict(),
+            "bytes_per_cell": round(size.bytes_per_cell, 3),
+        }
+        SIZES.write_text(
+            json.dumps(sizes, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+    budget = sizes[case]
+    for field in ("bytes", "escapes"):
+        expected = budget[field]
+        allowed = max(expected * SIZE_TOLERANCE, 1)
+        assert abs(getattr(size, field) - expected) <= allowed, (
+            f"{case}: {field} changed from {expected} to {getattr(size, field)} "
+            f"(bytes/cell {budget['bytes_per_cell']} -> {size.bytes_per_cell:.3f}); "
+            "rerun with GRADIENT_UPDATE_SNAPSHOTS=all if this is intended"
+        )
+    assert output == golden.read_text(encoding="utf-8", newline=""), (
+        f"{case}: output differs from {golden.name}; "
+        "rerun with GRADIENT_UPDATE_SNAPSHOTS=1 if this is intended"
+    )
+
+
+@lru_cache(maxsize=None)
+def _render(width: int, system: Optional[ColorSystem]) -> Dict[str, str]:
+    """Render every command for one terminal in a fresh interpreter.
+
+    Rich keeps the escape codes a shared ``Style`` produced on its first
+    render, so each color system gets a process of its own.
+    """
+    request = [width, system.name if system is not None else None, COMMANDS]
+    result = subprocess.run(
+        [sys.executable, "-c", _RENDER, json.dumps(request)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    outputs: Dict[str, str] = json.loads(result.stdout)
+    return outputs
+
+
+@pytest.mark.parametrize("width,system", TERMINALS)
+@pytest.mark.parametrize("command", sorted(COMMANDS))
+def test_output_snapshot(
+    command: str, width: int, system: Optional[ColorSystem]
+) -> None:
+    output = _LINK_ID.sub(r"\g<1>0", _render(width, system)[command])
+    _check(_case(command, width, system), output, measure_ansi(output))
+
+
+@pytest.mark.parametrize("command", sorted(COMMANDS))
+def test_svg_snapshot(
+    command: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("COLUMNS", "80")
+    monkeypatch.setenv("LINES", "25")
+    path = tmp_path / "out.svg"
+    with capture_console(80):
+        app([*COMMANDS[command], "--svg", str(path)], standalone_mode=False)
+    svg = path.read_text(encoding="utf-8")
+    with capture_console(80, None) as buffer:
+        app(COMMANDS[command], prog_name="gradient", standalone_mode=False)
+    cells = measure_ansi(buffer.getvalue()).cells
+    size = OutputSize(len(svg.encode("utf-8")), cells, len(_SVG_TEXT.findall(svg)))
+    _check(f"{command}-svg", svg, size)
+
+
+@pytest.mark.parametrize("command", sorted(COMMANDS))
+def test_svgz_snapshot(
+    command: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("COLUMNS", "80")
+    monkeypatch.setenv("LINES", "25")
+    path = tmp_path / "out.svgz"
+    with capture_console(80):
+        app([*COMMANDS[command], "--svgz", str(path)], standalone_mode=False)
+    compressed = path.read_bytes()
+    svg = gzip.decompress(compressed).decode("utf-8")
+    with capture_console(80, None) as buffer:
+        app(COMMANDS[command], prog_name="gradient", standalone_mode=False)
+    cells = measure_ansi(buffer.getvalue()).cells
+    size = OutputSize(len(compressed), cells, len(_SVG_TEXT.findall(svg)))
+    _check(f"{command}-svgz", svg, size)
+
+
+@pytest.mark.parametrize("command", sorted(COMMANDS))
+def test_html_snapshot(
+    command: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("COLUMNS", "80")
+    path = tmp_path / "out.html"
+    with capture_console(80):
+        app([*COMMANDS[command], "--html", str(path)], standalone_mode=False)
+    html = path.read_text(encoding="utf-8")
+    with capture_console(80, None) as buffer:
+        app(COMMANDS[command], prog_name="gradient", standalone_mode=False)
+    cells = measure_ansi(buffer.getvalue()).cells
+    size = OutputSize(len(html.encode("utf-8")), cells, len(_HTML_SPAN.findall(html)))
+    _check(f"{command}-html", html, size)
@@ -0,0 +1,40 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from rich_gradient_cli import app
+from rich_gradient_cli.startup import help_cache_path, run_fast_path
+
+runner = CliRunner()
+
+
+def test_version_fast_path(capsys: pytest.CaptureFixture[str]) -> None:
+    assert run_fast_path(["--version"]) is True
+    assert capsys.readouterr().out == "gradient version 0.3.10\n"
+    assert run_fast_path(["print", "--version"]) is False
+
+
+def test_cached_help_matches_typer_help(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setenv("GRADIENT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("COLUMNS", "100")
+    expected = runner.invoke(
+        app, ["-h"], prog_name=os.path.basename(sys.argv[0])
+    ).output
+    assert run_fast_path(["-h"]) is True
+    assert capsys.readouterr().out == expected
+    assert help_cache_path().read_text(encoding="utf-8") == expected
+    assert run_fast_path([], stdin_isatty=True) is True
+    assert capsys.readouterr().out == expected
+
+
+def test_piped_stdin_uses_print_defaults() -> None:
+    result = runner.invoke(app, [], input="hello from stdin\n")
+    assert result.exit_code == 0, result.output
+    assert "hello from stdin" in result.output
@@ -0,0 +1,86 @@
+import gzip
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from rich_gradient_cli import app
+from rich_gradient_cli.common import capture_console
+from rich_gradient_cli.svg_export import minify_svg, write_svg
+
+NS = "{http://www.w3.org/2000/svg}"
+_RULE = re.compile(r"\.([\w-]+)\s*\{([^}]*)\}")
+
+Cell = Tuple[float, float, str, str]
+
+
+def _drawing(svg: str) -> Tuple[List[Cell], List[Tuple[float, float, float, str]]]:
+    """Return the visible cells and background spans an SVG draws."""
+    root = ET.fromstring(svg)
+    fills: Dict[str, str] = {
+        name: re.search(r"fill:\s*(#\w+)", body).group(1)  # type: ignore[union-attr]
+        for name, body in _RULE.findall(root.find(f"{NS}style").text or "")
+        if "fill" in body
+    }
+    cells: List[Cell] = []
+    for text in root.iter(f"{NS}text"):
+        if "textLength" not in text.attrib:
+            continue
+        body = text.text or ""
+        x, step = float(text.get("x")), float(text.get("textLength")) / len(body)
+        for index, char in enumerate(body):
+            if not char.isspace():
+                fill = fills[text.get("class")]
+                if len(fill) == 4:
+                    fill = "#" + "".join(channel * 2 for channel in fill[1:])
+                cells.append(
+                    (float(text.get("y")), round(x + index * step, 1), char, fill)
+                )
+    spans = []
+    for rect in root.iter(f"{NS}rect"):
+        if rect.get("shape-rendering") == "crispEdges":
+            x, width = float(rect.get("x")), float(rect.get("width"))
+            spans.extend(
+                (
+                    float(rect.get("y")),
+                    round(x + offset * 12.2, 1),
+                    12.2,
+                    rect.get("fill"),
+                )
+                for offset in range(round(width / 12.2))
+            )
+    return sorted(cells), sorted(spans)
+
+
+def test_minified_svg_draws_the_same_cells(tmp_path: Path) -> None:
+    path = tmp_path / "out.svg"
+    with capture_console(80):
+        app(
+            [
+                "print",
+                "-c",
+                "red,blue",
+                "--bgcolors",
+                "#002200,#000022",
+                "Same  cells,  fewer bytes " * 4,
+                "--svg",
+                str(path),
+            ],
+            standalone_mode=False,
+        )
+    svg = path.read_text(encoding="utf-8")
+    minified = minify_svg(svg)
+    assert len(minified) < len(svg) / 2
+    assert "terminal-" not in minified
+    assert _drawing(minified) == _drawing(svg)
+
+
+def test_write_svg_gzip_is_reproducible(tmp_path: Path) -> None:
+    svg = '<svg xmlns="http://www.w3.org/2000/svg">\n  <!-- note -->\n  <rect x="0.123456" y="1.0"/>\n</svg>'
+    first, second = tmp_path / "a.svgz", tmp_path / "b.svgz"
+    write_svg(svg, first, minify=True, compress=True)
+    write_svg(svg, second, minify=True, compress=True)
+    assert first.read_bytes() == second.read_bytes()
+    assert gzip.decompress(first.read_bytes()).decode() == (
+        '<svg xmlns="http://www.w3.org/2000/svg"><rect x="0.12" y="1"/></svg>'
+    )
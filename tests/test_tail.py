@@ -0,0 +1,96 @@
+import asyncio
+import io
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+from typer.testing import CliRunner
+
+from rich_gradient_cli import app
+from rich_gradient_cli.follow import BatchWriter, follow, make_sources, tail_offset
+
+runner = CliRunner()
+
+
+def test_tail_offset_counts_unterminated_last_line(tmp_path: Path) -> None:
+    path = tmp_path / "log"
+    for content, lines, expected in (
+        (b"a\nb\nc\n", 2, b"b\nc\n"),
+        (b"a\nb\nc", 2, b"b\nc"),
+        (b"a\nb\n", 5, b"a\nb\n"),
+        (b"a\nb\n", 0, b""),
+    ):
+        path.write_bytes(content)
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            assert content[tail_offset(fd, len(content), lines) :] == expected
+        finally:
+            os.close(fd)
+
+
+def test_tail_no_follow_prefixes_each_file(tmp_path: Path) -> None:
+    (tmp_path / "a.log").write_text("a1\na2\na3\n")
+    (tmp_path / "bb.log").write_text("b1\nb2")
+    result = runner.invoke(
+        app,
+        [
+            "tail",
+            "--no-follow",
+            "-n",
+            "2",
+            str(tmp_path / "a.log"),
+            str(tmp_path / "bb.log"),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    a, bb = str(tmp_path / "a.log"), str(tmp_path / "bb.log")
+    assert result.output == f"{a}  │ a2\n{a}  │ a3\n{bb} │ b1\n{bb} │ b2\n"
+    assert runner.invoke(app, ["tail", str(tmp_path / "missing")]).exit_code == 2
+
+
+async def _follow(
+    paths: List[Path], writer: BatchWriter, poll: Optional[float], flush: float
+) -> None:
+    sources = make_sources([str(path) for path in paths], None)
+    for source in sources:
+        source.open(0)
+    task = asyncio.ensure_future(
+        follow(sources, writer, flush_interval=flush, poll=poll)
+    )
+    await asyncio.sleep(0.05)
+    for round_ in range(5):
+        for path in paths:
+            with path.open("a") as handle:
+                handle.write(f"{path.name}-{round_}\n")
+        await asyncio.sleep(0.01)
+    paths[0].rename(paths[0].with_suffix(".1"))
+    paths[0].write_text("rotated\n")
+    await asyncio.sleep(1.3)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    for source in sources:
+        source.close()
+
+
+@pytest.mark.parametrize("poll", [None, 0.02], ids=["inotify", "poll"])
+def test_follow_interleaves_sources_and_batches_flushes(
+    tmp_path: Path, poll: Optional[float]
+) -> None:
+    paths = [tmp_path / f"{name}.log" for name in "xyz"]
+    for path in paths:
+        path.write_text("old\n")
+    sink = io.BytesIO()
+    writer = BatchWriter(sink)
+    asyncio.run(_follow(paths, writer, poll, flush=0.5))
+    received: Dict[str, List[str]] = {}
+    for line in sink.getvalue().decode().splitlines():
+        name, _, text = line.partition(" │ ")
+        received.setdefault(name, []).append(text)
+    for path in paths:
+        expected = [f"{path.name}-{round_}" for round_ in range(5)]
+        if path == paths[0]:
+            expected.append("rotated")
+        assert received[str(path)] == expected
+    assert writer.flushes <= 4
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from rich_gradient_cli import app
+from rich_gradient_cli.template import BannerTemplate, substitute_slots
+
+runner = CliRunner()
+
+
+def test_substitute_slots_reserves_cells() -> None:
+    slots: list = []
+    text = substitute_slots("host {host:8} build {build}", slots)
+    assert slots == [("host", 8), ("build", 7)]
+    assert len(text) == len("host  build ") + 15
+
+
+def test_compiled_template_fills_and_truncates_slots(tmp_path: Path) -> None:
+    path = tmp_path / "banner.json"
+    result = runner.invoke(
+        app,
+        [
+            "template",
+            "compile",
+            "--width",
+            "40",
+            str(path),
+            "panel",
+            "--colors",
+            "red,blue",
+            "Host {host:6}!",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    template = BannerTemplate.load(path)
+    assert template.slot_names == ["host"]
+    plain = template.render({"host": "web01.example.com"}, None)
+    assert "Host web01.!" in plain
+    colored = template.render({"host": "db"}, "truecolor")
+    assert "\x1b[38;2;" in colored
+    assert "".join(segment.text for segment in template.segments({"host": "db"})) == (
+        template.render({"host": "db"}, None)
+    )
+
+
+def test_compile_accepts_width_after_output(tmp_path: Path) -> None:
+    path = tmp_path / "banner.json"
+    for width in (["--width", "30"], ["--width=30"]):
+        result = runner.invoke(
+            app, ["template", "compile", str(path), *width, "rule", "-t", "Hi {who}"]
+        )
+        assert result.exit_code == 0, result.output
+        assert BannerTemplate.load(path).width == 30
+    result = runner.invoke(app, ["template", "compile", str(path), "--nope", "rule"])
+    assert result.exit_code == 2
+    assert "No such option: --nope" in result.output
+
+
+def test_render_rejects_unknown_slots(tmp_path: Path) -> None:
+    path = tmp_path / "banner.json"
+    BannerTemplate(10, [("host", 4)], [""], [[("x", 0)]]).save(path)
+    result = runner.invoke(app, ["template", "render", str(path), "--set", "nope=1"])
+    assert result.exit_code != 0
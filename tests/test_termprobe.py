@@ -0,0 +1,62 @@
+import fcntl
+import os
+import pty
+import struct
+import termios
+from pathlib import Path
+
+import pytest
+
+from rich_gradient_cli import termprobe
+from rich_gradient_cli.common import LazyConsole
+
+
+def _resize(fd: int, columns: int, lines: int) -> None:
+    fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", lines, columns, 0, 0))
+
+
+def test_probe_is_cached_per_terminal_until_resized(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setenv("TERM", "xterm-256color")
+    monkeypatch.delenv("COLORTERM", raising=False)
+    master, slave = pty.openpty()
+    try:
+        _resize(slave, 100, 30)
+        assert termprobe.console_options(slave) == {}
+        termprobe.remember("256", slave)
+        assert termprobe.console_options(slave)["color_system"] == "256"
+
+        monkeypatch.setenv("COLORTERM", "truecolor")
+        assert termprobe.console_options(slave) == {}
+        monkeypatch.delenv("COLORTERM")
+
+        _resize(slave, 120, 30)
+        assert termprobe.console_options(slave) == {}
+        termprobe.remember(None, slave)
+        assert termprobe.console_options(slave)["color_system"] is None
+
+        path = termprobe.probe_path(slave)
+        assert path is not None
+        assert Path(path).parent == tmp_path / "rich-gradient-cli"
+        termprobe.invalidate(slave)
+        assert not Path(path).exists()
+    finally:
+        os.close(master)
+        os.close(slave)
+    read, write = os.pipe()
+    try:
+        assert termprobe.probe_path(write) is None
+    finally:
+        os.close(read)
+        os.close(write)
+
+
+def test_shared_console_is_built_on_first_use() -> None:
+    lazy = LazyConsole()
+    assert "_file" not in vars(lazy)
+    assert lazy.width > 0
+    assert "_file" in vars(lazy)
+    with pytest.raises(AttributeError):
+        lazy.missing_attribute
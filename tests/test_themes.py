@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from rich_gradient_cli import app
+from rich_gradient_cli.common import capture_console
+from rich_gradient_cli.lut import column_lut
+from rich_gradient_cli.themes import ThemeStore, pack_themes, parse_themes
+
+runner = CliRunner()
+
+PROFILE = """
+[themes.ocean]
+colors = ["#00ccff", "#0044ff", "navy"]
+bgcolors = "#001122, #000000"
+
+[themes.sunset]
+colors = ["orange", "deeppink"]
+"""
+
+
+def test_store_round_trips_stops_and_tables() -> None:
+    themes = parse_themes(PROFILE)
+    store = ThemeStore(pack_themes(themes, "key", widths=(20, 80)))
+    assert store.key == "key"
+    assert store.names() == ["ocean", "sunset"]
+    assert store.get("missing") is None
+    ocean = store.get("ocean")
+    assert ocean is not None
+    assert ocean.colors == ((0, 204, 255), (0, 68, 255), (0, 0, 128))
+    assert ocean.bg_colors == ((0, 17, 34), (0, 0, 0))
+    assert ocean.column_lut(80) == column_lut.__wrapped__(ocean.colors, 80)
+    assert ocean.column_lut(80, background=True) == column_lut.__wrapped__(
+        ocean.bg_colors, 80
+    )
+    assert ocean.column_lut(81) is None
+    sunset = store.get("sunset")
+    assert sunset is not None and sunset.bg_colors is None
+    assert sunset.column_lut(20) == column_lut.__wrapped__(sunset.colors, 20)
+
+
+def test_theme_option_matches_explicit_colors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    profile = tmp_path / "themes.toml"
+    profile.write_text(PROFILE)
+    monkeypatch.setenv("GRADIENT_THEMES", str(profile))
+    monkeypatch.setenv("GRADIENT_CACHE_DIR", str(tmp_path / "cache"))
+
+    def render(*args: str) -> str:
+        with capture_console(40) as buffer:
+            app(["panel", *args, "Themed body"], standalone_mode=False)
+        return buffer.getvalue()
+
+    explicit = render("-c", "#00ccff,#0044ff,navy", "--bgcolors", "#001122,#000000")
+    assert render("--theme", "ocean") == explicit
+    assert (tmp_path / "cache" / "themes.bin").exists()
+
+    profile.write_text(PROFILE.replace("navy", "red") + "\n")
+    assert render("--theme", "ocean") == render(
+        "-c", "#00ccff,#0044ff,red", "--bgcolors", "#001122,#000000"
+    )
+    result = runner.invoke(app, ["rule", "--theme", "nope"])
+    assert result.exit_code == 2
+    assert "ocean, sunset" in result.output
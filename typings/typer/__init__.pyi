@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, TextIO, TypeVar
+from typing import Any, BinaryIO, Callable, TextIO, TypeVar
+
+from . import main as main
 
 _T = TypeVar("_T", bound=Callable[..., Any])
 
@@ -14,23 +16,21 @@ class Context:
 
     def get_help(self) -> str: ...
 
-
 class Exit(Exception):
     """Signal an early, successful CLI exit."""
 
     ...
 
-
 class BadParameter(Exception):
     """Raised when a parameter value is invalid."""
 
-    ...
-
-
-class UsageError(Exception):
-    """Raised for invalid command usage."""
-
-    ...
+    def __init__(
+        self,
+        message: str,
+        ctx: Any | None = ...,
+        param: Any | None = ...,
+        param_hint: str | None = ...,
+    ) -> None: ...
 
 class Typer:
     """Application object used to register CLI callbacks and commands."""
@@ -39,10 +39,12 @@ class Typer:
     def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
     def callback(self, *args: Any, **kwargs: Any) -> Callable[[_T], _T]: ...
     def command(self, *args: Any, **kwargs: Any) -> Callable[[_T], _T]: ...
-
+    def add_typer(self, typer_instance: Typer, **kwargs: Any) -> None: ...
 
 def Argument(default: Any = ..., *param_decls: str, **kwargs: Any) -> Any: ...
 def Option(default: Any = ..., *param_decls: str, **kwargs: Any) -> Any: ...
-def get_text_stream(name: str, encoding: str | None = ..., errors: str | None = ...) -> TextIO: ...
-
+def get_text_stream(
+    name: str, encoding: str | None = ..., errors: str | None = ...
+) -> TextIO: ...
+def get_binary_stream(name: str) -> BinaryIO: ...
 def echo(message: Any = ..., **kwargs: Any) -> None: ...
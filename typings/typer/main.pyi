@@ -0,0 +1,9 @@
+"""Typer ``main`` module stub file."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from . import Typer
+
+def get_command(typer_instance: Typer) -> Any: ...